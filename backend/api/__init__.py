@@ -3,7 +3,8 @@ API module for Todo application.
 システムプロンプト準拠：API共通機能の統一管理
 """
 
-from .router import api_router
+# api_router は api.router から直接インポートする（機能ルートが api.streaming 等を使うため、
+# ここで読み込むと features から先に読み込んだ場合に循環インポートになる）
 from .dependencies import get_database_manager
 
-__all__ = ['api_router', 'get_database_manager']
\ No newline at end of file
+__all__ = ['get_database_manager']
\ No newline at end of file
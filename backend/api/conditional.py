@@ -0,0 +1,33 @@
+"""
+条件付きGET
+システムプロンプト準拠：KISS原則、変更のない再取得をクエリ実行前に304で返却
+
+ETag はデータバージョン（core.data_versions）と表現を決めるパラメーターから生成する強いETag。
+ルートはバージョンを読み取ってから本体のクエリを実行するため、ETag が返却内容より新しくなることはない
+（間に書き込みがあった場合は次回のリクエストで再取得されるだけ）。
+"""
+import hashlib
+from typing import Any, Dict
+
+from fastapi import Request, Response
+
+def make_etag(version: str, *variant: Any) -> str:
+    """バージョンとクエリパラメーター（フィルター・ページ・形式）から強いETagを生成"""
+    digest = hashlib.blake2b(repr(variant).encode('utf-8'), digest_size=8).hexdigest()
+    return f'"{version}-{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match が ETag に一致するか（If-None-Match は弱い比較のため W/ は無視）"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in header.split(','))
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """キャッシュの再検証を必須にするレスポンスヘッダー"""
+    return {'ETag': etag, 'Cache-Control': 'no-cache'}
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag))
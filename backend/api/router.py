@@ -5,7 +5,12 @@ APIルート統合管理
 from fastapi import APIRouter
 from datetime import datetime
 
-from features.tasklist import projects_router, tasks_router
+from features.tasklist import projects_router, tasks_router, timeline_router
+from features.diagnostics import diagnostics_router
+from features.workspace import workspace_router
+from features.sync import sync_router
+from features.events import events_router
+from core.database import DatabaseManager
 # from features.error_monitoring.routes import router as error_router
 from core.logger import get_logger, LogCategory
 
@@ -22,16 +27,26 @@ async def health_check():
     システムプロンプト準拠：KISS原則により最小限の実装
     FastAPIが自動的にGET/HEADリクエスト両方をサポート
     """
+    db_manager = DatabaseManager()
     return {
-        "status": "ok", 
+        "status": "ok",
         "timestamp": datetime.now().isoformat(),
         "version": "1.0.0",
-        "service": "todo-app-backend"
+        "service": "todo-app-backend",
+        "database": {
+            "pool": db_manager.get_pool_stats(),
+            "group_commit": db_manager.get_group_commit_stats()
+        }
     }
 
 # 機能別ルーター統合
 api_router.include_router(projects_router)
 api_router.include_router(tasks_router)
+api_router.include_router(timeline_router)
+api_router.include_router(diagnostics_router)
+api_router.include_router(workspace_router)
+api_router.include_router(sync_router)
+api_router.include_router(events_router)
 # api_router.include_router(error_router)  # Temporarily disabled due to syntax error
 
 logger.info("API router initialized with all feature routes", category=LogCategory.API)
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+ストリーミングレスポンス
+システムプロンプト準拠：KISS原則、大きな一覧を件数に依存しないメモリ量で返却
+
+DatabaseManager.stream_batches() のバッチを受け取り、JSON配列またはNDJSONとして
+バッチ単位で逐次書き出す。レスポンス全体やPydanticモデルのリストは生成しない。
+"""
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from fastapi.responses import StreamingResponse
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 対応フォーマット → Content-Type
+STREAM_MEDIA_TYPES = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+}
+
+# クエリパラメーター stream の検証パターン
+STREAM_FORMAT_PATTERN = "^(json|ndjson)$"
+
+Row = Dict[str, Any]
+
+def _dumps(row: Row) -> str:
+    return json.dumps(row, ensure_ascii=False, separators=(',', ':'))
+
+async def streaming_json_response(
+    batches: AsyncIterator[List[Row]],
+    stream_format: str,
+    serialize: Optional[Callable[[Row], Row]] = None
+) -> StreamingResponse:
+    """
+    行バッチの非同期イテレーターをストリーミングレスポンスに変換
+    最初のバッチはレスポンス開始前に取得するため、クエリの失敗は通常のエラーレスポンスになる。
+    送信開始後の失敗はログに記録して接続を終了する（クライアント側では不完全な本文となる）。
+    """
+    serialize = serialize or (lambda row: row)
+    ndjson = stream_format == 'ndjson'
+    first_batch = await anext(batches, None)
+
+    async def body():
+        count = 0
+        batch = first_batch
+        try:
+            if not ndjson:
+                yield '['
+            while batch is not None:
+                chunk = (''.join(_dumps(serialize(row)) + '\n' for row in batch) if ndjson
+                         else ','.join(_dumps(serialize(row)) for row in batch))
+                # JSON配列ではバッチ間の区切りを2バッチ目以降の先頭に付ける
+                yield chunk if ndjson or count == 0 else ',' + chunk
+                count += len(batch)
+                batch = await anext(batches, None)
+            if not ndjson:
+                yield ']'
+        except Exception as e:
+            logger.error(f"Streaming response aborted after {count} rows: {e}")
+            raise
+        finally:
+            await batches.aclose()
+        logger.debug(f"Streamed {count} rows as {stream_format}")
+
+    return StreamingResponse(body(), media_type=STREAM_MEDIA_TYPES[stream_format])
@@ -14,16 +14,18 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from core.config import config
-from core.logger import setup_logging, get_logger
-from core.database import init_database
+from core.logger import setup_logging, setup_slow_query_log, get_logger
+from core.database import init_database, close_database
 from core.middleware import (
     LoggingMiddleware, SecurityMiddleware, 
     RateLimitMiddleware, ErrorMonitoringMiddleware
 )
 from api.router import api_router
+from features.events import close_change_brokers
 
 # システムプロンプト準拠：統一ログ機能
 setup_logging(config.log_level, config.log_file)
+setup_slow_query_log(config.slow_query_log_file)
 logger = get_logger(__name__)
 
 @asynccontextmanager
@@ -48,6 +50,8 @@ async def lifespan(app: FastAPI):
     
     # 終了時の処理
     logger.info("Shutting down Todo Application...")
+    close_change_brokers()
+    close_database()
 
 # FastAPIアプリケーション作成
 app = FastAPI(
@@ -70,6 +74,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # APIルーター統合
@@ -16,8 +16,10 @@ class Config:
         # システムプロンプト準拠：パス管理の一元化
         self.base_dir = BACKEND_PATHS['BASE']
         self.database_path = BACKEND_PATHS['DATABASE']
-        self.schema_path = BACKEND_PATHS['SCHEMA']
+        self.migrations_dir = BACKEND_PATHS['MIGRATIONS']
+        self.initial_data_path = BACKEND_PATHS['INITIAL_DATA']
         self.log_file = BACKEND_PATHS['LOG_FILE']
+        self.slow_query_log_file = BACKEND_PATHS['SLOW_QUERY_LOG_FILE']
         
         # サーバー設定
         self.host = os.getenv("HOST", "localhost")
@@ -26,7 +28,43 @@ class Config:
         
         # ログ設定
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
-        
+
+        # データベース接続プール設定
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", 5))
+        self.db_pool_timeout = float(os.getenv("DB_POOL_TIMEOUT", 10.0))
+        self.db_executor_workers = int(os.getenv("DB_EXECUTOR_WORKERS", self.db_pool_size))
+
+        # グループコミット設定（単一ライターで更新文をまとめてコミット）
+        self.db_group_commit = os.getenv("DB_GROUP_COMMIT", "false").lower() == "true"
+        self.db_group_commit_window_ms = float(os.getenv("DB_GROUP_COMMIT_WINDOW_MS", 2.0))
+        self.db_group_commit_max_batch = int(os.getenv("DB_GROUP_COMMIT_MAX_BATCH", 256))
+
+        # スロークエリ閾値（ミリ秒、超過した文はスロークエリログに出力）
+        self.db_slow_query_ms = float(os.getenv("DB_SLOW_QUERY_MS", 100))
+
+        # ストリーミング取得の1回あたりのフェッチ件数（fetchmany）
+        self.db_stream_batch_size = int(os.getenv("DB_STREAM_BATCH_SIZE", 500))
+
+        # 変更通知（SSE）設定：変更履歴の確認間隔、クライアントごとの未送信イベント上限、同時接続数
+        self.events_poll_interval_ms = float(os.getenv("EVENTS_POLL_INTERVAL_MS", 50))
+        self.events_client_buffer = int(os.getenv("EVENTS_CLIENT_BUFFER", 256))
+        self.events_keepalive_seconds = float(os.getenv("EVENTS_KEEPALIVE_SECONDS", 15))
+        self.events_max_clients = int(os.getenv("EVENTS_MAX_CLIENTS", 100))
+
+        # クエリプラン収集（診断用、EXPLAIN QUERY PLANを文の形ごとに1回実行）
+        self.db_query_profiling = os.getenv("DB_QUERY_PROFILING", "false").lower() == "true"
+
+        # ID採番（未指定時はプロセスIDをワーカーIDとして使用、複数ホスト構成では明示指定）
+        self.id_worker_id = os.getenv("ID_WORKER_ID")
+
+        # SQLite PRAGMAプロファイル
+        self.db_journal_mode = os.getenv("DB_JOURNAL_MODE", "WAL")
+        self.db_synchronous = os.getenv("DB_SYNCHRONOUS", "NORMAL")
+        self.db_cache_size = int(os.getenv("DB_CACHE_SIZE", -20000))
+        self.db_mmap_size = int(os.getenv("DB_MMAP_SIZE", 268435456))
+        self.db_busy_timeout = int(os.getenv("DB_BUSY_TIMEOUT", 5000))
+        self.db_temp_store = os.getenv("DB_TEMP_STORE", "MEMORY")
+
         # CORS設定
         self.cors_origins = [
             "http://localhost:3000",
@@ -41,7 +79,7 @@ class Config:
     
     def validate_paths(self) -> bool:
         """必要なパスの存在確認"""
-        return self.schema_path.exists()
+        return self.migrations_dir.exists()
 
 # グローバル設定インスタンス
 config = Config()
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""
+SQLiteコネクションプール
+システムプロンプト準拠：KISS原則、スレッドセーフな長寿命接続の再利用
+"""
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Deque, Dict, Any, Optional, Type
+
+from .logger import get_logger, LogCategory
+from .exceptions import DatabaseError
+
+logger = get_logger(__name__)
+
+@dataclass
+class PragmaProfile:
+    """接続ごとに適用するPRAGMA設定"""
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -20000        # 負値はKiB単位（約20MB）
+    mmap_size: int = 268435456      # 256MB
+    busy_timeout: int = 5000        # ミリ秒
+    temp_store: str = "MEMORY"
+
+    def statements(self) -> list:
+        """適用順のPRAGMA文リスト"""
+        return [
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA cache_size = {int(self.cache_size)}",
+            f"PRAGMA mmap_size = {int(self.mmap_size)}",
+            f"PRAGMA busy_timeout = {int(self.busy_timeout)}",
+            f"PRAGMA temp_store = {self.temp_store}",
+        ]
+
+@dataclass
+class PoolStatistics:
+    """プール統計情報"""
+    size: int
+    created: int = 0
+    in_use: int = 0
+    idle: int = 0
+    checkouts: int = 0
+    waits: int = 0
+    timeouts: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        stats = asdict(self)
+        stats['avg_wait_ms'] = round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0
+        stats['total_wait_ms'] = round(self.total_wait_ms, 3)
+        stats['max_wait_ms'] = round(self.max_wait_ms, 3)
+        return stats
+
+class ConnectionPool:
+    """
+    上限付きスレッドセーフなSQLite接続プール
+    接続は遅延生成され、返却後も閉じずに再利用される
+    """
+
+    def __init__(self, db_path: Path, size: int = 5, timeout: float = 10.0,
+                 pragmas: Optional[PragmaProfile] = None,
+                 connection_factory: Type[sqlite3.Connection] = sqlite3.Connection):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.pragmas = pragmas or PragmaProfile()
+        self.connection_factory = connection_factory
+        self._idle: Deque[sqlite3.Connection] = deque()
+        self._condition = threading.Condition(threading.Lock())
+        self._stats = PoolStatistics(size=size)
+        self._closed = False
+
+    def create_connection(self) -> sqlite3.Connection:
+        """新規接続の生成とPRAGMA適用（プール管理外の専用接続にも使用）"""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.pragmas.busy_timeout / 1000,
+            check_same_thread=False,
+            factory=self.connection_factory
+        )
+        conn.row_factory = sqlite3.Row
+        for statement in self.pragmas.statements():
+            conn.execute(statement)
+        logger.debug(f"Database connection established: {self.db_path}", category=LogCategory.DATABASE)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """接続のチェックアウト（空きが無い場合は待機）"""
+        started = time.monotonic()
+        waited = False
+        create = False
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise DatabaseError("Connection pool is closed")
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._stats.created < self.size:
+                    self._stats.created += 1
+                    conn = None
+                    create = True
+                    break
+
+                waited = True
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._stats.timeouts += 1
+                    raise DatabaseError(
+                        f"Timed out waiting for a database connection ({self.timeout}s)",
+                        {'pool_size': self.size}
+                    )
+                self._condition.wait(remaining)
+
+            wait_ms = (time.monotonic() - started) * 1000
+            self._stats.checkouts += 1
+            self._stats.in_use += 1
+            self._stats.total_wait_ms += wait_ms
+            self._stats.max_wait_ms = max(self._stats.max_wait_ms, wait_ms)
+            if waited:
+                self._stats.waits += 1
+
+        if create:
+            try:
+                conn = self.create_connection()
+            except sqlite3.Error as e:
+                with self._condition:
+                    self._stats.created -= 1
+                    self._stats.in_use -= 1
+                    self._condition.notify()
+                raise DatabaseError(f"Failed to open database connection: {e}")
+
+        return conn
+
+    def release(self, conn: sqlite3.Connection, discard: bool = False) -> None:
+        """接続の返却（未完了トランザクションはロールバック）"""
+        if not discard:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error as e:
+                logger.warning(f"Discarding broken database connection: {e}", category=LogCategory.DATABASE)
+                discard = True
+
+        with self._condition:
+            self._stats.in_use -= 1
+            if discard or self._closed:
+                self._stats.created -= 1
+                self._close_quietly(conn)
+            else:
+                self._idle.append(conn)
+            self._condition.notify()
+
+    def close(self) -> None:
+        """アイドル接続をすべて閉じる"""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._close_quietly(self._idle.pop())
+                self._stats.created -= 1
+            self._condition.notify_all()
+        logger.info(f"Connection pool closed: {self.db_path}", category=LogCategory.DATABASE)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """プール統計のスナップショット"""
+        with self._condition:
+            self._stats.idle = len(self._idle)
+            return self._stats.to_dict()
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,50 @@
+"""
+データバージョン
+システムプロンプト準拠：KISS原則、条件付きGETのためのバージョン読み取り
+
+data_versions（マイグレーション 0006）はトリガーにより書き込みと同じトランザクション内で加算される。
+値はデータベースに保持されるため、複数のワーカープロセスで共有される。
+読み取りは主キー検索のみで、tasks / projects テーブルには触れない。
+"""
+from typing import Optional
+
+from .database import DatabaseManager
+
+# バージョンの対象範囲
+PROJECTS_SCOPE = 'projects'
+TASKS_SCOPE = 'tasks'
+
+def project_tasks_scope(project_id: str) -> str:
+    """プロジェクト内タスクのバージョン範囲"""
+    return f"project:{project_id}"
+
+def read_version(db_manager: DatabaseManager, scope: str) -> str:
+    """範囲のバージョントークン（'<generation>.<version>'、未更新の範囲は0）"""
+    row = db_manager.execute_query(
+        """SELECT (SELECT version FROM data_versions WHERE scope = 'generation') AS generation,
+                  (SELECT version FROM data_versions WHERE scope = ?) AS version""",
+        (scope,)
+    )[0]
+    return f"{row['generation']}.{row['version'] or 0}"
+
+def read_versions(db_manager: DatabaseManager, *scopes: str) -> str:
+    """複数範囲を合わせたバージョントークン（'<generation>.<version>.<version>...'）"""
+    rows = db_manager.execute_query(
+        f"""SELECT scope, version FROM data_versions
+            WHERE scope IN ('generation', {', '.join('?' for _ in scopes)})""",
+        scopes
+    )
+    versions = {row['scope']: row['version'] for row in rows}
+    return '.'.join(str(versions.get(scope) or 0) for scope in ('generation', *scopes))
+
+def read_entity_version(db_manager: DatabaseManager, entity: str, entity_id: str) -> Optional[str]:
+    """1レコードのバージョントークン（change_log の seq、存在しない場合は None）"""
+    row = db_manager.execute_query(
+        """SELECT (SELECT version FROM data_versions WHERE scope = 'generation') AS generation,
+                  (SELECT seq FROM change_log
+                   WHERE entity = ? AND entity_id = ? AND op = 'upsert') AS version""",
+        (entity, entity_id)
+    )[0]
+    if row['version'] is None:
+        return None
+    return f"{row['generation']}.{row['version']}"
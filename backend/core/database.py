@@ -2,167 +2,500 @@
 データベース管理モジュール
 システムプロンプト準拠：DRY原則、統一例外処理
 """
+import asyncio
+import contextvars
+import functools
 import sqlite3
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Dict, Any, List
-from datetime import datetime
+from typing import Generator, Dict, Any, List, Optional, Callable, TypeVar, Iterable, Iterator, AsyncIterator
 
 from .config import config
-from .logger import get_logger
+from .logger import get_logger, LogCategory, SLOW_QUERY_LOGGER, get_correlation_id
 from .exceptions import DatabaseError
+from .connection_pool import ConnectionPool, PragmaProfile
+from .write_queue import GroupCommitWriter
+from .query_profiler import ProfiledConnection, get_query_profiler
+from .query_metrics import get_query_metrics
 
 logger = get_logger(__name__)
+slow_query_logger = get_logger(SLOW_QUERY_LOGGER)
+
+# データベースファイルごとに共有されるコネクションプール
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+# データベースファイルごとのグループコミットライター（有効時のみ）
+_writers: Dict[str, GroupCommitWriter] = {}
+
+# ブロッキングなDB処理専用の上限付きエグゼキューター
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+T = TypeVar('T')
+
+def _pragma_profile_from_config() -> PragmaProfile:
+    """設定からPRAGMAプロファイルを構築"""
+    return PragmaProfile(
+        journal_mode=config.db_journal_mode,
+        synchronous=config.db_synchronous,
+        cache_size=config.db_cache_size,
+        mmap_size=config.db_mmap_size,
+        busy_timeout=config.db_busy_timeout,
+        temp_store=config.db_temp_store
+    )
+
+def get_connection_pool(db_path: Path) -> ConnectionPool:
+    """データベースパスに対応する共有プールを取得（初回のみ生成）"""
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(
+                Path(db_path),
+                size=config.db_pool_size,
+                timeout=config.db_pool_timeout,
+                pragmas=_pragma_profile_from_config(),
+                connection_factory=ProfiledConnection if config.db_query_profiling else sqlite3.Connection
+            )
+            _pools[key] = pool
+            logger.info(f"Connection pool created: {key} (size={config.db_pool_size})")
+        return pool
+
+def get_group_commit_writer(db_path: Path) -> Optional[GroupCommitWriter]:
+    """グループコミットライターの取得（無効時はNone）"""
+    if not config.db_group_commit:
+        return None
+    key = str(Path(db_path).resolve())
+    pool = get_connection_pool(db_path)
+    with _pools_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = GroupCommitWriter(
+                pool,
+                window_ms=config.db_group_commit_window_ms,
+                max_batch=config.db_group_commit_max_batch
+            )
+            _writers[key] = writer
+            logger.info(f"Group commit writer started: {key} (window={config.db_group_commit_window_ms}ms)")
+        return writer
+
+def close_group_commit_writers() -> None:
+    """全ライターの停止（キュー内の要求は処理してから停止）"""
+    with _pools_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+def close_connection_pools() -> None:
+    """全プールのクローズ（アプリケーション終了時）"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """DB処理用エグゼキューターの取得（初回のみ生成）"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.db_executor_workers,
+                thread_name_prefix="db-worker"
+            )
+            logger.info(f"Database executor created (workers={config.db_executor_workers})")
+        return _executor
+
+def shutdown_db_executor() -> None:
+    """DB処理用エグゼキューターの停止（実行中の処理は完了まで待機）"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+def close_database() -> None:
+    """エグゼキューターとコネクションプールの解放"""
+    shutdown_db_executor()
+    close_group_commit_writers()
+    close_connection_pools()
+
+def async_variant(func: Callable[..., T]) -> Callable[..., Any]:
+    """
+    サービスの同期メソッドからasync版を生成
+    self.db_manager のDB専用エグゼキューター上で実行し、イベントループをブロックしない
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        return await self.db_manager.run_sync(func, self, *args, **kwargs)
+    return wrapper
 
 class DatabaseManager:
     """データベース管理クラス"""
     
     def __init__(self, db_path: Path = None):
         self.db_path = db_path or config.database_path
-        logger.info(f"Database manager initialized: {self.db_path}")
+        self.pool = get_connection_pool(self.db_path)
+        self.writer = get_group_commit_writer(self.db_path)
+        logger.debug(f"Database manager initialized: {self.db_path}")
     
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """データベース接続の取得（コンテキストマネージャー）"""
-        conn = None
+        """データベース接続の取得（プールからのチェックアウト）"""
+        conn = self.pool.acquire()
+        discard = False
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
-            logger.debug("Database connection established")
             yield conn
         except sqlite3.Error as e:
             logger.error(f"Database error: {e}")
-            if conn:
+            try:
                 conn.rollback()
+            except sqlite3.Error:
+                discard = True
             raise DatabaseError(f"Database operation failed: {e}")
         finally:
-            if conn:
-                conn.close()
-                logger.debug("Database connection closed")
+            self.pool.release(conn, discard=discard)
     
-    def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+    @contextmanager
+    def transaction(self) -> Generator[sqlite3.Connection, None, None]:
         """
-        クエリ実行（SELECT用）
-        システムプロンプト準拠：日付フィールドの正規化処理追加
+        書き込みトランザクション（BEGIN IMMEDIATE〜COMMIT）
+        ブロック内の例外はすべてロールバックされる。
+        グループコミット有効時はライターの接続を借りてバッチ内のSAVEPOINTとして実行し、
+        バッチのコミット完了まで待つ（ブロック内で execute_update 等のライター経由の書き込みは呼ばないこと）
         """
+        if self.writer:
+            try:
+                with self.writer.lease() as conn, self._timed(conn) as timed:
+                    yield timed
+            except sqlite3.Error as e:
+                logger.error(f"Database error: {e}")
+                raise DatabaseError(f"Database operation failed: {e}")
+            return
         with self.get_connection() as conn:
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # システムプロンプト準拠：DRY原則で日付正規化を一元化
-            normalized_rows = []
-            for row in rows:
-                row_dict = dict(row)
-                normalized_row = self._normalize_date_fields(row_dict)
-                normalized_rows.append(normalized_row)
-            
-            logger.debug(f"Query executed successfully, returned {len(normalized_rows)} rows")
-            return normalized_rows
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                with self._timed(conn) as timed:
+                    yield timed
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
     
-    def execute_update(self, query: str, params: tuple = ()) -> int:
-        """クエリ実行（INSERT/UPDATE/DELETE用）"""
+    @contextmanager
+    def _timed(self, conn: sqlite3.Connection) -> Generator["TimedConnection", None, None]:
+        """ブロック内の文を計測する接続ラッパー（読み切られなかった結果はブロック終了時に記録）"""
+        timed = TimedConnection(conn, self._record_statement)
+        try:
+            yield timed
+        finally:
+            timed.flush()
+    
+    @contextmanager
+    def temp_id_table(self, conn: sqlite3.Connection, ids: Iterable[str],
+                      name: str = "batch_ids") -> Generator[str, None, None]:
+        """
+        ID集合を接続ローカルの一時テーブルへ流し込む
+        IN句のバインド変数上限に依存せず、任意件数のIDを1文の結合で扱える。
+        戻り値のテーブル名は `WHERE id IN (SELECT id FROM <table>)` 等で使用する。
+        重複IDは除去され、挿入順は rowid に保持される。
+        """
+        table = f"temp.{name}"
+        conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {name} (id TEXT PRIMARY KEY)")
+        conn.execute(f"DELETE FROM {table}")
+        conn.executemany(f"INSERT OR IGNORE INTO {table} (id) VALUES (?)", ((item,) for item in ids))
+        try:
+            yield table
+        finally:
+            conn.execute(f"DELETE FROM {table}")
+    
+    def fetch_rows(self, cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """
+        カーソルの残り行を辞書リストで取得
+        日時はエポック列から生成列でISO 8601文字列として返るため、行ごとの変換は不要
+        """
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def execute_returning(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
+        """
+        RETURNING句付きの単一更新文を実行し、対象行を返す（該当なしはNone）
+        存在確認・更新・再取得を1回のチェックアウトと1クエリで完結させる
+        """
+        started = time.perf_counter()
+        if self.writer:
+            rows = self.writer.run(lambda conn: self.fetch_rows(conn.execute(query, params)))
+        else:
+            with self.get_connection() as conn:
+                rows = self.fetch_rows(conn.execute(query, params))
+                conn.commit()
+        self._record_statement(query, started, len(rows))
+        return rows[0] if rows else None
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """コネクションプール統計の取得"""
+        return self.pool.get_stats()
+    
+    def get_query_stats(self) -> Dict[str, Any]:
+        """文の形ごとのレイテンシ分布（p50/p95/p99）と返却・影響行数"""
+        return {'slow_query_ms': config.db_slow_query_ms, **get_query_metrics().report()}
+    
+    def get_query_plan_report(self) -> Dict[str, Any]:
+        """文の形ごとのクエリプランとインデックス提案（DB_QUERY_PROFILING有効時のみ収集）"""
+        if not config.db_query_profiling:
+            return {'enabled': False, 'statements': [], 'flagged_count': 0, 'suggestions': []}
         with self.get_connection() as conn:
-            cursor = conn.execute(query, params)
-            conn.commit()
-            affected_rows = cursor.rowcount
-            logger.debug(f"Update query executed, affected {affected_rows} rows")
-            return affected_rows
+            return {'enabled': True, **get_query_profiler().report(conn)}
     
-    def _normalize_date_fields(self, row_dict: Dict[str, Any]) -> Dict[str, Any]:
+    def get_group_commit_stats(self) -> Optional[Dict[str, Any]]:
+        """グループコミット統計の取得（無効時はNone）"""
+        return self.writer.get_stats() if self.writer else None
+    
+    async def run_sync(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        同期関数をDB専用エグゼキューターで実行
+        ログコンテキスト等のcontextvarsはワーカースレッドへ引き継がれる
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(get_db_executor(), call)
+    
+    async def fetch_all(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """非同期クエリ実行（SELECT用）"""
+        return await self.run_sync(self.execute_query, query, params)
+    
+    async def fetch_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
+        """非同期クエリ実行（先頭1行のみ）"""
+        rows = await self.fetch_all(query, params)
+        return rows[0] if rows else None
+    
+    async def execute(self, query: str, params: tuple = ()) -> int:
+        """非同期クエリ実行（INSERT/UPDATE/DELETE用）"""
+        return await self.run_sync(self.execute_update, query, params)
+    
+    def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """クエリ実行（SELECT用）"""
+        started = time.perf_counter()
+        with self.get_connection() as conn:
+            rows = self.fetch_rows(conn.execute(query, params))
+        self._record_statement(query, started, len(rows))
+        return rows
+    
+    def iter_batches(self, query: str, params: tuple = (),
+                     batch_size: Optional[int] = None) -> Generator[List[Dict[str, Any]], None, None]:
         """
-        システムプロンプト準拠：DRY原則による日付フィールド正規化
-        SQLiteのTIMESTAMP型をISO 8601形式の文字列に統一
+        クエリ結果を fetchmany のバッチ単位で返すジェネレーター（SELECT用）
+        結果全体をメモリに載せないため、件数に関わらず使用メモリはバッチサイズで頭打ちになる。
+        接続は反復の完了（または close()）までチェックアウトされたままになる。
+        計測時間はフェッチに要した時間のみで、呼び出し元の処理時間は含まない。
         """
+        batch_size = batch_size or config.db_stream_batch_size
+        elapsed = 0.0
+        total_rows = 0
         try:
-            # 日付フィールドのマッピング
-            date_fields = [
-                'start_date', 'due_date', 'completion_date',
-                'created_at', 'updated_at'
-            ]
-            
-            for field in date_fields:
-                if field in row_dict and row_dict[field] is not None:
-                    date_value = row_dict[field]
-                    
-                    # 既にISO形式の場合はそのまま
-                    if isinstance(date_value, str) and self._is_iso_format(date_value):
-                        continue
-                    
-                    # datetime型の場合はISO形式に変換
-                    if isinstance(date_value, datetime):
-                        row_dict[field] = date_value.isoformat()
-                        logger.debug(f"Converted datetime field {field} to ISO format")
-                    
-                    # 文字列だが非ISO形式の場合は変換を試行
-                    elif isinstance(date_value, str):
-                        try:
-                            parsed_date = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-                            row_dict[field] = parsed_date.isoformat()
-                            logger.debug(f"Normalized date field {field} to ISO format")
-                        except ValueError:
-                            logger.warn(f"Could not parse date field {field}: {date_value}")
-                            # 無効な日付は現在時刻で置換
-                            row_dict[field] = datetime.now().isoformat()
-            
-            return row_dict
-            
-        except Exception as e:
-            logger.error(f"Date normalization failed: {e}")
-            # フォールバック：元のデータを返す
-            return row_dict
-    
-    def _is_iso_format(self, date_string: str) -> bool:
-        """ISO 8601形式かどうかを判定"""
+            with self.get_connection() as conn:
+                started = time.perf_counter()
+                cursor = conn.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    elapsed += time.perf_counter() - started
+                    if not rows:
+                        break
+                    total_rows += len(rows)
+                    yield [dict(row) for row in rows]
+                    started = time.perf_counter()
+        finally:
+            self._record_statement(query, time.perf_counter() - elapsed, total_rows)
+    
+    def iter_query(self, query: str, params: tuple = (),
+                   batch_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """クエリ結果を1行ずつ返すジェネレーター（内部では fetchmany でバッチ取得）"""
+        for batch in self.iter_batches(query, params, batch_size):
+            yield from batch
+    
+    async def stream_batches(self, query: str, params: tuple = (),
+                             batch_size: Optional[int] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """iter_batches の非同期版（ストリーミングレスポンス用）"""
+        async for batch in self.iterate_async(self.iter_batches(query, params, batch_size)):
+            yield batch
+    
+    async def iterate_async(self, generator: Generator[T, None, None]) -> AsyncIterator[T]:
+        """
+        接続を保持する同期ジェネレーターを非同期に反復
+        各要素の取得はDB専用エグゼキューターで実行し、要素間ではイベントループを解放する
+        """
+        try:
+            while True:
+                item = await self.run_sync(next, generator, None)
+                if item is None:
+                    break
+                yield item
+        finally:
+            # 途中切断時も接続をプールへ返却する
+            await self.run_sync(generator.close)
+    
+    def execute_update(self, query: str, params: tuple = ()) -> int:
+        """
+        クエリ実行（INSERT/UPDATE/DELETE用）
+        グループコミット有効時は単一ライターのバッチに合流し、コミット完了を待つ
+        """
+        started = time.perf_counter()
+        if self.writer:
+            affected_rows = self.writer.execute(query, params)
+        else:
+            with self.get_connection() as conn:
+                cursor = conn.execute(query, params)
+                conn.commit()
+                affected_rows = cursor.rowcount
+        self._record_statement(query, started, affected_rows)
+        return affected_rows
+    
+    def _record_statement(self, query: str, started: float, rows: int) -> None:
+        """
+        文の所要時間（モノトニック時計）をヒストグラムに集計し、閾値超過はスロークエリログへ出力
+        時間には接続待ち・フェッチ・コミット（グループコミット時はバッチ待ち）を含む
+        """
+        duration_ms = (time.perf_counter() - started) * 1000
+        slow = duration_ms >= config.db_slow_query_ms
+        shape = get_query_metrics().observe(query, duration_ms, rows, slow)
+        logger.db_query(shape, duration_ms=duration_ms, rows_affected=rows)
+        if slow:
+            slow_query_logger.warning(
+                f"Slow query ({duration_ms:.1f}ms, {rows} rows): {shape}",
+                category=LogCategory.DATABASE,
+                duration_ms=round(duration_ms, 3),
+                rows=rows,
+                statement=shape,
+                threshold_ms=config.db_slow_query_ms,
+                correlation_id=get_correlation_id()
+            )
+
+class TimedCursor:
+    """
+    行を返す文（SELECT・RETURNING付きの更新）のカーソルラッパー
+    RETURNING 付きの文は行を読み切るまで rowcount が確定しないため、実行とフェッチの所要時間、
+    返却行数を結果を読み切った時点（読み切られない場合は破棄時または flush 時）で記録する
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, sql: str, elapsed: float,
+                 record: Callable[[str, float, int], None]):
+        self._cursor = cursor
+        self._sql = sql
+        self._elapsed = elapsed
+        self._record = record
+        self._rows = 0
+        self._recorded = False
+
+    def fetchone(self) -> Any:
+        row = self._timed_fetch(self._cursor.fetchone)
+        if row is None:
+            self.flush()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        size = self._cursor.arraysize if size is None else size
+        rows = self._timed_fetch(lambda: self._cursor.fetchmany(size))
+        self._rows += len(rows)
+        if len(rows) < size:
+            self.flush()
+        return rows
+
+    def fetchall(self) -> List[Any]:
+        rows = self._timed_fetch(self._cursor.fetchall)
+        self._rows += len(rows)
+        self.flush()
+        return rows
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.fetchone, None)
+
+    def flush(self) -> None:
+        if not self._recorded:
+            self._recorded = True
+            self._record(self._sql, time.perf_counter() - self._elapsed, max(self._rows, self._cursor.rowcount))
+
+    def __del__(self) -> None:
+        self.flush()
+
+    def _timed_fetch(self, fetch: Callable[[], T]) -> T:
+        started = time.perf_counter()
         try:
-            datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-            return True
-        except ValueError:
-            return False
+            return fetch()
+        finally:
+            self._elapsed += time.perf_counter() - started
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+class TimedConnection:
+    """
+    トランザクション内の文を計測する接続ラッパー
+    execute / executemany の所要時間と影響行数を DatabaseManager._record_statement へ渡し、
+    それ以外の属性は元の接続へ委譲する（COMMIT は含まない）
+    行を返す文は TimedCursor で包み、フェッチ時間と返却行数を含めて記録する
+    """
+
+    def __init__(self, conn: sqlite3.Connection, record: Callable[[str, float, int], None]):
+        self._conn = conn
+        self._record = record
+        self._open_cursors: "weakref.WeakSet[TimedCursor]" = weakref.WeakSet()
 
-def init_database() -> None:
-    """データベース初期化"""
+    def execute(self, sql: str, parameters: Any = ()) -> Any:
+        started = time.perf_counter()
+        cursor = self._conn.execute(sql, parameters)
+        if cursor.description is None:
+            self._record(sql, started, max(cursor.rowcount, 0))
+            return cursor
+        timed = TimedCursor(cursor, sql, time.perf_counter() - started, self._record)
+        self._open_cursors.add(timed)
+        return timed
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> sqlite3.Cursor:
+        started = time.perf_counter()
+        cursor = self._conn.executemany(sql, seq_of_parameters)
+        self._record(sql, started, max(cursor.rowcount, 0))
+        return cursor
+
+    def flush(self) -> None:
+        """読み切られなかった結果の記録"""
+        for cursor in list(self._open_cursors):
+            cursor.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+def init_database() -> Dict[str, Any]:
+    """
+    データベース初期化（未適用のマイグレーションのみ適用）
+    最新版のデータベースでは PRAGMA user_version の読み取りのみで完了する
+    """
+    # core.migrations は単体でも実行されるため、モジュール読み込み時ではなくここで参照する
+    from .migrations import MigrationRunner
+    
     try:
-        if not config.schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {config.schema_path}")
-        
-        schema = config.schema_path.read_text(encoding='utf-8')
+        if not config.migrations_dir.exists():
+            raise FileNotFoundError(f"Migrations directory not found: {config.migrations_dir}")
         
         db_manager = DatabaseManager()
         with db_manager.get_connection() as conn:
-            conn.executescript(schema)
-            conn.commit()
-        
-        logger.info("Database initialized successfully")
+            report = MigrationRunner(conn, config.migrations_dir, config.initial_data_path).run()
         
-        # システムプロンプト準拠：初期化後のデータ検証
-        _validate_initial_data(db_manager)
+        if report.applied:
+            logger.info(
+                f"Database migrated from version {report.from_version} to {report.to_version} "
+                f"in {report.total_ms:.1f}ms"
+            )
+        else:
+            logger.info(f"Database schema is up to date (version {report.to_version})")
+        return report.to_dict()
         
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
         raise DatabaseError(f"Failed to initialize database: {e}")
-
-def _validate_initial_data(db_manager: DatabaseManager) -> None:
-    """
-    システムプロンプト準拠：初期データの日付フィールド検証
-    """
-    try:
-        # プロジェクトデータの検証
-        projects = db_manager.execute_query("SELECT * FROM projects LIMIT 5")
-        logger.info(f"Initial projects validation: {len(projects)} projects found")
-        
-        # タスクデータの検証
-        tasks = db_manager.execute_query("SELECT * FROM tasks LIMIT 5")
-        logger.info(f"Initial tasks validation: {len(tasks)} tasks found")
-        
-        # 日付フィールドの検証
-        for task in tasks:
-            if 'start_date' in task and task['start_date']:
-                logger.debug(f"Task {task.get('id', 'unknown')} start_date: {task['start_date']}")
-            if 'due_date' in task and task['due_date']:
-                logger.debug(f"Task {task.get('id', 'unknown')} due_date: {task['due_date']}")
-        
-        logger.info("Initial data validation completed successfully")
-        
-    except Exception as e:
-        logger.warn(f"Initial data validation failed: {e}")
-        # 検証失敗は致命的ではないため、警告レベルでログ出力
\ No newline at end of file
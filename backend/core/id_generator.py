@@ -0,0 +1,86 @@
+"""
+ID採番モジュール
+システムプロンプト準拠：KISS原則、全挿入経路でのID生成の一元化
+
+ID形式: <prefix><ミリ秒時刻 11桁><ワーカーID 6桁><シーケンス 4桁>（すべて16進数・固定長）
+- 固定長のため文字列比較で生成順にソートできる
+- ワーカーIDはプロセスID由来（ID_WORKER_ID で上書き可能）のため、
+  同一ホスト上の複数uvicornワーカー間でも衝突しない
+- 同一ミリ秒内はシーケンスで区別し、使い切った場合は論理時刻を1ms進める
+- 時計が巻き戻っても直前の論理時刻を維持し、単調増加を保つ
+"""
+import os
+import threading
+import time
+from typing import List, Optional
+
+from .config import config
+
+WORKER_ID_BITS = 24
+SEQUENCE_BITS = 16
+MAX_WORKER_ID = (1 << WORKER_ID_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+class IdGenerator:
+    """時刻＋ワーカーID＋シーケンスによる単調増加ID生成器（スレッドセーフ）"""
+
+    def __init__(self, worker_id: Optional[int] = None):
+        self._fixed_worker_id = worker_id
+        self._reset()
+
+    def _reset(self) -> None:
+        """状態の初期化（fork後の子プロセスでも呼ばれる）"""
+        self._lock = threading.Lock()
+        worker_id = self._fixed_worker_id
+        if worker_id is None:
+            worker_id = int(config.id_worker_id) if config.id_worker_id else os.getpid()
+        self.worker_id = worker_id & MAX_WORKER_ID
+        self._worker_hex = f"{self.worker_id:06x}"
+        self._last_ms = 0
+        self._sequence = 0
+
+    def _reserve(self, count: int) -> List[tuple]:
+        """count個分の (ミリ秒, シーケンス開始, 個数) 区間を確保"""
+        spans = []
+        with self._lock:
+            now_ms = max(int(time.time() * 1000), self._last_ms)
+            if now_ms != self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            while count > 0:
+                available = MAX_SEQUENCE + 1 - self._sequence
+                if available <= 0:
+                    self._last_ms += 1
+                    self._sequence = 0
+                    continue
+                taken = min(available, count)
+                spans.append((self._last_ms, self._sequence, taken))
+                self._sequence += taken
+                count -= taken
+        return spans
+
+    def generate(self, prefix: str = "") -> str:
+        """IDを1件生成"""
+        ms, sequence, _ = self._reserve(1)[0]
+        return f"{prefix}{ms:011x}{self._worker_hex}{sequence:04x}"
+
+    def generate_batch(self, prefix: str, count: int) -> List[str]:
+        """IDをcount件まとめて生成（ロック取得は1回）"""
+        ids = []
+        for ms, start, taken in self._reserve(count):
+            head = f"{prefix}{ms:011x}{self._worker_hex}"
+            ids.extend(f"{head}{sequence:04x}" for sequence in range(start, start + taken))
+        return ids
+
+# プロセス共有の生成器（fork後は子プロセスのPIDでワーカーIDを振り直す）
+_generator = IdGenerator()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_generator._reset)
+
+def new_id(prefix: str) -> str:
+    """IDを1件採番"""
+    return _generator.generate(prefix)
+
+def new_ids(prefix: str, count: int) -> List[str]:
+    """IDを複数件採番（一括挿入用）"""
+    return _generator.generate_batch(prefix, count)
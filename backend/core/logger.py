@@ -15,8 +15,15 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
 from contextlib import contextmanager
+from contextvars import ContextVar
 import traceback
 
+# リクエスト単位の相関ID（LoggingMiddlewareが設定し、DBワーカースレッドへもcontextvarsとして引き継がれる）
+correlation_id_var: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
+
+# スロークエリ専用ロガー名
+SLOW_QUERY_LOGGER = "slow_query"
+
 class LogLevel(Enum):
     CRITICAL = 50
     ERROR = 40
@@ -129,6 +136,8 @@ class EnterpriseLogger:
         if self.logger.isEnabledFor(level):
             context = self._get_context().copy()
             context.update(kwargs)
+            if not context.get('correlation_id') and correlation_id_var.get():
+                context['correlation_id'] = correlation_id_var.get()
             
             extra = {
                 'category': category.value,
@@ -309,6 +318,33 @@ class LogManager:
             root_logger.addHandler(metrics_handler)
             self.handlers.append(metrics_handler)
     
+    def setup_slow_query_log(
+        self,
+        log_file: Path,
+        max_file_size: int = 10 * 1024 * 1024,  # 10MB
+        backup_count: int = 5
+    ) -> None:
+        """
+        スロークエリ専用ログ設定（通常のログには伝播させない）
+        """
+        slow_logger = logging.getLogger(SLOW_QUERY_LOGGER)
+        slow_logger.setLevel(logging.INFO)
+        slow_logger.propagate = False
+        for handler in list(slow_logger.handlers):
+            slow_logger.removeHandler(handler)
+            handler.close()
+        
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=max_file_size,
+            backupCount=backup_count,
+            encoding='utf-8'
+        )
+        file_handler.setFormatter(StructuredFormatter())
+        slow_logger.addHandler(file_handler)
+        self.handlers.append(file_handler)
+    
     def get_logger(self, name: str) -> EnterpriseLogger:
         """
         エンタープライズロガー取得
@@ -353,5 +389,11 @@ log_manager = LogManager()
 def setup_logging(level: str = "INFO", log_file: Optional[Path] = None) -> None:
     log_manager.setup_logging(level, log_file)
 
+def setup_slow_query_log(log_file: Path) -> None:
+    log_manager.setup_slow_query_log(log_file)
+
 def get_logger(name: str) -> EnterpriseLogger:
-    return log_manager.get_logger(name)
\ No newline at end of file
+    return log_manager.get_logger(name)
+
+def get_correlation_id() -> Optional[str]:
+    return correlation_id_var.get()
\ No newline at end of file
@@ -9,7 +9,7 @@ from fastapi import Request, Response, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
-from .logger import get_logger, LogCategory
+from .logger import get_logger, LogCategory, correlation_id_var
 from .exceptions import TodoAppError, handle_exception
 
 logger = get_logger(__name__)
@@ -29,6 +29,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         
         # 相関IDの生成または取得
         correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+        # 非同期タスク・DBワーカースレッドにも引き継がれる相関ID
+        correlation_token = correlation_id_var.set(correlation_id)
         
         # ログコンテキスト設定
         logger.set_context(
@@ -120,6 +122,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         finally:
             # ログコンテキストクリア
             logger.clear_context()
+            correlation_id_var.reset(correlation_token)
 
 class SecurityMiddleware(BaseHTTPMiddleware):
     """
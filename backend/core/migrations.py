@@ -0,0 +1,167 @@
+"""
+スキーママイグレーション管理
+システムプロンプト準拠：KISS原則、起動時のスキーマ処理を未適用分のみに限定
+
+data/migrations/NNNN_<name>.sql を番号順に適用し、適用済みの番号を PRAGMA user_version に保持する。
+最新版のデータベースでは user_version の読み取り1回で終了するため、再起動時のスキーマ処理はない。
+各マイグレーションは1トランザクションで適用され、所要時間は schema_migrations に記録される。
+初期データ（data/seeds/initial_data.sql）は新規作成されたデータベースにのみ投入する。
+
+手動実行（適用状況の表示）:
+    cd backend && python -m core.migrations
+"""
+import re
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .exceptions import DatabaseError
+from .logger import get_logger, LogCategory
+
+logger = get_logger(__name__)
+
+_MIGRATION_FILE = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+@dataclass
+class Migration:
+    """番号付きマイグレーションファイル"""
+    version: int
+    name: str
+    path: Path
+
+@dataclass
+class MigrationReport:
+    """1回のマイグレーション実行結果"""
+    from_version: int
+    to_version: int
+    applied: List[Dict[str, Any]] = field(default_factory=list)
+    seeded: bool = False
+    seed_ms: float = 0.0
+    total_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def discover_migrations(migrations_dir: Path) -> List[Migration]:
+    """マイグレーションファイルを番号順に列挙（番号の重複はエラー）"""
+    migrations: Dict[int, Migration] = {}
+    for path in sorted(migrations_dir.glob("*.sql")):
+        match = _MIGRATION_FILE.match(path.name)
+        if not match:
+            logger.warning(f"Ignoring migration file with unexpected name: {path.name}")
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise DatabaseError(f"Duplicate migration version {version}: {path.name}")
+        migrations[version] = Migration(version, match.group(2), path)
+    return [migrations[version] for version in sorted(migrations)]
+
+class MigrationRunner:
+    """PRAGMA user_version を基準に未適用のマイグレーションのみ適用"""
+
+    def __init__(self, conn: sqlite3.Connection, migrations_dir: Path,
+                 initial_data_path: Optional[Path] = None):
+        self.conn = conn
+        self.migrations = discover_migrations(migrations_dir)
+        self.initial_data_path = initial_data_path
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    def current_version(self) -> int:
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def pending(self) -> List[Migration]:
+        current = self.current_version()
+        return [migration for migration in self.migrations if migration.version > current]
+
+    def run(self) -> MigrationReport:
+        """未適用分を適用（新規データベースの場合は続けて初期データを投入）"""
+        started = time.perf_counter()
+        current = self.current_version()
+        report = MigrationReport(from_version=current, to_version=current)
+        if current >= self.latest_version:
+            return report
+
+        # マイグレーション導入前の既存DB（user_version=0でもテーブルは存在）は初期データ対象外
+        fresh = current == 0 and self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects'"
+        ).fetchone() is None
+
+        for migration in self.pending():
+            report.applied.append(self._apply(migration))
+            report.to_version = migration.version
+
+        if fresh and self.initial_data_path and self.initial_data_path.exists():
+            seed_started = time.perf_counter()
+            self._run_script(self.initial_data_path.read_text(encoding='utf-8'))
+            self.conn.commit()
+            report.seeded = True
+            report.seed_ms = round((time.perf_counter() - seed_started) * 1000, 3)
+            logger.info(f"Initial data loaded in {report.seed_ms:.1f}ms", category=LogCategory.DATABASE)
+
+        report.total_ms = round((time.perf_counter() - started) * 1000, 3)
+        return report
+
+    def _apply(self, migration: Migration) -> Dict[str, Any]:
+        """1マイグレーションを1トランザクションで適用し、所要時間を記録"""
+        started = time.perf_counter()
+        try:
+            self._run_script(migration.path.read_text(encoding='utf-8'))
+            duration_ms = round((time.perf_counter() - started) * 1000, 3)
+            self.conn.execute(
+                """CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    applied_at TEXT NOT NULL,
+                    duration_ms REAL NOT NULL
+                )"""
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO schema_migrations (version, name, applied_at, duration_ms) VALUES (?, ?, ?, ?)",
+                (migration.version, migration.name, datetime.now().isoformat(), duration_ms)
+            )
+            # user_version はファイルヘッダーに保持され、トランザクションと一緒にコミットされる
+            self.conn.execute(f"PRAGMA user_version = {migration.version}")
+            self.conn.commit()
+        except sqlite3.Error as e:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            raise DatabaseError(f"Migration {migration.version}_{migration.name} failed: {e}")
+
+        logger.info(
+            f"Applied migration {migration.version:04d}_{migration.name} in {duration_ms:.1f}ms",
+            category=LogCategory.DATABASE,
+            duration_ms=duration_ms
+        )
+        return {'version': migration.version, 'name': migration.name, 'duration_ms': duration_ms}
+
+    def _run_script(self, script: str) -> None:
+        """スクリプトをトランザクション内で実行（COMMITは呼び出し元）"""
+        # executescript は実行前に暗黙のCOMMITを行うため、BEGINをスクリプト先頭に含める
+        self.conn.executescript("BEGIN IMMEDIATE;\n" + script)
+
+def main() -> int:
+    """適用状況の表示と未適用分の適用"""
+    from .config import config
+    from .database import DatabaseManager
+
+    with DatabaseManager().get_connection() as conn:
+        runner = MigrationRunner(conn, config.migrations_dir, config.initial_data_path)
+        report = runner.run()
+        print(f"Schema version: {report.from_version} -> {report.to_version} (latest {runner.latest_version})")
+        for step in report.applied:
+            print(f"  applied {step['version']:04d}_{step['name']} in {step['duration_ms']:.1f}ms")
+        if report.seeded:
+            print(f"  loaded initial data in {report.seed_ms:.1f}ms")
+        for row in conn.execute("SELECT version, name, applied_at, duration_ms FROM schema_migrations ORDER BY version"):
+            print(f"  {row['version']:04d}_{row['name']}  {row['applied_at']}  {row['duration_ms']:.1f}ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+クエリレイテンシ統計
+システムプロンプト準拠：KISS原則、固定バケットのヒストグラムによる軽量な集計
+
+DatabaseManager を経由するすべての文を文の形ごとに集計する。
+レイテンシは対数スケールの固定バケットに数え、p50/p95/p99 はバケット上限から推定する。
+"""
+import bisect
+import threading
+from typing import Any, Dict, List
+
+from .query_profiler import statement_shape
+
+# バケット上限（ミリ秒）。最後のバケットは上限なし
+LATENCY_BUCKETS_MS = [
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+]
+
+class LatencyHistogram:
+    """1つの文の形のレイテンシ・件数ヒストグラム"""
+
+    __slots__ = ('shape', 'buckets', 'calls', 'rows', 'total_ms', 'max_ms', 'slow_calls')
+
+    def __init__(self, shape: str):
+        self.shape = shape
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.calls = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow_calls = 0
+
+    def observe(self, duration_ms: float, rows: int, slow: bool) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.calls += 1
+        self.rows += max(rows, 0)
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        if slow:
+            self.slow_calls += 1
+
+    def percentile(self, fraction: float) -> float:
+        """バケット上限による分位点の推定（最終バケットは観測最大値）"""
+        if not self.calls:
+            return 0.0
+        threshold = fraction * self.calls
+        cumulative = 0
+        for index, count in enumerate(self.buckets):
+            cumulative += count
+            if cumulative >= threshold:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return min(LATENCY_BUCKETS_MS[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'shape': self.shape,
+            'calls': self.calls,
+            'slow_calls': self.slow_calls,
+            'rows': self.rows,
+            'avg_rows': round(self.rows / self.calls, 2) if self.calls else 0.0,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            'p50_ms': round(self.percentile(0.50), 3),
+            'p95_ms': round(self.percentile(0.95), 3),
+            'p99_ms': round(self.percentile(0.99), 3),
+            'max_ms': round(self.max_ms, 3),
+            'buckets': {
+                (f"le_{bound}" if index < len(LATENCY_BUCKETS_MS) else "inf"): count
+                for index, (bound, count) in enumerate(zip(LATENCY_BUCKETS_MS + [None], self.buckets))
+                if count
+            }
+        }
+
+class QueryMetrics:
+    """文の形ごとのヒストグラムのレジストリ（スレッドセーフ）"""
+
+    def __init__(self, max_shapes: int = 1000):
+        self.max_shapes = max_shapes
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    def observe(self, query: str, duration_ms: float, rows: int, slow: bool = False) -> str:
+        """1文の実行結果を集計し、文の形を返す"""
+        shape = statement_shape(query)
+        with self._lock:
+            histogram = self._histograms.get(shape)
+            if histogram is None:
+                if len(self._histograms) >= self.max_shapes:
+                    self._dropped += 1
+                    return shape
+                histogram = self._histograms[shape] = LatencyHistogram(shape)
+            histogram.observe(duration_ms, rows, slow)
+        return shape
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._dropped = 0
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            statements: List[Dict[str, Any]] = [histogram.to_dict() for histogram in self._histograms.values()]
+            dropped = self._dropped
+        statements.sort(key=lambda s: s['total_ms'], reverse=True)
+        return {
+            'bucket_bounds_ms': LATENCY_BUCKETS_MS,
+            'statements': statements,
+            'dropped_observations': dropped
+        }
+
+# プロセス共有の統計
+_metrics = QueryMetrics()
+
+def get_query_metrics() -> QueryMetrics:
+    return _metrics
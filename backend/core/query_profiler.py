@@ -0,0 +1,329 @@
+"""
+クエリプラン収集・インデックス提案
+システムプロンプト準拠：KISS原則、オプトインの診断機能
+
+DB_QUERY_PROFILING=true の場合、プールの接続は ProfiledConnection で生成される。
+文の形（リテラル・空白を正規化したSQL）ごとに初回のみ EXPLAIN QUERY PLAN を実行し、
+全表走査（SCAN）・一時B-Tree（USE TEMP B-TREE）の有無と呼び出し回数・累積時間を記録する。
+レポートでは走査・ソートの原因となっている文から複合／カバリングインデックスを提案する。
+
+計測時間は execute() 呼び出し（最初の行が得られるまで、ソートを含む）の所要時間。
+"""
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .logger import get_logger, LogCategory
+
+logger = get_logger(__name__)
+
+# プラン取得対象の文（BEGIN・PRAGMA・DDL等は対象外）
+_PLANNED_STATEMENT = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|REPLACE|WITH)\b", re.IGNORECASE)
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)+\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+_TEMP_BTREE = re.compile(r"USE TEMP B-TREE FOR (.+)$")
+_TABLE_REF = re.compile(r"\b(?:FROM|JOIN|UPDATE|INTO)\s+(?:main\.)?(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+# UPSERT の更新句（DO UPDATE SET の UPDATE はテーブル参照ではない）
+_UPSERT_UPDATE = re.compile(r"\bDO\s+UPDATE\b", re.IGNORECASE)
+_PREDICATE = re.compile(
+    r"(?:(\w+)\.)?(\w+)\s*(=|<=|>=|<|>|\bIN\b|\bBETWEEN\b)(?!=)", re.IGNORECASE
+)
+_ORDER_BY = re.compile(r"\bORDER\s+BY\s+(.+?)(?:\bLIMIT\b|\bOFFSET\b|\)|$)", re.IGNORECASE | re.DOTALL)
+_SELECT_LIST = re.compile(r"^\s*SELECT\s+(?:DISTINCT\s+)?(.+?)\s+FROM\s", re.IGNORECASE | re.DOTALL)
+_SQL_KEYWORDS = {
+    'as', 'on', 'where', 'join', 'left', 'inner', 'cross', 'order', 'group', 'limit',
+    'set', 'values', 'select', 'using', 'natural', 'outer', 'returning', 'union'
+}
+
+def statement_shape(sql: str) -> str:
+    """リテラル・IN句の要素数・空白を正規化した文の形"""
+    shape = _COMMENT.sub(" ", sql)
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("IN (?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+@dataclass
+class StatementProfile:
+    """文の形ごとのプランと実行統計"""
+    shape: str
+    plan: List[str] = field(default_factory=list)
+    plan_error: Optional[str] = None
+    full_scans: List[str] = field(default_factory=list)
+    temp_btrees: List[str] = field(default_factory=list)
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def flagged(self) -> bool:
+        return bool(self.full_scans or self.temp_btrees)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'shape': self.shape,
+            'calls': self.calls,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'plan': self.plan,
+            'plan_error': self.plan_error,
+            'full_scans': self.full_scans,
+            'temp_btrees': self.temp_btrees,
+            'flagged': self.flagged
+        }
+
+class QueryProfiler:
+    """文の形ごとのプラン・統計のレジストリ（スレッドセーフ）"""
+
+    def __init__(self, max_shapes: int = 1000):
+        self.max_shapes = max_shapes
+        self._profiles: Dict[str, StatementProfile] = {}
+        self._lock = threading.Lock()
+
+    def record(self, conn: sqlite3.Connection, sql: str, params: Any, elapsed_ms: float) -> None:
+        """実行済みの文を記録（新しい形の場合のみプランを取得）"""
+        if not _PLANNED_STATEMENT.match(sql):
+            return
+        shape = statement_shape(sql)
+        with self._lock:
+            profile = self._profiles.get(shape)
+        if profile is None:
+            if len(self._profiles) >= self.max_shapes:
+                return
+            profile = self._explain(conn, shape, sql, params)
+            with self._lock:
+                profile = self._profiles.setdefault(shape, profile)
+        with self._lock:
+            profile.calls += 1
+            profile.total_ms += elapsed_ms
+            profile.max_ms = max(profile.max_ms, elapsed_ms)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+    def profiles(self) -> List[StatementProfile]:
+        with self._lock:
+            return sorted(self._profiles.values(), key=lambda p: p.total_ms, reverse=True)
+
+    def report(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """文ごとのプランと、走査・ソートを解消するインデックス提案"""
+        profiles = self.profiles()
+        advisor = IndexAdvisor(conn)
+        suggestions: Dict[str, Dict[str, Any]] = {}
+        for profile in profiles:
+            if not profile.flagged:
+                continue
+            try:
+                profile_suggestions = advisor.suggest(profile)
+            except sqlite3.Error as e:
+                logger.debug(f"Index advice failed for {profile.shape}: {e}", category=LogCategory.DATABASE)
+                continue
+            for suggestion in profile_suggestions:
+                entry = suggestions.setdefault(suggestion['sql'], {**suggestion, 'shapes': [], 'calls': 0, 'total_ms': 0.0})
+                entry['shapes'].append(profile.shape)
+                entry['calls'] += profile.calls
+                entry['total_ms'] = round(entry['total_ms'] + profile.total_ms, 3)
+        return {
+            'statements': [profile.to_dict() for profile in profiles],
+            'flagged_count': sum(1 for profile in profiles if profile.flagged),
+            'suggestions': sorted(suggestions.values(), key=lambda s: s['total_ms'], reverse=True)
+        }
+
+    @staticmethod
+    def _explain(conn: sqlite3.Connection, shape: str, sql: str, params: Any) -> StatementProfile:
+        profile = StatementProfile(shape=shape)
+        try:
+            rows = sqlite3.Connection.execute(conn, "EXPLAIN QUERY PLAN " + sql, params)
+            profile.plan = [row[3] for row in rows]
+        except sqlite3.Error as e:
+            profile.plan_error = str(e)
+            return profile
+        for detail in profile.plan:
+            scan = _FULL_SCAN.match(detail)
+            if scan and scan.group(1) != "CONSTANT":
+                profile.full_scans.append(scan.group(1))
+            temp = _TEMP_BTREE.search(detail)
+            if temp:
+                profile.temp_btrees.append(temp.group(1))
+        if profile.flagged:
+            logger.debug(f"Query plan uses scan/temp b-tree: {shape} -> {profile.plan}", category=LogCategory.DATABASE)
+        return profile
+
+class IndexAdvisor:
+    """SQLの述語・ORDER BYとスキーマから複合／カバリングインデックスを提案"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._columns: Dict[str, List[str]] = {}
+        self._indexes: Dict[str, List[List[str]]] = {}
+
+    def suggest(self, profile: StatementProfile) -> List[Dict[str, Any]]:
+        sql = profile.shape
+        aliases = self._table_aliases(sql)
+        targets: List[Tuple[str, str]] = []
+        for name in profile.full_scans:
+            table = aliases.get(name)
+            if table:
+                targets.append((name, table))
+        if any('ORDER BY' in usage for usage in profile.temp_btrees) and aliases:
+            # ORDER BY のソートは先頭のFROM対象テーブルに対して提案
+            first_alias, first_table = next(iter(aliases.items()))
+            if (first_alias, first_table) not in targets:
+                targets.append((first_alias, first_table))
+
+        suggestions = []
+        for alias, table in targets:
+            suggestion = self._suggest_for_table(sql, alias, table, single_table=len(set(aliases.values())) == 1)
+            if suggestion:
+                suggestions.append(suggestion)
+        return suggestions
+
+    def _suggest_for_table(self, sql: str, alias: str, table: str, single_table: bool) -> Optional[Dict[str, Any]]:
+        columns = set(self._table_columns(table))
+        equality: List[str] = []
+        ranges: List[str] = []
+        for qualifier, column, operator in _PREDICATE.findall(sql):
+            if column not in columns:
+                continue
+            if qualifier and qualifier not in (alias, table):
+                continue
+            if not qualifier and not single_table:
+                continue
+            target = equality if operator.upper() in ('=', 'IN') else ranges
+            if column not in equality and column not in ranges:
+                target.append(column)
+
+        order_columns: List[str] = []
+        order = _ORDER_BY.search(sql)
+        if order:
+            for term in order.group(1).split(","):
+                parts = term.strip().split()
+                if not parts:
+                    continue
+                qualifier, _, column = parts[0].rpartition(".")
+                if column not in columns or (qualifier and qualifier not in (alias, table)):
+                    order_columns = []
+                    break
+                order_columns.append(column)
+
+        index_columns = list(equality)
+        if order_columns:
+            index_columns += [column for column in order_columns if column not in index_columns]
+        elif ranges:
+            index_columns.append(ranges[0])
+        if not index_columns:
+            return None
+
+        covering = False
+        select_list = _SELECT_LIST.match(sql)
+        if select_list and select_list.group(1).strip() != "*":
+            selected = [term.strip().rpartition(".")[2] for term in select_list.group(1).split(",")]
+            if selected and all(column in columns for column in selected):
+                extra = [column for column in selected if column not in index_columns]
+                if extra and len(index_columns) + len(extra) <= 6:
+                    index_columns += extra
+                    covering = True
+
+        for existing in self._table_indexes(table):
+            if existing[:len(index_columns)] == index_columns:
+                return None
+
+        name = f"idx_{table}_{'_'.join(index_columns)}"
+        return {
+            'table': table,
+            'columns': index_columns,
+            'covering': covering,
+            'sql': f"CREATE INDEX IF NOT EXISTS {name} ON {table}({', '.join(index_columns)});",
+            'reason': self._reason(equality, ranges, order_columns)
+        }
+
+    @staticmethod
+    def _reason(equality: List[str], ranges: List[str], order_columns: List[str]) -> str:
+        parts = []
+        if equality:
+            parts.append(f"equality on {', '.join(equality)}")
+        if order_columns:
+            parts.append(f"ORDER BY {', '.join(order_columns)}")
+        elif ranges:
+            parts.append(f"range on {ranges[0]}")
+        return "; ".join(parts)
+
+    def _table_aliases(self, sql: str) -> Dict[str, str]:
+        """エイリアス（またはテーブル名）→ main スキーマの実テーブル名"""
+        aliases: Dict[str, str] = {}
+        for table, alias in _TABLE_REF.findall(_UPSERT_UPDATE.sub("DO", sql)):
+            if table.lower().startswith("sqlite_") or not self._table_columns(table):
+                continue
+            key = alias if alias and alias.lower() not in _SQL_KEYWORDS else table
+            aliases.setdefault(key, table)
+            aliases.setdefault(table, table)
+        return aliases
+
+    def _table_columns(self, table: str) -> List[str]:
+        """テーブルの列名（実テーブルでない名前や取得できない場合は空）"""
+        if table not in self._columns:
+            try:
+                self._columns[table] = [
+                    row[1] for row in sqlite3.Connection.execute(
+                        self.conn, f"PRAGMA main.table_info({_quote_identifier(table)})"
+                    )
+                ]
+            except sqlite3.Error as e:
+                logger.debug(f"Cannot read columns of {table!r}: {e}", category=LogCategory.DATABASE)
+                self._columns[table] = []
+        return self._columns[table]
+
+    def _table_indexes(self, table: str) -> List[List[str]]:
+        if table not in self._indexes:
+            indexes = []
+            try:
+                for row in sqlite3.Connection.execute(
+                    self.conn, f"PRAGMA main.index_list({_quote_identifier(table)})"
+                ).fetchall():
+                    indexes.append([
+                        info[2] for info in sqlite3.Connection.execute(
+                            self.conn, f"PRAGMA main.index_info({_quote_identifier(row[1])})"
+                        )
+                    ])
+            except sqlite3.Error as e:
+                logger.debug(f"Cannot read indexes of {table!r}: {e}", category=LogCategory.DATABASE)
+            self._indexes[table] = indexes
+        return self._indexes[table]
+
+def _quote_identifier(name: str) -> str:
+    """PRAGMA 引数用の識別子のクォート"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+# プロセス共有のプロファイラー
+_profiler = QueryProfiler()
+
+def get_query_profiler() -> QueryProfiler:
+    return _profiler
+
+class ProfiledConnection(sqlite3.Connection):
+    """execute/executemany を計測し、文の形ごとのプランを記録する接続"""
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
+        started = time.perf_counter()
+        cursor = super().execute(sql, parameters)
+        _profiler.record(self, sql, parameters, (time.perf_counter() - started) * 1000)
+        return cursor
+
+    def executemany(self, sql: str, parameters: Iterable[Any], /) -> sqlite3.Cursor:
+        started = time.perf_counter()
+        cursor = super().executemany(sql, parameters)
+        # パラメーター列は消費済みのため、プラン取得はNULLで代用
+        _profiler.record(self, sql, (None,) * sql.count("?"), (time.perf_counter() - started) * 1000)
+        return cursor
@@ -5,9 +5,13 @@ Core utility modules.
 
 from .paths import get_backend_paths
 from .validators import validate_required_fields, validate_date_string
+from .dates import to_epoch_ms, now_epoch_ms, epoch_ms_to_iso
 
 __all__ = [
     'get_backend_paths',
     'validate_required_fields',
-    'validate_date_string'
+    'validate_date_string',
+    'to_epoch_ms',
+    'now_epoch_ms',
+    'epoch_ms_to_iso'
 ]
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+日時変換ユーティリティ
+システムプロンプト準拠：DRY原則、日時の保存形式（UTCエポックミリ秒）への変換を一元化
+
+データベースは日時を INTEGER（UTCエポックミリ秒）で保持し、
+ISO 8601文字列（YYYY-MM-DDTHH:MM:SS.sssZ）は生成列として読み出す。
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from ..exceptions import ValidationError
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MS = timedelta(milliseconds=1)
+
+def to_epoch_ms(value: Any, field_name: str) -> Optional[int]:
+    """
+    datetime / ISO 8601文字列 / エポックミリ秒をUTCエポックミリ秒に変換
+    タイムゾーン無しの値はUTCとして扱う。Noneはそのまま返す
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise ValidationError(f"Invalid date format in {field_name}: {value}")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+        except ValueError:
+            raise ValidationError(f"Invalid date format in {field_name}: {value}")
+    if not isinstance(value, datetime):
+        raise ValidationError(f"Invalid date format in {field_name}: {value}")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    # 浮動小数点の timestamp() を避け、timedelta の整数除算で丸め誤差なく算出
+    return (value - _EPOCH) // _MS
+
+def now_epoch_ms() -> int:
+    """現在時刻のUTCエポックミリ秒"""
+    return time.time_ns() // 1_000_000
+
+def epoch_ms_to_iso(epoch_ms: Optional[int]) -> Optional[str]:
+    """UTCエポックミリ秒をISO 8601文字列（生成列と同じ表記）に変換"""
+    if epoch_ms is None:
+        return None
+    value = _EPOCH + epoch_ms * _MS
+    return value.strftime('%Y-%m-%dT%H:%M:%S.') + f"{value.microsecond // 1000:03d}Z"
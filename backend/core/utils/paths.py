@@ -19,10 +19,10 @@ def get_backend_paths() -> Dict[str, Path]:
         'TASKLIST': base_dir / 'features' / 'tasklist',
         'API': base_dir / 'api',
         'DATA': base_dir / 'data',
-        'SCHEMAS': base_dir / 'data' / 'schemas',
+        'MIGRATIONS': base_dir / 'data' / 'migrations',
         'SEEDS': base_dir / 'data' / 'seeds',
         'DATABASE': base_dir / 'todo.db',
-        'SCHEMA': base_dir / 'data' / 'schemas' / 'init.sql',
+        'INITIAL_DATA': base_dir / 'data' / 'seeds' / 'initial_data.sql',
         'LOG_DIR': base_dir / 'logs',
     }
     
@@ -30,6 +30,7 @@ def get_backend_paths() -> Dict[str, Path]:
     log_dir = paths['LOG_DIR']
     log_dir.mkdir(exist_ok=True)
     paths['LOG_FILE'] = log_dir / 'app.log'
+    paths['SLOW_QUERY_LOG_FILE'] = log_dir / 'slow_query.log'
     
     return paths
 
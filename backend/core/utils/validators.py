@@ -20,6 +20,8 @@ def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -
 
 def validate_date_string(date_string: str, field_name: str) -> datetime:
     """日付文字列の検証と変換"""
+    if not isinstance(date_string, str):
+        raise ValidationError(f"Invalid date format in {field_name}: {date_string!r} (expected an ISO 8601 string)")
     try:
         return datetime.fromisoformat(date_string.replace('Z', '+00:00'))
     except ValueError as e:
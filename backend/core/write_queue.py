@@ -0,0 +1,238 @@
+"""
+グループコミット書き込みキュー
+システムプロンプト準拠：KISS原則、単一ライターによるfsync回数の削減
+"""
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional, Tuple, TypeVar
+
+from .connection_pool import ConnectionPool
+from .exceptions import DatabaseError
+from .logger import get_logger, LogCategory
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+@dataclass
+class _WriteRequest:
+    """キューに積まれる書き込み要求（ライターの接続を受け取って実行する処理）"""
+    work: Callable[[sqlite3.Connection], Any]
+    future: Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+@dataclass
+class BatchReport:
+    """1バッチ（1トランザクション）分の実行結果"""
+    size: int
+    failed: int
+    max_queue_wait_ms: float
+    execute_ms: float
+    commit_ms: float
+    total_ms: float
+    statements_per_sec: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: round(v, 3) if isinstance(v, float) else v for k, v in asdict(self).items()}
+
+class GroupCommitWriter:
+    """
+    単一ライタースレッドによるグループコミット
+    短い時間窓内に到着した更新文を1トランザクションにまとめてコミットする。
+    各要求（単一の文、または lease() で貸し出した接続上のトランザクション）はSAVEPOINTで隔離され、
+    失敗した要求の呼び出し元にのみ例外が返る。
+    """
+
+    _SHUTDOWN = object()
+
+    def __init__(self, pool: ConnectionPool, window_ms: float = 2.0,
+                 max_batch: int = 256, history: int = 100):
+        self.pool = pool
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._reports: Deque[BatchReport] = deque(maxlen=history)
+        self._totals = {'batches': 0, 'statements': 0, 'failed': 0}
+        self._stats_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="db-group-commit", daemon=True)
+        self._closed = False
+        self._thread.start()
+
+    def submit_work(self, work: Callable[[sqlite3.Connection], Any]) -> Future:
+        """処理をキューに投入（ライタースレッドでバッチのトランザクション内に実行、結果はコミット後に確定）"""
+        if self._closed:
+            raise DatabaseError("Group commit writer is closed")
+        future: Future = Future()
+        self._queue.put(_WriteRequest(work, future))
+        return future
+
+    def submit(self, query: str, params: tuple = ()) -> "Future[int]":
+        """更新文をキューに投入（結果はコミット後に確定）"""
+        params = tuple(params)
+        return self.submit_work(lambda conn: conn.execute(query, params).rowcount)
+
+    def execute(self, query: str, params: tuple = ()) -> int:
+        """更新文を投入しコミット完了まで待機（影響行数を返す）"""
+        return self.submit(query, params).result()
+
+    def run(self, work: Callable[[sqlite3.Connection], T]) -> T:
+        """処理を投入しコミット完了まで待機（処理の戻り値を返す）"""
+        return self.submit_work(work).result()
+
+    @contextmanager
+    def lease(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        バッチ内でライターの接続を呼び出し元スレッドへ貸し出す
+        ブロック内の文は1つのSAVEPOINTで隔離され、ブロックの終了後にバッチと共にコミットされる。
+        ブロック内の例外はそのSAVEPOINTのみをロールバックして呼び出し元へ再送出する。
+        貸し出し中はライタースレッドが待機するため、ブロック内でライターへ投入してはならない。
+        """
+        handoff: "Future[sqlite3.Connection]" = Future()
+        finished = threading.Event()
+        failed = False
+
+        def work(conn: sqlite3.Connection) -> None:
+            handoff.set_result(conn)
+            finished.wait()
+            if failed:
+                # 元の例外は呼び出し元スレッドで再送出する（ここではSAVEPOINTを戻すためだけに送出）
+                raise DatabaseError("Leased transaction block failed")
+
+        future = self.submit_work(work)
+        wait([handoff, future], return_when=FIRST_COMPLETED)
+        if not handoff.done():
+            # バッチ開始前に失敗した（BEGIN IMMEDIATE のタイムアウト等）
+            future.result()
+        try:
+            yield handoff.result()
+        except BaseException:
+            failed = True
+            finished.set()
+            wait([future])
+            raise
+        finished.set()
+        future.result()
+
+    def close(self) -> None:
+        """キュー内の要求をすべて処理してから停止"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._SHUTDOWN)
+        self._thread.join()
+        # 停止と競合して投入された要求は失敗として返す
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _WriteRequest):
+                item.future.set_exception(DatabaseError("Group commit writer is closed"))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """累計と直近バッチのレポート"""
+        with self._stats_lock:
+            reports = list(self._reports)
+            totals = dict(self._totals)
+        totals['avg_batch_size'] = round(totals['statements'] / totals['batches'], 2) if totals['batches'] else 0.0
+        totals['queue_depth'] = self._queue.qsize()
+        totals['recent_batches'] = [report.to_dict() for report in reports[-10:]]
+        return totals
+
+    def _collect_batch(self, first: _WriteRequest) -> Tuple[List[_WriteRequest], bool]:
+        """時間窓内に到着した要求をまとめる"""
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._SHUTDOWN:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._SHUTDOWN:
+                break
+            batch, stopping = self._collect_batch(item)
+            try:
+                if conn is None:
+                    conn = self.pool.create_connection()
+                self._commit_batch(conn, batch)
+            except sqlite3.Error as e:
+                logger.error(f"Group commit failed: {e}", category=LogCategory.DATABASE)
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(DatabaseError(f"Database operation failed: {e}"))
+                if conn is not None:
+                    conn.close()
+                    conn = None
+        if conn is not None:
+            conn.close()
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch: List[_WriteRequest]) -> None:
+        started = time.monotonic()
+        max_wait = max(started - request.enqueued_at for request in batch)
+        results: List[Any] = []
+        errors: Dict[int, Exception] = {}
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for index, request in enumerate(batch):
+                conn.execute("SAVEPOINT group_commit_stmt")
+                try:
+                    results.append(request.work(conn))
+                    conn.execute("RELEASE group_commit_stmt")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO group_commit_stmt")
+                    conn.execute("RELEASE group_commit_stmt")
+                    results.append(None)
+                    errors[index] = DatabaseError(f"Database operation failed: {e}") if isinstance(e, sqlite3.Error) else e
+            executed = time.monotonic()
+            conn.commit()
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finished = time.monotonic()
+
+        for index, request in enumerate(batch):
+            if index in errors:
+                request.future.set_exception(errors[index])
+            else:
+                request.future.set_result(results[index])
+
+        total = finished - started
+        report = BatchReport(
+            size=len(batch),
+            failed=len(errors),
+            max_queue_wait_ms=max_wait * 1000,
+            execute_ms=(executed - started) * 1000,
+            commit_ms=(finished - executed) * 1000,
+            total_ms=total * 1000,
+            statements_per_sec=len(batch) / total if total > 0 else float(len(batch))
+        )
+        with self._stats_lock:
+            self._reports.append(report)
+            self._totals['batches'] += 1
+            self._totals['statements'] += report.size
+            self._totals['failed'] += report.failed
+        logger.debug(
+            f"Group commit: {report.size} statements in {report.total_ms:.2f}ms "
+            f"({report.statements_per_sec:.0f} stmt/s, commit {report.commit_ms:.2f}ms)",
+            category=LogCategory.DATABASE,
+            duration_ms=report.total_ms
+        )
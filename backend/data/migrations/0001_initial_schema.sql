@@ -0,0 +1,40 @@
+-- 初期スキーマ：プロジェクト・タスクテーブルと基本インデックス
+-- 既存データベース（マイグレーション導入前）にも安全に適用できるよう IF NOT EXISTS を使用
+
+-- プロジェクトテーブル
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    color TEXT NOT NULL,
+    collapsed BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- タスクテーブル
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    parent_id TEXT,
+    completed BOOLEAN DEFAULT FALSE,
+    start_date TIMESTAMP NOT NULL,
+    due_date TIMESTAMP NOT NULL,
+    completion_date TIMESTAMP,
+    notes TEXT DEFAULT '',
+    assignee TEXT DEFAULT '自分',
+    level INTEGER DEFAULT 0,
+    collapsed BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+    FOREIGN KEY (parent_id) REFERENCES tasks(id) ON DELETE CASCADE
+);
+
+-- インデックス
+CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks(project_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_parent_id ON tasks(parent_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks(completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_level ON tasks(level);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_level_due_date ON tasks(level, due_date);
@@ -0,0 +1,2 @@
+-- 一覧取得の並び順（キーセットページネーション）に一致する複合インデックス
+CREATE INDEX IF NOT EXISTS idx_tasks_project_due_created ON tasks(project_id, due_date, created_at, id);
@@ -0,0 +1,23 @@
+-- タスク階層クロージャーテーブル（全祖先・子孫ペア、自身との組を含む）
+CREATE TABLE IF NOT EXISTS task_closure (
+    ancestor_id TEXT NOT NULL,
+    descendant_id TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_task_closure_descendant ON task_closure(descendant_id, depth);
+
+-- 既存タスクから全再構築（parent_idの循環参照に備え深さ64で打ち切り）
+DELETE FROM task_closure;
+WITH RECURSIVE up(descendant_id, ancestor_id, depth) AS (
+    SELECT id, id, 0 FROM tasks
+    UNION ALL
+    SELECT up.descendant_id, p.id, up.depth + 1
+    FROM up
+    JOIN tasks t ON t.id = up.ancestor_id
+    JOIN tasks p ON p.id = t.parent_id
+    WHERE up.depth < 64
+)
+INSERT OR REPLACE INTO task_closure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth FROM up;
@@ -0,0 +1,93 @@
+-- 日時をUTCエポックミリ秒（INTEGER）で保持し、従来の列名はISO 8601文字列の生成列（VIRTUAL）として提供する
+-- 既存の混在した表記（'T'区切り／空白区切り、タイムゾーン付き／無し、日付のみ）は julianday() で解釈し、
+-- タイムゾーン無しの値はUTCとして扱う。解釈できない値は作成日時（それも無い場合は現在時刻）で補う。
+-- ISO表記: YYYY-MM-DDTHH:MM:SS.sssZ
+
+-- プロジェクトテーブルの再構築
+CREATE TABLE projects_epoch (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    color TEXT NOT NULL,
+    collapsed BOOLEAN DEFAULT FALSE,
+    created_epoch INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
+    updated_epoch INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
+    created_at TEXT GENERATED ALWAYS AS (strftime('%Y-%m-%dT%H:%M:%S', created_epoch / 1000, 'unixepoch') || printf('.%03dZ', created_epoch % 1000)) VIRTUAL,
+    updated_at TEXT GENERATED ALWAYS AS (strftime('%Y-%m-%dT%H:%M:%S', updated_epoch / 1000, 'unixepoch') || printf('.%03dZ', updated_epoch % 1000)) VIRTUAL
+);
+
+INSERT INTO projects_epoch (id, name, color, collapsed, created_epoch, updated_epoch)
+SELECT id, name, color, collapsed, created_epoch, COALESCE(updated_epoch, created_epoch)
+FROM (
+    SELECT id, name, color, collapsed,
+           COALESCE(
+               CAST(round((julianday(created_at) - 2440587.5) * 86400000) AS INTEGER),
+               CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)
+           ) AS created_epoch,
+           CAST(round((julianday(updated_at) - 2440587.5) * 86400000) AS INTEGER) AS updated_epoch
+    FROM projects
+);
+
+DROP TABLE projects;
+ALTER TABLE projects_epoch RENAME TO projects;
+
+-- タスクテーブルの再構築
+CREATE TABLE tasks_epoch (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    parent_id TEXT,
+    completed BOOLEAN DEFAULT FALSE,
+    start_epoch INTEGER NOT NULL,
+    due_epoch INTEGER NOT NULL,
+    completion_epoch INTEGER,
+    notes TEXT DEFAULT '',
+    assignee TEXT DEFAULT '自分',
+    level INTEGER DEFAULT 0,
+    collapsed BOOLEAN DEFAULT FALSE,
+    created_epoch INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
+    updated_epoch INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
+    start_date TEXT GENERATED ALWAYS AS (strftime('%Y-%m-%dT%H:%M:%S', start_epoch / 1000, 'unixepoch') || printf('.%03dZ', start_epoch % 1000)) VIRTUAL,
+    due_date TEXT GENERATED ALWAYS AS (strftime('%Y-%m-%dT%H:%M:%S', due_epoch / 1000, 'unixepoch') || printf('.%03dZ', due_epoch % 1000)) VIRTUAL,
+    completion_date TEXT GENERATED ALWAYS AS (strftime('%Y-%m-%dT%H:%M:%S', completion_epoch / 1000, 'unixepoch') || printf('.%03dZ', completion_epoch % 1000)) VIRTUAL,
+    created_at TEXT GENERATED ALWAYS AS (strftime('%Y-%m-%dT%H:%M:%S', created_epoch / 1000, 'unixepoch') || printf('.%03dZ', created_epoch % 1000)) VIRTUAL,
+    updated_at TEXT GENERATED ALWAYS AS (strftime('%Y-%m-%dT%H:%M:%S', updated_epoch / 1000, 'unixepoch') || printf('.%03dZ', updated_epoch % 1000)) VIRTUAL,
+    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+    FOREIGN KEY (parent_id) REFERENCES tasks(id) ON DELETE CASCADE
+);
+
+INSERT INTO tasks_epoch (
+    id, name, project_id, parent_id, completed, start_epoch, due_epoch, completion_epoch,
+    notes, assignee, level, collapsed, created_epoch, updated_epoch
+)
+SELECT id, name, project_id, parent_id, completed,
+       COALESCE(start_epoch, created_epoch),
+       COALESCE(due_epoch, start_epoch, created_epoch),
+       completion_epoch,
+       notes, assignee, level, collapsed,
+       created_epoch,
+       COALESCE(updated_epoch, created_epoch)
+FROM (
+    SELECT *,
+           CAST(round((julianday(start_date) - 2440587.5) * 86400000) AS INTEGER) AS start_epoch,
+           CAST(round((julianday(due_date) - 2440587.5) * 86400000) AS INTEGER) AS due_epoch,
+           CAST(round((julianday(completion_date) - 2440587.5) * 86400000) AS INTEGER) AS completion_epoch,
+           COALESCE(
+               CAST(round((julianday(created_at) - 2440587.5) * 86400000) AS INTEGER),
+               CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)
+           ) AS created_epoch,
+           CAST(round((julianday(updated_at) - 2440587.5) * 86400000) AS INTEGER) AS updated_epoch
+    FROM tasks
+);
+
+DROP TABLE tasks;
+ALTER TABLE tasks_epoch RENAME TO tasks;
+
+-- インデックス（日時はエポック列に対して作成）
+CREATE INDEX idx_tasks_project_id ON tasks(project_id);
+CREATE INDEX idx_tasks_parent_id ON tasks(parent_id);
+CREATE INDEX idx_tasks_completed ON tasks(completed);
+CREATE INDEX idx_tasks_level ON tasks(level);
+CREATE INDEX idx_tasks_due_epoch ON tasks(due_epoch);
+CREATE INDEX idx_tasks_level_due_epoch ON tasks(level, due_epoch);
+CREATE INDEX idx_tasks_project_due_created ON tasks(project_id, due_epoch, created_epoch, id);
+CREATE INDEX idx_projects_created_epoch ON projects(created_epoch);
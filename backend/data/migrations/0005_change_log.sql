@@ -0,0 +1,60 @@
+-- 変更履歴（差分同期用）
+-- tasks / projects への INSERT / UPDATE / DELETE をトリガーで記録する。
+-- 1レコードにつき最新の変更1行のみを保持し（INSERT OR REPLACE で seq を採番し直す）、
+-- 削除は op = 'delete' の墓標として残す。seq は AUTOINCREMENT のため再利用されず単調増加する。
+CREATE TABLE change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL CHECK (entity IN ('project', 'task')),
+    entity_id TEXT NOT NULL,
+    op TEXT NOT NULL CHECK (op IN ('upsert', 'delete')),
+    changed_epoch INTEGER NOT NULL,
+    UNIQUE (entity, entity_id)
+);
+
+CREATE TRIGGER tasks_change_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch)
+    VALUES ('task', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER));
+END;
+
+CREATE TRIGGER tasks_change_update AFTER UPDATE ON tasks
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch)
+    SELECT 'task', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)
+    WHERE OLD.id IS NOT NEW.id;
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch)
+    VALUES ('task', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER));
+END;
+
+CREATE TRIGGER tasks_change_delete AFTER DELETE ON tasks
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch)
+    VALUES ('task', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER));
+END;
+
+CREATE TRIGGER projects_change_insert AFTER INSERT ON projects
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch)
+    VALUES ('project', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER));
+END;
+
+CREATE TRIGGER projects_change_update AFTER UPDATE ON projects
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch)
+    SELECT 'project', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)
+    WHERE OLD.id IS NOT NEW.id;
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch)
+    VALUES ('project', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER));
+END;
+
+CREATE TRIGGER projects_change_delete AFTER DELETE ON projects
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch)
+    VALUES ('project', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER));
+END;
+
+-- 既存レコードを初期状態として登録（since=0 の同期で全件が返る）
+INSERT INTO change_log (entity, entity_id, op, changed_epoch)
+SELECT 'project', id, 'upsert', updated_epoch FROM projects ORDER BY created_epoch, id;
+INSERT INTO change_log (entity, entity_id, op, changed_epoch)
+SELECT 'task', id, 'upsert', updated_epoch FROM tasks ORDER BY created_epoch, id;
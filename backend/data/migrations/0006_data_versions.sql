@@ -0,0 +1,52 @@
+-- データバージョン（条件付きGET用）
+-- 一覧の ETag の元になるカウンター。scope ごとに1行を持ち、書き込みと同じトランザクション内で
+-- トリガーが加算するため、複数のワーカープロセスから同じ値が見える。
+--   'projects'         : プロジェクト一覧
+--   'tasks'            : 全タスク
+--   'project:<id>'     : プロジェクト内のタスク（所属プロジェクト変更時は移動元・移動先の両方）
+--   'generation'       : データベースごとの乱数（再作成後に古い ETag が一致しないようにする）
+CREATE TABLE data_versions (
+    scope TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+) WITHOUT ROWID;
+
+INSERT INTO data_versions (scope, version) VALUES
+    ('generation', abs(random() % 1000000000000)),
+    ('projects', 0),
+    ('tasks', 0);
+
+CREATE TRIGGER tasks_version_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO data_versions (scope, version) VALUES ('tasks', 1), ('project:' || NEW.project_id, 1)
+    ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER tasks_version_update AFTER UPDATE ON tasks
+BEGIN
+    INSERT INTO data_versions (scope, version) VALUES ('tasks', 1), ('project:' || NEW.project_id, 1)
+    ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+    INSERT INTO data_versions (scope, version)
+    SELECT 'project:' || OLD.project_id, 1 WHERE OLD.project_id IS NOT NEW.project_id
+    ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER tasks_version_delete AFTER DELETE ON tasks
+BEGIN
+    INSERT INTO data_versions (scope, version) VALUES ('tasks', 1), ('project:' || OLD.project_id, 1)
+    ON CONFLICT (scope) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER projects_version_insert AFTER INSERT ON projects
+BEGIN
+    UPDATE data_versions SET version = version + 1 WHERE scope = 'projects';
+END;
+
+CREATE TRIGGER projects_version_update AFTER UPDATE ON projects
+BEGIN
+    UPDATE data_versions SET version = version + 1 WHERE scope = 'projects';
+END;
+
+CREATE TRIGGER projects_version_delete AFTER DELETE ON projects
+BEGIN
+    UPDATE data_versions SET version = version + 1 WHERE scope = 'projects';
+END;
@@ -0,0 +1,60 @@
+-- 変更履歴へのプロジェクトID追加（変更通知のプロジェクト別購読用）
+-- project_id はタスクの所属プロジェクト（プロジェクト自身の変更では自身のID）。
+-- previous_project_id は直近の変更でタスクが別プロジェクトから移動した場合の移動元。
+ALTER TABLE change_log ADD COLUMN project_id TEXT;
+ALTER TABLE change_log ADD COLUMN previous_project_id TEXT;
+
+DROP TRIGGER tasks_change_insert;
+DROP TRIGGER tasks_change_update;
+DROP TRIGGER tasks_change_delete;
+DROP TRIGGER projects_change_insert;
+DROP TRIGGER projects_change_update;
+DROP TRIGGER projects_change_delete;
+
+CREATE TRIGGER tasks_change_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('task', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), NEW.project_id);
+END;
+
+CREATE TRIGGER tasks_change_update AFTER UPDATE ON tasks
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    SELECT 'task', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), OLD.project_id
+    WHERE OLD.id IS NOT NEW.id;
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch, project_id, previous_project_id)
+    VALUES ('task', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), NEW.project_id,
+            CASE WHEN OLD.project_id IS NOT NEW.project_id THEN OLD.project_id END);
+END;
+
+CREATE TRIGGER tasks_change_delete AFTER DELETE ON tasks
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('task', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), OLD.project_id);
+END;
+
+CREATE TRIGGER projects_change_insert AFTER INSERT ON projects
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('project', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), NEW.id);
+END;
+
+CREATE TRIGGER projects_change_update AFTER UPDATE ON projects
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    SELECT 'project', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), OLD.id
+    WHERE OLD.id IS NOT NEW.id;
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('project', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), NEW.id);
+END;
+
+CREATE TRIGGER projects_change_delete AFTER DELETE ON projects
+BEGIN
+    INSERT OR REPLACE INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('project', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), OLD.id);
+END;
+
+-- 既存行の補完（削除済みタスクの所属プロジェクトは不明のため NULL のまま）
+UPDATE change_log SET project_id = entity_id WHERE entity = 'project';
+UPDATE change_log SET project_id = (SELECT project_id FROM tasks WHERE tasks.id = change_log.entity_id)
+WHERE entity = 'task';
@@ -0,0 +1,39 @@
+-- タスクの全文検索（FTS5）
+-- tasks.name / tasks.notes を trigram トークナイザーで索引する（分かち書きのない日本語でも
+-- 3文字以上の部分一致で検索でき、前方一致も含まれる）。
+-- tasks は INTEGER PRIMARY KEY を持たず VACUUM で rowid が変わり得るため、検索用の rowid を
+-- task_search_rowids で固定し、索引はトリガーで tasks と同じトランザクション内に更新する。
+CREATE TABLE task_search_rowids (
+    rowid INTEGER PRIMARY KEY,
+    task_id TEXT NOT NULL UNIQUE
+);
+
+CREATE VIRTUAL TABLE tasks_fts USING fts5(name, notes, tokenize = 'trigram');
+
+CREATE TRIGGER tasks_search_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO task_search_rowids (task_id) VALUES (NEW.id);
+    INSERT INTO tasks_fts (rowid, name, notes)
+    VALUES ((SELECT rowid FROM task_search_rowids WHERE task_id = NEW.id), NEW.name, COALESCE(NEW.notes, ''));
+END;
+
+-- 名前・メモ・IDが変わらない更新（完了切替・日付変更等）では索引に触れない
+CREATE TRIGGER tasks_search_update AFTER UPDATE OF id, name, notes ON tasks
+WHEN OLD.id IS NOT NEW.id OR OLD.name IS NOT NEW.name OR OLD.notes IS NOT NEW.notes
+BEGIN
+    UPDATE task_search_rowids SET task_id = NEW.id WHERE task_id = OLD.id AND OLD.id IS NOT NEW.id;
+    UPDATE tasks_fts SET name = NEW.name, notes = COALESCE(NEW.notes, '')
+    WHERE rowid = (SELECT rowid FROM task_search_rowids WHERE task_id = NEW.id);
+END;
+
+CREATE TRIGGER tasks_search_delete AFTER DELETE ON tasks
+BEGIN
+    DELETE FROM tasks_fts WHERE rowid = (SELECT rowid FROM task_search_rowids WHERE task_id = OLD.id);
+    DELETE FROM task_search_rowids WHERE task_id = OLD.id;
+END;
+
+-- 既存タスクの索引
+INSERT INTO task_search_rowids (task_id) SELECT id FROM tasks ORDER BY created_epoch, id;
+INSERT INTO tasks_fts (rowid, name, notes)
+SELECT s.rowid, t.name, COALESCE(t.notes, '')
+FROM task_search_rowids s JOIN tasks t ON t.id = s.task_id;
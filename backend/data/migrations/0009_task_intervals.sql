@@ -0,0 +1,49 @@
+-- タスク期間の R*Tree 索引（タイムラインの表示範囲検索用）
+-- 全文検索用に導入した rowid 対応表を task_rowids に改名し、FTS5 と R*Tree の共通キーとする。
+-- 同じイベントに複数のトリガーがあると実行順に依存するため、補助索引の更新は
+-- tasks_index_* の1トリガーにまとめ、対応表 → 全文検索 → 期間索引の順に更新する。
+ALTER TABLE task_search_rowids RENAME TO task_rowids;
+
+DROP TRIGGER tasks_search_insert;
+DROP TRIGGER tasks_search_update;
+DROP TRIGGER tasks_search_delete;
+
+-- 座標は32ビット浮動小数点で保持され、区間を含む方向に丸められる（厳密な判定は tasks の列で行う）
+CREATE VIRTUAL TABLE task_intervals USING rtree(id, start_epoch, due_epoch);
+
+CREATE TRIGGER tasks_index_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO task_rowids (task_id) VALUES (NEW.id);
+    INSERT INTO tasks_fts (rowid, name, notes)
+    VALUES ((SELECT rowid FROM task_rowids WHERE task_id = NEW.id), NEW.name, COALESCE(NEW.notes, ''));
+    INSERT INTO task_intervals (id, start_epoch, due_epoch)
+    VALUES ((SELECT rowid FROM task_rowids WHERE task_id = NEW.id),
+            min(NEW.start_epoch, NEW.due_epoch), max(NEW.start_epoch, NEW.due_epoch));
+END;
+
+-- 索引対象の列が変わらない更新（完了切替等）では索引に触れない
+CREATE TRIGGER tasks_index_update AFTER UPDATE OF id, name, notes, start_epoch, due_epoch ON tasks
+WHEN OLD.id IS NOT NEW.id OR OLD.name IS NOT NEW.name OR OLD.notes IS NOT NEW.notes
+    OR OLD.start_epoch IS NOT NEW.start_epoch OR OLD.due_epoch IS NOT NEW.due_epoch
+BEGIN
+    UPDATE task_rowids SET task_id = NEW.id WHERE task_id = OLD.id AND OLD.id IS NOT NEW.id;
+    UPDATE tasks_fts SET name = NEW.name, notes = COALESCE(NEW.notes, '')
+    WHERE rowid = (SELECT rowid FROM task_rowids WHERE task_id = NEW.id)
+      AND (OLD.name IS NOT NEW.name OR OLD.notes IS NOT NEW.notes);
+    UPDATE task_intervals
+    SET start_epoch = min(NEW.start_epoch, NEW.due_epoch), due_epoch = max(NEW.start_epoch, NEW.due_epoch)
+    WHERE id = (SELECT rowid FROM task_rowids WHERE task_id = NEW.id)
+      AND (OLD.start_epoch IS NOT NEW.start_epoch OR OLD.due_epoch IS NOT NEW.due_epoch);
+END;
+
+CREATE TRIGGER tasks_index_delete AFTER DELETE ON tasks
+BEGIN
+    DELETE FROM tasks_fts WHERE rowid = (SELECT rowid FROM task_rowids WHERE task_id = OLD.id);
+    DELETE FROM task_intervals WHERE id = (SELECT rowid FROM task_rowids WHERE task_id = OLD.id);
+    DELETE FROM task_rowids WHERE task_id = OLD.id;
+END;
+
+-- 既存タスクの期間
+INSERT INTO task_intervals (id, start_epoch, due_epoch)
+SELECT r.rowid, min(t.start_epoch, t.due_epoch), max(t.start_epoch, t.due_epoch)
+FROM task_rowids r JOIN tasks t ON t.id = r.task_id;
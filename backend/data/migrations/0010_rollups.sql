@@ -0,0 +1,75 @@
+-- プロジェクト・親タスクごとの集計（件数・完了件数）
+-- tasks のトリガーで書き込みと同じトランザクション内に増減し、読み取りは主キー検索1回で済む。
+-- 期限切れ件数は現在時刻に依存し書き込みだけでは保守できないため、集計表には持たず
+-- idx_tasks_project_open_due の範囲カウントで求める。
+CREATE TABLE project_rollups (
+    project_id TEXT PRIMARY KEY,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    completed_count INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE task_rollups (
+    task_id TEXT PRIMARY KEY,
+    child_count INTEGER NOT NULL DEFAULT 0,
+    completed_child_count INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TRIGGER tasks_rollup_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO project_rollups (project_id, task_count, completed_count)
+    VALUES (NEW.project_id, 1, NEW.completed IS TRUE)
+    ON CONFLICT (project_id) DO UPDATE
+    SET task_count = task_count + 1, completed_count = completed_count + excluded.completed_count;
+    INSERT INTO task_rollups (task_id, child_count, completed_child_count)
+    SELECT NEW.parent_id, 1, NEW.completed IS TRUE WHERE NEW.parent_id IS NOT NULL
+    ON CONFLICT (task_id) DO UPDATE
+    SET child_count = child_count + 1, completed_child_count = completed_child_count + excluded.completed_child_count;
+END;
+
+-- 所属・親・完了状態が変わる更新のみ、旧所属から差し引いて新所属に加える
+CREATE TRIGGER tasks_rollup_update AFTER UPDATE OF project_id, parent_id, completed ON tasks
+WHEN OLD.project_id IS NOT NEW.project_id OR OLD.parent_id IS NOT NEW.parent_id
+    OR (OLD.completed IS TRUE) IS NOT (NEW.completed IS TRUE)
+BEGIN
+    UPDATE project_rollups
+    SET task_count = task_count - 1, completed_count = completed_count - (OLD.completed IS TRUE)
+    WHERE project_id = OLD.project_id;
+    INSERT INTO project_rollups (project_id, task_count, completed_count)
+    VALUES (NEW.project_id, 1, NEW.completed IS TRUE)
+    ON CONFLICT (project_id) DO UPDATE
+    SET task_count = task_count + 1, completed_count = completed_count + excluded.completed_count;
+    UPDATE task_rollups
+    SET child_count = child_count - 1, completed_child_count = completed_child_count - (OLD.completed IS TRUE)
+    WHERE task_id = OLD.parent_id;
+    INSERT INTO task_rollups (task_id, child_count, completed_child_count)
+    SELECT NEW.parent_id, 1, NEW.completed IS TRUE WHERE NEW.parent_id IS NOT NULL
+    ON CONFLICT (task_id) DO UPDATE
+    SET child_count = child_count + 1, completed_child_count = completed_child_count + excluded.completed_child_count;
+END;
+
+CREATE TRIGGER tasks_rollup_delete AFTER DELETE ON tasks
+BEGIN
+    UPDATE project_rollups
+    SET task_count = task_count - 1, completed_count = completed_count - (OLD.completed IS TRUE)
+    WHERE project_id = OLD.project_id;
+    UPDATE task_rollups
+    SET child_count = child_count - 1, completed_child_count = completed_child_count - (OLD.completed IS TRUE)
+    WHERE task_id = OLD.parent_id;
+    DELETE FROM task_rollups WHERE task_id = OLD.id;
+END;
+
+CREATE TRIGGER projects_rollup_delete AFTER DELETE ON projects
+BEGIN
+    DELETE FROM project_rollups WHERE project_id = OLD.id;
+END;
+
+-- 期限切れ件数（未完了かつ期限が現在より前）の範囲カウントと、次に期限切れになる時刻の取得用
+CREATE INDEX idx_tasks_project_open_due ON tasks(project_id, completed, due_epoch);
+CREATE INDEX idx_tasks_completed_due ON tasks(completed, due_epoch);
+DROP INDEX idx_tasks_completed;
+
+-- 既存タスクの集計
+INSERT INTO project_rollups (project_id, task_count, completed_count)
+SELECT project_id, count(*), sum(completed IS TRUE) FROM tasks GROUP BY project_id;
+INSERT INTO task_rollups (task_id, child_count, completed_child_count)
+SELECT parent_id, count(*), sum(completed IS TRUE) FROM tasks WHERE parent_id IS NOT NULL GROUP BY parent_id;
@@ -0,0 +1,59 @@
+-- 変更履歴トリガーの書き直し（INSERT OR REPLACE → DELETE ＋ INSERT）
+-- トリガー内の OR REPLACE は外側の文の衝突解決（インポートの INSERT ... ON CONFLICT DO UPDATE 等）で
+-- 上書きされ、既存レコードの上書き時に UNIQUE (entity, entity_id) 違反となるため、
+-- 旧行を明示的に削除してから挿入する（seq は従来どおり採番し直される）。
+DROP TRIGGER tasks_change_insert;
+DROP TRIGGER tasks_change_update;
+DROP TRIGGER tasks_change_delete;
+DROP TRIGGER projects_change_insert;
+DROP TRIGGER projects_change_update;
+DROP TRIGGER projects_change_delete;
+
+CREATE TRIGGER tasks_change_insert AFTER INSERT ON tasks
+BEGIN
+    DELETE FROM change_log WHERE entity = 'task' AND entity_id = NEW.id;
+    INSERT INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('task', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), NEW.project_id);
+END;
+
+CREATE TRIGGER tasks_change_update AFTER UPDATE ON tasks
+BEGIN
+    DELETE FROM change_log WHERE entity = 'task' AND entity_id IN (OLD.id, NEW.id);
+    INSERT INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    SELECT 'task', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), OLD.project_id
+    WHERE OLD.id IS NOT NEW.id;
+    INSERT INTO change_log (entity, entity_id, op, changed_epoch, project_id, previous_project_id)
+    VALUES ('task', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), NEW.project_id,
+            CASE WHEN OLD.project_id IS NOT NEW.project_id THEN OLD.project_id END);
+END;
+
+CREATE TRIGGER tasks_change_delete AFTER DELETE ON tasks
+BEGIN
+    DELETE FROM change_log WHERE entity = 'task' AND entity_id = OLD.id;
+    INSERT INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('task', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), OLD.project_id);
+END;
+
+CREATE TRIGGER projects_change_insert AFTER INSERT ON projects
+BEGIN
+    DELETE FROM change_log WHERE entity = 'project' AND entity_id = NEW.id;
+    INSERT INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('project', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), NEW.id);
+END;
+
+CREATE TRIGGER projects_change_update AFTER UPDATE ON projects
+BEGIN
+    DELETE FROM change_log WHERE entity = 'project' AND entity_id IN (OLD.id, NEW.id);
+    INSERT INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    SELECT 'project', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), OLD.id
+    WHERE OLD.id IS NOT NEW.id;
+    INSERT INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('project', NEW.id, 'upsert', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), NEW.id);
+END;
+
+CREATE TRIGGER projects_change_delete AFTER DELETE ON projects
+BEGIN
+    DELETE FROM change_log WHERE entity = 'project' AND entity_id = OLD.id;
+    INSERT INTO change_log (entity, entity_id, op, changed_epoch, project_id)
+    VALUES ('project', OLD.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER), OLD.id);
+END;
@@ -0,0 +1,42 @@
+-- 初期データ（新規作成されたデータベースにのみ、全マイグレーション適用後に1回だけ投入）
+-- システムプロンプト準拠：実用的なプロジェクトデータのみ保持
+INSERT OR IGNORE INTO projects (id, name, color) VALUES
+('p1', '仕事', '#f97316'),
+('p2', '個人', '#8b5cf6'),
+('p3', '学習', '#10b981');
+
+-- システムプロンプト準拠：実用的なサンプルタスクデータ
+-- 日時はUTCエポックミリ秒で保持（期限は現在時刻からの日数オフセット）
+WITH now(ms) AS (SELECT CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER))
+INSERT OR IGNORE INTO tasks (id, name, project_id, parent_id, completed, start_epoch, due_epoch, notes, assignee, level)
+SELECT v.id, v.name, v.project_id, v.parent_id, FALSE, now.ms, now.ms + v.due_days * 86400000, v.notes, '自分', v.level
+FROM now, (
+    -- 仕事プロジェクト
+    SELECT 't1' AS id, '緊急プロジェクト提案書' AS name, 'p1' AS project_id, NULL AS parent_id, 1 AS due_days, '最優先タスク' AS notes, 0 AS level
+    UNION ALL SELECT 't2', '競合他社の調査', 'p1', 't1', 2, '価格と機能に焦点', 1
+    UNION ALL SELECT 't3', 'プレゼンテーション準備', 'p1', 't1', 3, 'スライド作成', 1
+    UNION ALL SELECT 't4', '通常業務レポート', 'p1', NULL, 5, '週次レポート', 0
+    UNION ALL SELECT 't5', 'データ収集', 'p1', 't4', 4, '統計データ', 1
+    UNION ALL SELECT 't6', 'レポート執筆', 'p1', 't4', 5, 'グラフ作成含む', 1
+    -- 個人プロジェクト
+    UNION ALL SELECT 't7', '食料品の買い物', 'p2', NULL, 0, '牛乳と卵', 0
+    UNION ALL SELECT 't8', '家計簿整理', 'p2', NULL, 2, '月末締め', 0
+    -- 学習プロジェクト
+    UNION ALL SELECT 't9', 'React学習', 'p3', NULL, 7, 'オンラインコース', 0
+    UNION ALL SELECT 't10', '基礎概念理解', 'p3', 't9', 3, 'JSX、コンポーネント', 1
+    UNION ALL SELECT 't11', '実践演習', 'p3', 't9', 7, 'ToDoアプリ構築', 1
+    UNION ALL SELECT 't12', 'デプロイ練習', 'p3', 't11', 10, 'Vercel使用', 2
+) v;
+
+-- 階層インデックス（task_closure）はアプリケーション側で保守されるため、投入したタスク分をここで登録
+WITH RECURSIVE up(descendant_id, ancestor_id, depth) AS (
+    SELECT id, id, 0 FROM tasks
+    UNION ALL
+    SELECT up.descendant_id, p.id, up.depth + 1
+    FROM up
+    JOIN tasks t ON t.id = up.ancestor_id
+    JOIN tasks p ON p.id = t.parent_id
+    WHERE up.depth < 64
+)
+INSERT OR REPLACE INTO task_closure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth FROM up;
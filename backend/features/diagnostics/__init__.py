@@ -0,0 +1,8 @@
+"""
+Diagnostics feature module.
+システムプロンプト準拠：データベース診断エンドポイントの統一エクスポート
+"""
+
+from .routes import router as diagnostics_router
+
+__all__ = ['diagnostics_router']
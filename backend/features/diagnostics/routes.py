@@ -0,0 +1,45 @@
+"""
+データベース診断APIルート
+システムプロンプト準拠：KISS原則、オプトインの診断情報公開
+"""
+from fastapi import APIRouter, HTTPException
+
+from core.database import DatabaseManager
+from core.query_profiler import get_query_profiler
+from core.query_metrics import get_query_metrics
+from core.logger import get_logger
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+logger = get_logger(__name__)
+
+@router.get("/query-stats")
+async def get_query_stats():
+    """文の形ごとのレイテンシ分布（p50/p95/p99）・呼び出し回数・行数"""
+    return DatabaseManager().get_query_stats()
+
+@router.delete("/query-stats")
+async def reset_query_stats():
+    """収集済みのレイテンシ統計を破棄"""
+    get_query_metrics().reset()
+    logger.info("Query latency statistics reset")
+    return {"message": "Query latency statistics reset"}
+
+@router.get("/query-plans")
+async def get_query_plans():
+    """
+    文の形ごとのクエリプラン・呼び出し統計とインデックス提案
+    DB_QUERY_PROFILING=true で起動した場合のみ収集される
+    """
+    try:
+        db_manager = DatabaseManager()
+        return await db_manager.run_sync(db_manager.get_query_plan_report)
+    except Exception as e:
+        logger.error(f"Failed to build query plan report: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.delete("/query-plans")
+async def reset_query_plans():
+    """収集済みのクエリプラン・統計を破棄"""
+    get_query_profiler().reset()
+    logger.info("Query plan statistics reset")
+    return {"message": "Query plan statistics reset"}
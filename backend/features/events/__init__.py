@@ -0,0 +1,9 @@
+"""
+Events feature module.
+システムプロンプト準拠：変更通知（SSE）エンドポイントの統一エクスポート
+"""
+
+from .routes import router as events_router
+from .broker import close_change_brokers
+
+__all__ = ['events_router', 'close_change_brokers']
@@ -0,0 +1,160 @@
+"""
+変更通知ブローカー
+システムプロンプト準拠：KISS原則、変更履歴の追跡による1プロセス1本のポーリング
+
+change_log（マイグレーション 0005 / 0007）はトリガーで保守されるため、TaskService / ProjectService を含む
+すべての書き込み（他のワーカープロセスを含む）がここに現れる。ブローカーは専用接続で
+PRAGMA data_version を監視し、他の接続がコミットした時だけ change_log を seq の範囲検索で読む。
+読み取った変更は購読者ごとの上限付きキューへ振り分け、キューが満杯の購読者には
+未送信分を破棄して再同期（GET /api/changes）を指示する。
+"""
+import asyncio
+import sqlite3
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.config import config
+from core.database import DatabaseManager
+from core.exceptions import BusinessLogicError
+from core.logger import get_logger, LogCategory
+
+logger = get_logger(__name__)
+
+# 1回の確認で読む変更の最大件数（超える場合は待たずに続きを読む）
+POLL_BATCH_LIMIT = 1000
+
+# キューに積むイベント（イベント名, seq, データ）
+Event = Tuple[str, int, Dict[str, Any]]
+
+class Subscription:
+    """1クライアントの購読（プロジェクト絞り込みと上限付きバッファ）"""
+
+    def __init__(self, project_ids: Optional[Set[str]], buffer_size: int, last_seq: int):
+        self.project_ids = project_ids
+        self.queue: 'asyncio.Queue[Event]' = asyncio.Queue(maxsize=buffer_size)
+        # クライアントへ送信済みの最新 seq（再同期の起点）
+        self.sent_seq = last_seq
+        self.overflows = 0
+
+    def matches(self, change: Dict[str, Any]) -> bool:
+        if self.project_ids is None:
+            return True
+        return (change.get('project_id') in self.project_ids
+                or change.get('previous_project_id') in self.project_ids)
+
+    def offer(self, seq: int, changes: List[Dict[str, Any]]) -> None:
+        """変更を非ブロッキングで追加（満杯時はバッファを捨てて再同期イベントに置き換える）"""
+        selected = [change for change in changes if self.matches(change)]
+        if not selected:
+            return
+        try:
+            self.queue.put_nowait(('changes', seq, {'seq': seq, 'changes': selected}))
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.overflows += 1
+            self.queue.put_nowait(('resync', seq, {'since': self.sent_seq}))
+            logger.warning(f"Event buffer overflow, client asked to resync from {self.sent_seq}")
+
+class ChangeBroker:
+    """change_log を追跡し、購読者へ変更を配信する（プロセスごとに1つ）"""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self.last_seq = 0
+        self._subscribers: Set[Subscription] = set()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def subscribe(self, project_ids: Optional[Set[str]] = None) -> Subscription:
+        """購読の登録（購読者がいない間は停止しているポーリングを再開する）"""
+        async with self._lock:
+            if len(self._subscribers) >= config.events_max_clients:
+                raise BusinessLogicError(f"Too many event subscribers (max {config.events_max_clients})")
+            if self._task is None or self._task.done():
+                self.last_seq = await self.db_manager.run_sync(self._start)
+                self._task = asyncio.get_running_loop().create_task(self._run())
+            subscription = Subscription(project_ids, config.events_client_buffer, self.last_seq)
+            self._subscribers.add(subscription)
+        logger.info(f"Event subscriber added ({len(self._subscribers)} active)")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+        logger.info(f"Event subscriber removed ({len(self._subscribers)} active)")
+
+    def close(self) -> None:
+        """ポーリングの停止と専用接続のクローズ（アプリケーション終了時）"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _start(self) -> int:
+        """専用接続の準備と現在位置の取得（購読者のいない間の変更は配信しない）"""
+        if self._conn is None:
+            self._conn = self.db_manager.pool.create_connection()
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0]
+
+    def _poll(self) -> List[Dict[str, Any]]:
+        """他の接続のコミットがあれば last_seq 以降の変更を読む（なければ PRAGMA 1回のみ）"""
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return []
+        rows = self._conn.execute(
+            """SELECT seq, entity, entity_id, op, project_id, previous_project_id
+               FROM change_log WHERE seq > ? ORDER BY seq LIMIT ?""",
+            (self.last_seq, POLL_BATCH_LIMIT)
+        ).fetchall()
+        # 上限まで読んだ場合は data_version を更新せず、次回も続きを読む
+        if len(rows) < POLL_BATCH_LIMIT:
+            self._data_version = data_version
+        changes = []
+        for row in rows:
+            change = {'seq': row['seq'], 'entity': row['entity'], 'id': row['entity_id'],
+                      'op': row['op'], 'project_id': row['project_id']}
+            if row['previous_project_id'] is not None:
+                change['previous_project_id'] = row['previous_project_id']
+            changes.append(change)
+        return changes
+
+    async def _run(self) -> None:
+        interval = config.events_poll_interval_ms / 1000
+        logger.info("Change broker started", category=LogCategory.DATABASE)
+        while self._subscribers:
+            try:
+                changes = await self.db_manager.run_sync(self._poll)
+            except sqlite3.Error as e:
+                logger.error(f"Change broker poll failed: {e}")
+                changes = []
+            if changes:
+                self.last_seq = changes[-1]['seq']
+                for subscription in list(self._subscribers):
+                    subscription.offer(self.last_seq, changes)
+                if len(changes) == POLL_BATCH_LIMIT:
+                    continue
+            await asyncio.sleep(interval)
+        logger.info("Change broker stopped (no subscribers)", category=LogCategory.DATABASE)
+
+# データベースファイルごとのブローカー
+_brokers: Dict[str, ChangeBroker] = {}
+
+def get_change_broker(db_manager: DatabaseManager) -> ChangeBroker:
+    key = str(db_manager.db_path)
+    broker = _brokers.get(key)
+    if broker is None:
+        broker = _brokers[key] = ChangeBroker(db_manager)
+    return broker
+
+def close_change_brokers() -> None:
+    for broker in _brokers.values():
+        broker.close()
+    _brokers.clear()
@@ -0,0 +1,75 @@
+"""
+変更通知APIルート
+システムプロンプト準拠：KISS原則、ポーリングに代わるServer-Sent Events配信
+"""
+import asyncio
+import json
+from typing import List, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from core.config import config
+from core.database import DatabaseManager
+from core.exceptions import BusinessLogicError
+from core.logger import get_logger
+from .broker import get_change_broker
+
+router = APIRouter(prefix="/events", tags=["events"])
+logger = get_logger(__name__)
+
+def _format_event(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    """SSEの1イベント（id はクライアントの Last-Event-ID として再接続時に返る）"""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+    return "\n".join(lines) + "\n\n"
+
+@router.get("")
+async def stream_events(
+    projectId: Optional[List[str]] = Query(None, description="購読するプロジェクトID（複数指定可、未指定で全件）"),
+    since: Optional[int] = Query(None, ge=0, description="受信済みの最新 seq（GET /api/changes の next_since）"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    プロジェクト・タスクの変更通知をSSEで配信
+    ready: 接続時の現在位置 / changes: 変更のバッチ / resync: GET /api/changes?since= での再取得を要求
+    """
+    broker = get_change_broker(DatabaseManager())
+    try:
+        subscription = await broker.subscribe(set(projectId) if projectId else None)
+    except BusinessLogicError as e:
+        logger.warning(f"Event subscription rejected: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
+
+    # 再接続時は Last-Event-ID、初回は since を受信済みの位置とする
+    resume_from = since
+    if last_event_id and last_event_id.isdigit():
+        resume_from = int(last_event_id)
+
+    async def body():
+        try:
+            yield _format_event('ready', {'seq': subscription.sent_seq}, subscription.sent_seq)
+            if resume_from is not None and resume_from < subscription.sent_seq:
+                yield _format_event('resync', {'since': resume_from})
+            while True:
+                try:
+                    event, seq, data = await asyncio.wait_for(
+                        subscription.queue.get(), config.events_keepalive_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event == 'changes':
+                    subscription.sent_seq = seq
+                    yield _format_event(event, data, seq)
+                else:
+                    yield _format_event(event, data)
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,8 @@
+"""
+Sync feature module.
+システムプロンプト準拠：差分同期エンドポイントの統一エクスポート
+"""
+
+from .routes import router as sync_router
+
+__all__ = ['sync_router']
@@ -0,0 +1,32 @@
+"""
+差分同期APIルート
+システムプロンプト準拠：KISS原則、キャッシュ済みクライアント向けの差分取得
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from core.database import DatabaseManager
+from core.logger import get_logger
+from .service import SyncService
+
+router = APIRouter(prefix="/changes", tags=["sync"])
+logger = get_logger(__name__)
+
+def get_sync_service() -> SyncService:
+    """差分同期サービスの依存性注入"""
+    return SyncService(DatabaseManager())
+
+@router.get("")
+async def get_changes(
+    since: int = Query(0, ge=0, description="前回レスポンスの next_since（0で全件）"),
+    limit: int = Query(1000, ge=1, le=10000, description="1回で返す変更の最大件数"),
+    service: SyncService = Depends(get_sync_service)
+):
+    """
+    since より後に変更されたプロジェクト・タスクと削除されたIDの取得
+    has_more が true の間は next_since を since に渡して続きを取得する
+    """
+    try:
+        return await service.get_changes_async(since, limit)
+    except Exception as e:
+        logger.error(f"Failed to get changes: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,84 @@
+"""
+差分同期サービス
+システムプロンプト準拠：KISS原則、変更履歴の範囲検索による差分取得
+
+change_log（マイグレーション 0005）はトリガーで保守され、レコードごとに最新の変更1行と
+単調増加する seq を持つ。クライアントは前回の next_since を since に渡すことで、
+それ以降に変更・削除されたレコードだけを1回のインデックス範囲検索で取得できる。
+"""
+from typing import Any, Dict
+
+from core.database import DatabaseManager, async_variant
+from core.logger import get_logger
+from features.tasklist.services.project_service import ProjectService, PROJECT_RESPONSE_COLUMNS
+from features.tasklist.services.task_service import TaskService, TASK_RESPONSE_COLUMNS
+
+logger = get_logger(__name__)
+
+def qualify_columns(columns: str, alias: str) -> str:
+    """カンマ区切りの列一覧をテーブル別名で修飾"""
+    return ", ".join(f"{alias}.{column.strip()}" for column in columns.split(","))
+
+class SyncService:
+    """差分同期サービス"""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+
+    def get_changes(self, since: int = 0, limit: int = 1000) -> Dict[str, Any]:
+        """
+        since より後の変更を seq 順に最大 limit 件取得
+        全クエリを1つの読み取りトランザクションで実行し、変更一覧と行の内容を一致させる
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN")
+                try:
+                    latest_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0]
+                    changes = conn.execute(
+                        "SELECT seq, entity, entity_id, op FROM change_log WHERE seq > ? ORDER BY seq LIMIT ?",
+                        (since, limit + 1)
+                    ).fetchall()
+                    has_more = len(changes) > limit
+                    changes = changes[:limit]
+                    until = changes[-1]['seq'] if changes else latest_seq
+
+                    # 単項 + で (entity, entity_id) のインデックスを使わせず、seq の範囲検索に限定する
+                    # 列は x. で修飾する（change_log にも project_id があるため）
+                    rows = {}
+                    for entity, table, columns in (
+                        ('project', 'projects', PROJECT_RESPONSE_COLUMNS),
+                        ('task', 'tasks', TASK_RESPONSE_COLUMNS),
+                    ):
+                        rows[entity] = self.db_manager.fetch_rows(conn.execute(
+                            f"""SELECT {qualify_columns(columns, 'x')} FROM change_log c JOIN {table} x ON x.id = c.entity_id
+                                WHERE c.seq > ? AND c.seq <= ? AND +c.entity = ? AND c.op = 'upsert'
+                                ORDER BY c.seq""",
+                            (since, until, entity)
+                        ))
+                finally:
+                    conn.rollback()
+
+            deleted = {'projects': [], 'tasks': []}
+            for change in changes:
+                if change['op'] == 'delete':
+                    deleted[change['entity'] + 's'].append(change['entity_id'])
+
+            logger.info(f"Retrieved {len(changes)} changes since {since} (latest {latest_seq})")
+            return {
+                'since': since,
+                'next_since': until,
+                'latest_seq': latest_seq,
+                'has_more': has_more,
+                # 変更履歴より新しい since はデータベースの再作成等を示すため、全件の再取得が必要
+                'reset': since > latest_seq,
+                'projects': [ProjectService.serialize_row(row) for row in rows['project']],
+                'tasks': [TaskService.serialize_row(row) for row in rows['task']],
+                'deleted': deleted
+            }
+        except Exception as e:
+            logger.error(f"Failed to retrieve changes since {since}: {e}")
+            raise
+
+    # 非同期版（ルートハンドラー用：DB専用エグゼキューターで実行）
+    get_changes_async = async_variant(get_changes)
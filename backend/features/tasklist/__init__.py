@@ -5,8 +5,9 @@ Tasklist feature module.
 
 from .routes.projects import router as projects_router
 from .routes.tasks import router as tasks_router
+from .routes.timeline import router as timeline_router
 
 # 機能内ルーター統合
-tasklist_router = [projects_router, tasks_router]
+tasklist_router = [projects_router, tasks_router, timeline_router]
 
-__all__ = ['tasklist_router', 'projects_router', 'tasks_router']
\ No newline at end of file
+__all__ = ['tasklist_router', 'projects_router', 'tasks_router', 'timeline_router']
\ No newline at end of file
@@ -5,5 +5,6 @@ Tasklist routes module.
 
 from .projects import router as projects_router
 from .tasks import router as tasks_router
+from .timeline import router as timeline_router
 
-__all__ = ['projects_router', 'tasks_router']
\ No newline at end of file
+__all__ = ['projects_router', 'tasks_router', 'timeline_router']
\ No newline at end of file
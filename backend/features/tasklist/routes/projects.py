@@ -2,11 +2,13 @@
 プロジェクト関連APIルート
 システムプロンプト準拠：KISS原則、シンプルな標準ロギング
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from core.database import DatabaseManager
 from core.logger import get_logger
+from api.conditional import make_etag, etag_matches, etag_headers, not_modified_response
+from api.streaming import streaming_json_response, STREAM_FORMAT_PATTERN
 from ..services.project_service import ProjectService
 from ..schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
 
@@ -19,11 +21,25 @@ def get_project_service() -> ProjectService:
 
 @router.get("/", response_model=List[ProjectResponse])
 async def get_projects(
+    request: Request,
+    response: Response,
+    stream: Optional[str] = Query(None, pattern=STREAM_FORMAT_PATTERN, description="json / ndjson でストリーミング返却"),
     service: ProjectService = Depends(get_project_service)
 ):
-    """プロジェクト一覧取得"""
+    """
+    プロジェクト一覧取得（stream指定時はバッチ単位で逐次返す）
+    If-None-Match が現在の ETag に一致する場合は一覧を読まずに 304 を返す
+    """
     try:
-        projects = service.get_all_projects()
+        etag = make_etag(await service.get_list_version_async(), stream)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        if stream:
+            streamed = await streaming_json_response(service.stream_projects(), stream, service.serialize_row)
+            streamed.headers.update(etag_headers(etag))
+            return streamed
+        projects = await service.get_all_projects_async()
+        response.headers.update(etag_headers(etag))
         logger.info("Projects retrieved successfully")
         return projects
     except Exception as e:
@@ -37,8 +53,8 @@ async def create_project(
 ):
     """プロジェクト作成"""
     try:
-        created_project = service.create_project(project.dict())
-        logger.info(f"Project created successfully: {created_project.id}")
+        created_project = await service.create_project_async(project.dict())
+        logger.info(f"Project created successfully: {created_project['id']}")
         return created_project
     except Exception as e:
         logger.error(f"Failed to create project: {e}")
@@ -51,7 +67,7 @@ async def get_project(
 ):
     """プロジェクト詳細取得"""
     try:
-        project = service.get_project_by_id(project_id)
+        project = await service.get_project_by_id_async(project_id)
         logger.info(f"Project retrieved successfully: {project_id}")
         return project
     except Exception as e:
@@ -66,7 +82,7 @@ async def update_project(
 ):
     """プロジェクト更新"""
     try:
-        updated_project = service.update_project(
+        updated_project = await service.update_project_async(
             project_id, 
             project.dict(exclude_unset=True)
         )
@@ -83,7 +99,7 @@ async def delete_project(
 ):
     """プロジェクト削除"""
     try:
-        service.delete_project(project_id)
+        await service.delete_project_async(project_id)
         logger.info(f"Project deleted successfully: {project_id}")
         return {"message": "Project deleted successfully"}
     except Exception as e:
@@ -3,12 +3,19 @@
 システムプロンプト準拠：KISS原則、シンプルな標準ロギング
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from core.database import DatabaseManager
+from core.exceptions import ValidationError, NotFoundError
 from core.logger import get_logger
+from api.conditional import make_etag, etag_matches, etag_headers, not_modified_response
+from api.streaming import streaming_json_response, STREAM_FORMAT_PATTERN
 from ..services.task_service import TaskService
-from ..schemas.task import TaskCreate, TaskUpdate, TaskResponse, BatchTaskOperation, BatchDateShiftOperation
+from ..schemas.task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskHierarchyResponse, TaskSearchResponse,
+    TaskMove, TaskMoveResponse, BulkTaskCreate, BatchTaskOperation, BatchDateShiftOperation
+)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 logger = get_logger(__name__)
@@ -19,17 +26,61 @@ def get_task_service() -> TaskService:
 
 @router.get("/", response_model=List[TaskResponse])
 async def get_tasks(
+    request: Request,
+    response: Response,
     projectId: Optional[str] = Query(None),
+    completed: Optional[bool] = Query(None),
+    dueFrom: Optional[datetime] = Query(None),
+    dueTo: Optional[datetime] = Query(None),
+    assignee: Optional[str] = Query(None),
+    level: Optional[int] = Query(None, ge=0),
+    parentId: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="ページサイズ（指定時のみページング）"),
+    cursor: Optional[str] = Query(None, description="前ページの X-Next-Cursor"),
+    stream: Optional[str] = Query(None, pattern=STREAM_FORMAT_PATTERN, description="json / ndjson でストリーミング返却"),
     service: TaskService = Depends(get_task_service)
 ):
-    """タスク一覧取得"""
+    """
+    タスク一覧取得
+    limit指定時は次ページのカーソルを X-Next-Cursor ヘッダーで返す
+    stream指定時は全件をバッチ単位で逐次返す（ページングとは併用不可）
+    If-None-Match が現在の ETag に一致する場合はタスクを読まずに 304 を返す
+    """
     try:
-        tasks = service.get_tasks(projectId)
+        filters = {
+            'completed': completed,
+            'due_from': dueFrom.isoformat() if dueFrom else None,
+            'due_to': dueTo.isoformat() if dueTo else None,
+            'assignee': assignee,
+            'level': level,
+            'parent_id': parentId,
+        }
+        if stream and (limit or cursor):
+            raise ValidationError("stream cannot be combined with limit or cursor")
+        etag = make_etag(
+            await service.get_list_version_async(projectId),
+            projectId, sorted(filters.items()), limit, cursor, stream
+        )
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        if stream:
+            streamed = await streaming_json_response(
+                service.stream_tasks(projectId, filters), stream, service.serialize_row
+            )
+            streamed.headers.update(etag_headers(etag))
+            return streamed
+        page = await service.get_tasks_page_async(projectId, filters, limit, cursor)
+        response.headers.update(etag_headers(etag))
+        if page['next_cursor']:
+            response.headers["X-Next-Cursor"] = page['next_cursor']
         if projectId:
             logger.info(f"Tasks retrieved successfully for project: {projectId}")
         else:
             logger.info("All tasks retrieved successfully")
-        return tasks
+        return page['items']
+    except ValidationError as e:
+        logger.error(f"Invalid task list request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get tasks: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -50,7 +101,7 @@ async def create_task(
         if task_dict.get('completion_date'):
             task_dict['completion_date'] = task_dict['completion_date'].isoformat()
         
-        created_task_dict = service.create_task(task_dict)
+        created_task_dict = await service.create_task_async(task_dict)
         
         # 辞書からTaskResponseモデルに変換
         created_task = TaskResponse(**created_task_dict)
@@ -61,24 +112,89 @@ async def create_task(
         logger.error(f"Failed to create task: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/search", response_model=List[TaskSearchResponse])
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description="検索語（空白区切りで全語を含むタスク）"),
+    projectId: Optional[str] = Query(None),
+    completed: Optional[bool] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    service: TaskService = Depends(get_task_service)
+):
+    """タスク名・メモの全文検索（関連度順）"""
+    try:
+        tasks = await service.search_tasks_async(q, projectId, completed, limit)
+        logger.info(f"Task search completed: {len(tasks)} results")
+        return tasks
+    except ValidationError as e:
+        logger.error(f"Invalid task search: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to search tasks: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: str,
+    request: Request,
+    response: Response,
     service: TaskService = Depends(get_task_service)
 ):
-    """タスク詳細取得"""
+    """タスク詳細取得（If-None-Match が一致する場合は 304）"""
     try:
-        task = service.get_task_by_id(task_id)
+        version = await service.get_task_version_async(task_id)
+        if version:
+            etag = make_etag(version)
+            if etag_matches(request, etag):
+                return not_modified_response(etag)
+            response.headers.update(etag_headers(etag))
+        task = await service.get_task_by_id_async(task_id)
         logger.info(f"Task retrieved successfully: {task_id}")
         return task
     except Exception as e:
         logger.error(f"Failed to get task {task_id}: {e}")
         raise HTTPException(status_code=404, detail=str(e))
 
+@router.get("/{task_id}/subtree", response_model=List[TaskHierarchyResponse])
+async def get_task_subtree(
+    task_id: str,
+    maxDepth: Optional[int] = Query(None, ge=0, description="取得する最大深さ（0はルートのみ）"),
+    service: TaskService = Depends(get_task_service)
+):
+    """サブツリー取得（表示順）"""
+    try:
+        tasks = await service.get_subtree_async(task_id, maxDepth)
+        logger.info(f"Subtree retrieved successfully: {task_id}")
+        return tasks
+    except NotFoundError as e:
+        logger.error(f"Failed to get subtree of {task_id}: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to get subtree of {task_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{task_id}/ancestors", response_model=List[TaskHierarchyResponse])
+async def get_task_ancestors(
+    task_id: str,
+    includeSelf: bool = Query(False, description="対象タスク自身を末尾に含める"),
+    service: TaskService = Depends(get_task_service)
+):
+    """祖先パス取得（ルートから順）"""
+    try:
+        tasks = await service.get_ancestors_async(task_id, includeSelf)
+        logger.info(f"Ancestors retrieved successfully: {task_id}")
+        return tasks
+    except NotFoundError as e:
+        logger.error(f"Failed to get ancestors of {task_id}: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to get ancestors of {task_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.put("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: str,
     task: TaskUpdate,
+    propagate: bool = Query(False, description="完了状態の変更を子孫・祖先へ伝播する"),
     service: TaskService = Depends(get_task_service)
 ):
     """タスク更新"""
@@ -89,13 +205,34 @@ async def update_task(
             if date_field in task_dict and task_dict[date_field] is not None:
                 task_dict[date_field] = task_dict[date_field].isoformat()
         
-        updated_task = service.update_task(task_id, task_dict)
+        updated_task = await service.update_task_async(task_id, task_dict, propagate)
         logger.info(f"Task updated successfully: {task_id}")
         return updated_task
     except Exception as e:
         logger.error(f"Failed to update task {task_id}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/{task_id}/move", response_model=TaskMoveResponse)
+async def move_task(
+    task_id: str,
+    target: TaskMove,
+    service: TaskService = Depends(get_task_service)
+):
+    """サブツリー移動（親・プロジェクトの付け替えと子孫の階層レベルの書き換え）"""
+    try:
+        moved_task = await service.move_task_async(task_id, target.dict(exclude_unset=True))
+        logger.info(f"Task moved successfully: {task_id} ({moved_task['moved_count']} tasks)")
+        return moved_task
+    except NotFoundError as e:
+        logger.error(f"Failed to move task {task_id}: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValidationError as e:
+        logger.error(f"Invalid move of task {task_id}: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to move task {task_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.delete("/{task_id}")
 async def delete_task(
     task_id: str,
@@ -103,13 +240,39 @@ async def delete_task(
 ):
     """タスク削除"""
     try:
-        service.delete_task(task_id)
+        await service.delete_task_async(task_id)
         logger.info(f"Task deleted successfully: {task_id}")
         return {"message": "Task deleted successfully"}
     except Exception as e:
         logger.error(f"Failed to delete task {task_id}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/bulk")
+async def bulk_create_tasks(
+    payload: BulkTaskCreate,
+    service: TaskService = Depends(get_task_service)
+):
+    """タスク一括作成（アウトライン貼り付け等、1トランザクションで作成）"""
+    try:
+        items = []
+        for task in payload.tasks:
+            task_dict = task.dict()
+            for field in ('start_date', 'due_date', 'completion_date'):
+                if task_dict.get(field):
+                    task_dict[field] = task_dict[field].isoformat()
+            items.append(task_dict)
+        
+        result = await service.bulk_create_tasks_async(items)
+        logger.info(f"Bulk task creation completed: {result['created_count']} tasks")
+        return {
+            "message": f"Created {result['created_count']} tasks",
+            "created_count": result['created_count'],
+            "id_map": result['id_map']
+        }
+    except Exception as e:
+        logger.error(f"Failed to bulk create tasks: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/batch")
 async def batch_update_tasks(
     operation: BatchTaskOperation,
@@ -117,19 +280,26 @@ async def batch_update_tasks(
 ):
     """タスク一括操作"""
     try:
-        result = service.batch_update_tasks(operation.operation, operation.task_ids)
+        result = await service.batch_update_tasks_async(operation.operation, operation.task_ids, operation.propagate)
         
         if result['success']:
             logger.info(f"Batch operation '{operation.operation}' completed successfully for {len(operation.task_ids)} tasks")
-            return {
+            response = {
                 "message": f"Batch operation '{operation.operation}' completed successfully",
                 "affected_count": result['affected_count'],
                 "task_ids": operation.task_ids
             }
+            if 'id_map' in result:
+                response["id_map"] = result['id_map']
+            if 'propagated_count' in result:
+                response["propagated_count"] = result['propagated_count']
+            return response
         else:
             logger.error(f"Batch operation '{operation.operation}' failed: {result.get('error', 'Unknown error')}")
             raise HTTPException(status_code=400, detail=result.get('error', 'Batch operation failed'))
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to execute batch operation '{operation.operation}': {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -141,7 +311,7 @@ async def batch_shift_task_dates(
 ):
     """タスクの日付を一括でずらす"""
     try:
-        result = service.batch_shift_dates(
+        result = await service.batch_shift_dates_async(
             operation.task_ids,
             operation.shift_type,
             operation.direction,
@@ -153,7 +323,9 @@ async def batch_shift_task_dates(
             return {
                 "message": result['message'],
                 "affected_count": result['affected_count'],
-                "task_ids": operation.task_ids
+                "task_ids": operation.task_ids,
+                "updated": result['updated'],
+                "failed": result['failed']
             }
         else:
             logger.error(f"Batch date shift failed: {result.get('error', 'Unknown error')}")
@@ -0,0 +1,39 @@
+"""
+タイムラインAPIルート
+システムプロンプト準拠：KISS原則、表示期間と重なるタスクのみを返却
+"""
+from typing import List, Optional
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from core.database import DatabaseManager
+from core.exceptions import ValidationError
+from core.logger import get_logger
+from ..services.task_service import TaskService
+from ..schemas.task import TaskResponse
+
+router = APIRouter(prefix="/timeline", tags=["timeline"])
+logger = get_logger(__name__)
+
+def get_task_service() -> TaskService:
+    """タスクサービスの依存性注入"""
+    return TaskService(DatabaseManager())
+
+@router.get("", response_model=List[TaskResponse])
+async def get_timeline_tasks(
+    window_from: datetime = Query(..., alias="from", description="表示期間の開始"),
+    window_to: datetime = Query(..., alias="to", description="表示期間の終了"),
+    projectId: Optional[str] = Query(None),
+    service: TaskService = Depends(get_task_service)
+):
+    """表示期間と開始日〜期限日が重なるタスクの取得（期間の両端を含む）"""
+    try:
+        tasks = await service.get_timeline_tasks_async(window_from.isoformat(), window_to.isoformat(), projectId)
+        logger.info(f"Timeline tasks retrieved successfully: {len(tasks)} tasks")
+        return tasks
+    except ValidationError as e:
+        logger.error(f"Invalid timeline request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to get timeline tasks: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -4,9 +4,14 @@ Tasklist schemas module.
 """
 
 from .project import ProjectCreate, ProjectUpdate, ProjectResponse
-from .task import TaskCreate, TaskUpdate, TaskResponse, BatchTaskOperation
+from .task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskHierarchyResponse, TaskSearchResponse, TaskMove, TaskMoveResponse,
+    BulkTaskItem, BulkTaskCreate, BatchTaskOperation
+)
 
 __all__ = [
     'ProjectCreate', 'ProjectUpdate', 'ProjectResponse',
-    'TaskCreate', 'TaskUpdate', 'TaskResponse', 'BatchTaskOperation'
+    'TaskCreate', 'TaskUpdate', 'TaskResponse', 'TaskHierarchyResponse', 'TaskSearchResponse',
+    'TaskMove', 'TaskMoveResponse',
+    'BulkTaskItem', 'BulkTaskCreate', 'BatchTaskOperation'
 ]
\ No newline at end of file
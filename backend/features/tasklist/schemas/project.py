@@ -27,6 +27,9 @@ class ProjectResponse(ProjectBase):
     id: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    task_count: Optional[int] = Field(None, ge=0, description="タスク数")
+    completed_task_count: Optional[int] = Field(None, ge=0, description="完了済みタスク数")
+    overdue_task_count: Optional[int] = Field(None, ge=0, description="期限切れの未完了タスク数")
     
     class Config:
         from_attributes = True
@@ -43,6 +43,8 @@ class TaskResponse(TaskBase):
     id: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    child_count: Optional[int] = Field(None, ge=0, description="直下の子タスク数")
+    completed_child_count: Optional[int] = Field(None, ge=0, description="直下の完了済み子タスク数")
     
     class Config:
         from_attributes = True
@@ -50,10 +52,39 @@ class TaskResponse(TaskBase):
             datetime: lambda v: v.isoformat() if v else None
         }
 
+class TaskHierarchyResponse(TaskResponse):
+    """階層取得（サブツリー・祖先パス）レスポンススキーマ"""
+    depth: int = Field(..., ge=0, description="基点からの深さ")
+
+class TaskSearchResponse(TaskResponse):
+    """全文検索レスポンススキーマ（本文はHTMLエスケープ済み、強調箇所は <mark>〜</mark>）"""
+    score: Optional[float] = Field(None, description="bm25スコア（小さいほど関連度が高い、索引を使わない検索ではnull）")
+    name_highlight: str = Field(..., description="一致箇所を強調したタスク名（HTMLエスケープ済み）")
+    notes_snippet: Optional[str] = Field(None, description="一致箇所周辺のメモ抜粋（HTMLエスケープ済み）")
+
+class TaskMove(BaseModel):
+    """サブツリー移動スキーマ（指定した項目のみ変更、parent_id: null はルートへの移動）"""
+    parent_id: Optional[str] = Field(None, description="新しい親タスクID")
+    project_id: Optional[str] = Field(None, description="新しいプロジェクトID（親を指定した場合は親のプロジェクトと一致すること）")
+
+class TaskMoveResponse(TaskResponse):
+    """サブツリー移動レスポンススキーマ"""
+    moved_count: int = Field(..., ge=0, description="書き換えたタスク数（移動したタスク自身を含む）")
+
+class BulkTaskItem(TaskBase):
+    """一括作成の1行分（同一ペイロード内の親はクライアント側の一時IDで参照）"""
+    temp_id: str = Field(..., min_length=1, description="クライアント側の一時ID")
+    parent_temp_id: Optional[str] = Field(None, description="親タスクの一時ID（同一ペイロード内の先行行）")
+
+class BulkTaskCreate(BaseModel):
+    """タスク一括作成スキーマ"""
+    tasks: List[BulkTaskItem] = Field(..., min_items=1, max_items=10000, description="作成するタスク（親を子より先に並べる）")
+
 class BatchTaskOperation(BaseModel):
     """タスク一括操作スキーマ"""
     operation: str = Field(..., pattern="^(complete|incomplete|delete|copy)$", description="操作種別")
     task_ids: List[str] = Field(..., min_items=1, description="対象タスクIDリスト")
+    propagate: bool = Field(False, description="完了状態を子孫・祖先へ伝播する（complete / incomplete のみ）")
 
 class BatchDateShiftOperation(BaseModel):
     """タスク日付一括変更スキーマ"""
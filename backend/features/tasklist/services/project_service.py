@@ -2,16 +2,28 @@
 プロジェクトサービス
 システムプロンプト準拠：DRY原則、ビジネスロジック集約
 """
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, AsyncIterator
 
-from core.database import DatabaseManager
+from core.data_versions import PROJECTS_SCOPE, TASKS_SCOPE, read_versions
+from core.database import DatabaseManager, async_variant
 from core.exceptions import NotFoundError, ValidationError
+from core.id_generator import new_id
 from core.logger import get_logger
+from core.utils.dates import now_epoch_ms
 from core.utils.validators import validate_project_data
 
 logger = get_logger(__name__)
 
+# ストリーミング・差分同期の応答で返す列（ProjectResponse と同じ項目）
+PROJECT_RESPONSE_COLUMNS = "id, name, color, collapsed, created_at, updated_at"
+
+# タスク件数の集計列（project_rollups の主キー検索と、期限切れ件数は索引の範囲カウント）。パラメーターは現在時刻
+PROJECT_ROLLUP_COLUMNS = """
+    COALESCE((SELECT task_count FROM project_rollups WHERE project_id = projects.id), 0) AS task_count,
+    COALESCE((SELECT completed_count FROM project_rollups WHERE project_id = projects.id), 0) AS completed_task_count,
+    (SELECT count(*) FROM tasks
+     WHERE tasks.project_id = projects.id AND tasks.completed = 0 AND tasks.due_epoch < ?) AS overdue_task_count"""
+
 class ProjectService:
     """プロジェクト操作サービス"""
     
@@ -22,7 +34,7 @@ class ProjectService:
         """全プロジェクト取得"""
         try:
             projects = self.db_manager.execute_query(
-                "SELECT * FROM projects ORDER BY created_at"
+                f"SELECT *, {PROJECT_ROLLUP_COLUMNS} FROM projects ORDER BY created_epoch", (now_epoch_ms(),)
             )
             
             logger.info(f"Retrieved {len(projects)} projects")
@@ -31,11 +43,36 @@ class ProjectService:
             logger.error(f"Failed to retrieve projects: {e}")
             raise
     
+    def stream_projects(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """全プロジェクトのストリーミング取得（fetchmany のバッチ単位）"""
+        return self.db_manager.stream_batches(
+            f"SELECT {PROJECT_RESPONSE_COLUMNS}, {PROJECT_ROLLUP_COLUMNS} FROM projects ORDER BY created_epoch",
+            (now_epoch_ms(),)
+        )
+    
+    def get_list_version(self) -> str:
+        """
+        プロジェクト一覧のバージョン
+        集計列を含むため、タスクのバージョンと次に期限切れになる時刻（時刻経過による件数変化）も含める
+        """
+        version = read_versions(self.db_manager, PROJECTS_SCOPE, TASKS_SCOPE)
+        next_overdue = self.db_manager.execute_query(
+            "SELECT MIN(due_epoch) AS due_epoch FROM tasks WHERE completed = 0 AND due_epoch >= ?",
+            (now_epoch_ms(),)
+        )[0]['due_epoch']
+        return f"{version}.{next_overdue or 0}"
+    
+    @staticmethod
+    def serialize_row(project: Dict[str, Any]) -> Dict[str, Any]:
+        """ストリーミング応答用の行変換（SQLiteの0/1をJSONの真偽値に）"""
+        project['collapsed'] = bool(project['collapsed'])
+        return project
+    
     def get_project_by_id(self, project_id: str) -> Dict[str, Any]:
         """プロジェクトID指定取得"""
         try:
             projects = self.db_manager.execute_query(
-                "SELECT * FROM projects WHERE id = ?", (project_id,)
+                f"SELECT *, {PROJECT_ROLLUP_COLUMNS} FROM projects WHERE id = ?", (now_epoch_ms(), project_id)
             )
             
             if not projects:
@@ -57,25 +94,25 @@ class ProjectService:
             validate_project_data(project_data)
             
             # ID生成
-            project_id = f"p{int(datetime.now().timestamp() * 1000)}"
-            now = datetime.now()
-            
-            # データベース挿入
-            self.db_manager.execute_update(
-                """INSERT INTO projects (id, name, color, collapsed, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+            project_id = new_id("p")
+            now = now_epoch_ms()
+            
+            # データベース挿入（RETURNINGで作成行を同一クエリで取得）
+            created_project = self.db_manager.execute_returning(
+                """INSERT INTO projects (id, name, color, collapsed, created_epoch, updated_epoch)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   RETURNING *, 0 AS task_count, 0 AS completed_task_count, 0 AS overdue_task_count""",
                 (
                     project_id,
                     project_data['name'],
                     project_data['color'],
                     project_data.get('collapsed', False),
-                    now.isoformat(),
-                    now.isoformat()
+                    now,
+                    now
                 )
             )
             
-            # 作成されたプロジェクトを取得
-            created_project = self.get_project_by_id(project_id)
+            self._validate_project_data(created_project)
             logger.info(f"Created project: {created_project['name']} ({project_id})")
             return created_project
             
@@ -86,9 +123,6 @@ class ProjectService:
     def update_project(self, project_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """プロジェクト更新"""
         try:
-            # 存在確認
-            self.get_project_by_id(project_id)
-            
             # 更新フィールド構築
             update_fields = []
             values = []
@@ -99,15 +133,21 @@ class ProjectService:
                     values.append(value)
             
             if update_fields:
-                update_fields.append("updated_at = ?")
-                values.append(datetime.now().isoformat())
+                update_fields.append("updated_epoch = ?")
+                now = now_epoch_ms()
+                values.append(now)
                 values.append(project_id)
                 
-                query = f"UPDATE projects SET {', '.join(update_fields)} WHERE id = ?"
-                self.db_manager.execute_update(query, tuple(values))
+                # 存在確認・更新・再取得を1クエリで実行
+                query = (f"UPDATE projects SET {', '.join(update_fields)} WHERE id = ? "
+                         f"RETURNING *, {PROJECT_ROLLUP_COLUMNS}")
+                updated_project = self.db_manager.execute_returning(query, (*values, now))
+                if updated_project is None:
+                    raise NotFoundError(f"Project not found: {project_id}")
+                self._validate_project_data(updated_project)
+            else:
+                updated_project = self.get_project_by_id(project_id)
             
-            # 更新されたプロジェクトを取得
-            updated_project = self.get_project_by_id(project_id)
             logger.info(f"Updated project: {updated_project['name']} ({project_id})")
             return updated_project
             
@@ -118,15 +158,12 @@ class ProjectService:
     def delete_project(self, project_id: str) -> None:
         """プロジェクト削除"""
         try:
-            # 存在確認
-            project = self.get_project_by_id(project_id)
-            
-            # 削除実行（CASCADE設定により関連タスクも削除される）
-            affected_rows = self.db_manager.execute_update(
-                "DELETE FROM projects WHERE id = ?", (project_id,)
+            # 削除実行（CASCADE設定により関連タスクも削除される、存在確認はRETURNINGで兼ねる）
+            project = self.db_manager.execute_returning(
+                "DELETE FROM projects WHERE id = ? RETURNING id, name", (project_id,)
             )
             
-            if affected_rows == 0:
+            if project is None:
                 raise NotFoundError(f"Project not found: {project_id}")
             
             logger.info(f"Deleted project: {project['name']} ({project_id})")
@@ -145,4 +182,12 @@ class ProjectService:
         # カラーフィールドの形式検証
         color = project.get('color', '')
         if not color.startswith('#') or len(color) != 7:
-            logger.warn(f"Invalid color format: {color}")
\ No newline at end of file
+            logger.warn(f"Invalid color format: {color}")
+    
+    # 非同期版（ルートハンドラー用：DB専用エグゼキューターで実行）
+    get_all_projects_async = async_variant(get_all_projects)
+    get_project_by_id_async = async_variant(get_project_by_id)
+    get_list_version_async = async_variant(get_list_version)
+    create_project_async = async_variant(create_project)
+    update_project_async = async_variant(update_project)
+    delete_project_async = async_variant(delete_project)
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+タスク階層インデックス（クロージャーテーブル）
+システムプロンプト準拠：DRY原則、階層操作の一元化
+
+task_closure は (ancestor_id, descendant_id, depth) の全祖先・子孫ペアを保持する。
+自身との組 (id, id, 0) も含むため、サブツリー取得や包含判定は単一のインデックス検索になる。
+各メソッドは呼び出し元のトランザクション内の接続を受け取り、tasks の更新と同時に反映する。
+
+既存データベースの初回構築はマイグレーション 0003_task_closure で行われる。
+手動での再構築:
+    cd backend && python -m features.tasklist.services.task_hierarchy
+"""
+import sqlite3
+import sys
+from typing import List
+
+from core.exceptions import ValidationError
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 祖先をたどる上限深さ（parent_idの循環参照に対する安全弁）
+MAX_CLOSURE_DEPTH = 64
+
+# 指定タスク集合について、tasks.parent_id をたどって全祖先ペアを生成するCTE
+_ANCESTOR_PAIRS_CTE = """
+WITH RECURSIVE up(descendant_id, ancestor_id, depth) AS (
+    SELECT id, id, 0 FROM tasks WHERE {where}
+    UNION ALL
+    SELECT up.descendant_id, p.id, up.depth + 1
+    FROM up
+    JOIN tasks t ON t.id = up.ancestor_id
+    JOIN tasks p ON p.id = t.parent_id
+    WHERE up.depth < {max_depth}
+)
+"""
+
+class TaskHierarchyIndex:
+    """クロージャーテーブルの保守と参照"""
+
+    def index_tasks(self, conn: sqlite3.Connection, id_query: str) -> int:
+        """
+        新規タスク（id_query が返すID集合）のクロージャー行を登録
+        親がまだ登録されていなくても tasks.parent_id から導出するため、挿入順に依存しない
+        """
+        cte = _ANCESTOR_PAIRS_CTE.format(
+            where=f"id IN ({id_query})", max_depth=MAX_CLOSURE_DEPTH
+        )
+        conn.execute(
+            cte + "INSERT OR REPLACE INTO task_closure (ancestor_id, descendant_id, depth) "
+                  "SELECT ancestor_id, descendant_id, depth FROM up"
+        )
+        # WITH で始まる文は cursor.rowcount が -1 になるため changes() で取得する
+        return conn.execute("SELECT changes()").fetchone()[0]
+
+    def add_task(self, conn: sqlite3.Connection, task_id: str, parent_id: str = None) -> None:
+        """単一タスクのクロージャー行を登録（親の祖先行をコピー）"""
+        conn.execute(
+            "INSERT OR REPLACE INTO task_closure (ancestor_id, descendant_id, depth) VALUES (?, ?, 0)",
+            (task_id, task_id)
+        )
+        if parent_id:
+            conn.execute(
+                """INSERT OR REPLACE INTO task_closure (ancestor_id, descendant_id, depth)
+                   SELECT ancestor_id, ?, depth + 1 FROM task_closure WHERE descendant_id = ?""",
+                (task_id, parent_id)
+            )
+
+    def move_subtree(self, conn: sqlite3.Connection, task_id: str, new_parent_id: str = None) -> None:
+        """
+        サブツリーの付け替え
+        サブツリー外の祖先とのリンクを外し、新しい親の祖先とのリンクを張り直す
+        """
+        if new_parent_id:
+            if self.is_descendant(conn, new_parent_id, task_id):
+                raise ValidationError(f"Cannot move task {task_id} under its own descendant {new_parent_id}")
+            if not conn.execute("SELECT 1 FROM tasks WHERE id = ?", (new_parent_id,)).fetchone():
+                raise ValidationError(f"Parent task not found: {new_parent_id}")
+
+        conn.execute(
+            """DELETE FROM task_closure
+               WHERE descendant_id IN (SELECT descendant_id FROM task_closure WHERE ancestor_id = ?)
+                 AND ancestor_id NOT IN (SELECT descendant_id FROM task_closure WHERE ancestor_id = ?)""",
+            (task_id, task_id)
+        )
+        if new_parent_id:
+            conn.execute(
+                """INSERT INTO task_closure (ancestor_id, descendant_id, depth)
+                   SELECT above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+                   FROM task_closure above, task_closure below
+                   WHERE above.descendant_id = ? AND below.ancestor_id = ?""",
+                (new_parent_id, task_id)
+            )
+
+    def expand_to_subtrees(self, conn: sqlite3.Connection, id_table: str) -> None:
+        """一時テーブルのID集合に全子孫を追加"""
+        conn.execute(
+            f"""INSERT OR IGNORE INTO {id_table} (id)
+                SELECT DISTINCT c.descendant_id FROM task_closure c
+                WHERE c.ancestor_id IN (SELECT id FROM {id_table})"""
+        )
+
+    def remove_tasks(self, conn: sqlite3.Connection, id_table: str) -> None:
+        """削除済みタスク（一時テーブルのID集合）のクロージャー行を削除"""
+        conn.execute(f"DELETE FROM task_closure WHERE descendant_id IN (SELECT id FROM {id_table})")
+
+    def get_descendant_ids(self, conn: sqlite3.Connection, task_id: str, include_self: bool = False) -> List[str]:
+        """全子孫IDの取得（単一のインデックス検索）"""
+        min_depth = 0 if include_self else 1
+        return [
+            row[0] for row in conn.execute(
+                "SELECT descendant_id FROM task_closure WHERE ancestor_id = ? AND depth >= ? ORDER BY depth",
+                (task_id, min_depth)
+            )
+        ]
+
+    def is_descendant(self, conn: sqlite3.Connection, task_id: str, ancestor_id: str) -> bool:
+        """task_id が ancestor_id のサブツリー内（自身を含む）にあるか"""
+        return conn.execute(
+            "SELECT 1 FROM task_closure WHERE ancestor_id = ? AND descendant_id = ?",
+            (ancestor_id, task_id)
+        ).fetchone() is not None
+
+    def rebuild(self, conn: sqlite3.Connection) -> int:
+        """クロージャーテーブルを tasks.parent_id から全再構築"""
+        conn.execute("DELETE FROM task_closure")
+        cte = _ANCESTOR_PAIRS_CTE.format(where="1", max_depth=MAX_CLOSURE_DEPTH)
+        conn.execute(
+            cte + "INSERT OR REPLACE INTO task_closure (ancestor_id, descendant_id, depth) "
+                  "SELECT ancestor_id, descendant_id, depth FROM up"
+        )
+        count = conn.execute("SELECT count(*) FROM task_closure").fetchone()[0]
+        logger.info(f"Task closure table rebuilt: {count} rows")
+        return count
+
+def main() -> int:
+    """ワンショット再構築コマンド"""
+    from core.database import DatabaseManager
+
+    with DatabaseManager().transaction() as conn:
+        count = TaskHierarchyIndex().rebuild(conn)
+    print(f"Rebuilt task_closure: {count} rows")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
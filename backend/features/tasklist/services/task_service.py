@@ -2,49 +2,422 @@
 タスクサービス
 システムプロンプト準拠：DRY原則、ビジネスロジック集約
 """
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+import base64
+import html
+import json
+import re
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 
-from core.database import DatabaseManager
-from core.exceptions import NotFoundError, ValidationError, handle_date_conversion_error
+from core.data_versions import TASKS_SCOPE, project_tasks_scope, read_version, read_entity_version
+from core.database import DatabaseManager, async_variant
+from core.exceptions import NotFoundError, ValidationError
+from core.id_generator import new_id, new_ids
 from core.logger import get_logger
+from core.utils.dates import to_epoch_ms, now_epoch_ms
 from core.utils.validators import validate_task_data
+from .task_hierarchy import TaskHierarchyIndex
 
 logger = get_logger(__name__)
 
+# 一覧取得で使用可能なフィルター（キー → SQL条件）
+TASK_FILTERS = {
+    'completed': "completed = ?",
+    'due_from': "due_epoch >= ?",
+    'due_to': "due_epoch <= ?",
+    'assignee': "assignee = ?",
+    'level': "level = ?",
+    'parent_id': "parent_id = ?",
+}
+
+# 日時を値に取るフィルター（エポックミリ秒に変換して比較）
+DATE_FILTERS = {'due_from', 'due_to'}
+
+# 日付フィールド → 保存列（UTCエポックミリ秒、元の列名はISO 8601文字列の生成列）
+DATE_COLUMNS = {
+    'start_date': 'start_epoch',
+    'due_date': 'due_epoch',
+    'completion_date': 'completion_epoch',
+}
+
+# 1日のミリ秒数（日付シフト用）
+DAY_MS = 86_400_000
+
+# ストリーミング・差分同期の応答で返す列（TaskResponse と同じ項目、保存用の *_epoch 列は含めない）
+TASK_RESPONSE_COLUMNS = (
+    "id, name, project_id, parent_id, completed, start_date, due_date, completion_date, "
+    "notes, assignee, level, collapsed, created_at, updated_at"
+)
+
+# 全文検索：trigram索引で検索できる最短の語長（短い語は LIKE で絞り込む）、強調タグ、スニペットの長さ
+# 強調箇所はいったん制御文字で囲み、本文をHTMLエスケープしてから強調タグへ置き換える
+SEARCH_MIN_INDEXED_LENGTH = 3
+SEARCH_MARK_OPEN, SEARCH_MARK_CLOSE = '<mark>', '</mark>'
+SEARCH_SENTINEL_OPEN, SEARCH_SENTINEL_CLOSE = '\x02', '\x03'
+SEARCH_SNIPPET_TOKENS = 24
+
+# 子タスクの集計列（task_rollups の主キー検索、子の無いタスクは0件）。{table} はタスク表の名前または別名
+TASK_ROLLUP_COLUMNS = (
+    "COALESCE((SELECT child_count FROM task_rollups WHERE task_id = {table}.id), 0) AS child_count, "
+    "COALESCE((SELECT completed_child_count FROM task_rollups WHERE task_id = {table}.id), 0) AS completed_child_count"
+)
+
+# 階層走査の上限深さ（parent_idの循環参照に対する安全弁）
+MAX_HIERARCHY_DEPTH = 64
+
+# 階層レベルの上限（TaskBase.level の検証範囲と同じ）
+MAX_TASK_LEVEL = 10
+
 class TaskService:
     """タスク操作サービス"""
     
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        self.hierarchy = TaskHierarchyIndex()
     
     def get_tasks(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """タスク一覧取得（期限順ソート）"""
+        return self.get_tasks_page(project_id)['items']
+    
+    def get_tasks_page(
+        self,
+        project_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        タスク一覧取得（キーセットページネーション・フィルター対応）
+        並び順は (project_id,) due_epoch, created_epoch, id で、カーソルは最終行のソートキー
+        """
         try:
-            if project_id:
+            order_columns = self._order_columns(project_id)
+            conditions, params = self._build_task_conditions(project_id, filters or {})
+            
+            if cursor:
+                cursor_values = self._decode_cursor(cursor, len(order_columns))
+                conditions.append(
+                    f"({', '.join(order_columns)}) > ({', '.join('?' for _ in order_columns)})"
+                )
+                params.extend(cursor_values)
+            
+            query = f"SELECT *, {TASK_ROLLUP_COLUMNS.format(table='tasks')} FROM tasks"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY " + ", ".join(f"{column} ASC" for column in order_columns)
+            if limit:
+                # 次ページ有無の判定用に1件多く取得
+                query += " LIMIT ?"
+                params.append(limit + 1)
+            
+            tasks = self.db_manager.execute_query(query, tuple(params))
+            
+            next_cursor = None
+            if limit and len(tasks) > limit:
+                tasks = tasks[:limit]
+                next_cursor = self._encode_cursor([tasks[-1][column] for column in order_columns])
+            
+            logger.info(f"Retrieved {len(tasks)} tasks" + (f" for project {project_id}" if project_id else ""))
+            return {'items': tasks, 'next_cursor': next_cursor}
+        except Exception as e:
+            logger.error(f"Failed to retrieve tasks: {e}")
+            raise
+    
+    def stream_tasks(
+        self,
+        project_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        タスク一覧のストリーミング取得（並び順・フィルターは get_tasks_page と同じ）
+        結果は fetchmany のバッチ単位で返り、全件をメモリに保持しない
+        """
+        order_columns = self._order_columns(project_id)
+        conditions, params = self._build_task_conditions(project_id, filters or {})
+        query = f"SELECT {TASK_RESPONSE_COLUMNS}, {TASK_ROLLUP_COLUMNS.format(table='tasks')} FROM tasks"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY " + ", ".join(f"{column} ASC" for column in order_columns)
+        logger.info("Streaming tasks" + (f" for project {project_id}" if project_id else ""))
+        return self.db_manager.stream_batches(query, tuple(params))
+    
+    def get_list_version(self, project_id: Optional[str] = None) -> str:
+        """タスク一覧のバージョン（プロジェクト指定時はそのプロジェクトのみ）"""
+        return read_version(self.db_manager, project_tasks_scope(project_id) if project_id else TASKS_SCOPE)
+    
+    def get_task_version(self, task_id: str) -> Optional[str]:
+        """タスク1件のバージョン（存在しない場合は None、子タスクの集計列の変化も含める）"""
+        version = read_entity_version(self.db_manager, 'task', task_id)
+        if version is None:
+            return None
+        rollups = self.db_manager.execute_query(
+            "SELECT child_count, completed_child_count FROM task_rollups WHERE task_id = ?", (task_id,)
+        )
+        if not rollups:
+            return version
+        return f"{version}.{rollups[0]['child_count']}.{rollups[0]['completed_child_count']}"
+    
+    @staticmethod
+    def serialize_row(task: Dict[str, Any]) -> Dict[str, Any]:
+        """ストリーミング応答用の行変換（SQLiteの0/1をJSONの真偽値に）"""
+        task['completed'] = bool(task['completed'])
+        task['collapsed'] = bool(task['collapsed'])
+        return task
+    
+    @staticmethod
+    def _order_columns(project_id: Optional[str]) -> List[str]:
+        """一覧の並び順（idx_tasks_project_due_created に一致）"""
+        order_columns = ['due_epoch', 'created_epoch', 'id']
+        if not project_id:
+            order_columns.insert(0, 'project_id')
+        return order_columns
+    
+    def _build_task_conditions(self, project_id: Optional[str], filters: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+        """一覧取得用のWHERE条件とパラメーターを構築"""
+        conditions: List[str] = []
+        params: List[Any] = []
+        
+        if project_id:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        
+        for key, value in filters.items():
+            if value is None:
+                continue
+            if key not in TASK_FILTERS:
+                raise ValidationError(f"Unknown task filter: {key}")
+            conditions.append(TASK_FILTERS[key])
+            params.append(to_epoch_ms(value, key) if key in DATE_FILTERS else value)
+        
+        return conditions, params
+    
+    @staticmethod
+    def _encode_cursor(values: List[Any]) -> str:
+        """ソートキーを不透明なカーソル文字列に変換"""
+        payload = json.dumps(values, ensure_ascii=False, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def _decode_cursor(cursor: str, expected_length: int) -> List[Any]:
+        """カーソル文字列をソートキーに復元"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        except (ValueError, UnicodeError) as e:
+            raise ValidationError(f"Invalid cursor: {e}")
+        if not isinstance(values, list) or len(values) != expected_length:
+            raise ValidationError("Invalid cursor: sort key does not match the requested ordering")
+        return values
+    
+    def get_subtree(self, task_id: str, max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        サブツリー取得（WITH RECURSIVE）
+        ルートを先頭に深さ優先の表示順で返す。兄弟は一覧と同じ due_epoch, created_epoch, id 順
+        （エポック値は固定幅にゼロ埋めし、文字列連結のソートキーでも数値順を保つ）
+        """
+        try:
+            depth_limit = MAX_HIERARCHY_DEPTH if max_depth is None else min(max_depth, MAX_HIERARCHY_DEPTH)
+            tasks = self.db_manager.execute_query(
+                f"""WITH RECURSIVE subtree(id, depth, sort_path) AS (
+                       SELECT id, 0, '' FROM tasks WHERE id = ?
+                       UNION ALL
+                       SELECT c.id, s.depth + 1,
+                              s.sort_path || char(31) || printf('%015d', c.due_epoch) || char(30)
+                                  || printf('%015d', c.created_epoch) || char(30) || c.id
+                       FROM tasks c JOIN subtree s ON c.parent_id = s.id
+                       WHERE s.depth < ?
+                   )
+                   SELECT t.*, s.depth, {TASK_ROLLUP_COLUMNS.format(table='t')}
+                   FROM subtree s JOIN tasks t ON t.id = s.id
+                   ORDER BY s.sort_path""",
+                (task_id, depth_limit)
+            )
+            
+            if not tasks:
+                raise NotFoundError(f"Task not found: {task_id}")
+            
+            logger.info(f"Retrieved subtree of {task_id}: {len(tasks)} tasks")
+            return tasks
+        except Exception as e:
+            logger.error(f"Failed to retrieve subtree of {task_id}: {e}")
+            raise
+    
+    def get_ancestors(self, task_id: str, include_self: bool = False) -> List[Dict[str, Any]]:
+        """
+        祖先パス取得（WITH RECURSIVE）
+        ルートから直近の親までの順で返す。depth はルートからの深さ
+        """
+        try:
+            rows = self.db_manager.execute_query(
+                f"""WITH RECURSIVE ancestors(id, parent_id, distance) AS (
+                       SELECT id, parent_id, 0 FROM tasks WHERE id = ?
+                       UNION ALL
+                       SELECT t.id, t.parent_id, a.distance + 1
+                       FROM tasks t JOIN ancestors a ON t.id = a.parent_id
+                       WHERE a.distance < ?
+                   )
+                   SELECT t.*, a.distance, {TASK_ROLLUP_COLUMNS.format(table='t')}
+                   FROM ancestors a JOIN tasks t ON t.id = a.id
+                   ORDER BY a.distance DESC""",
+                (task_id, MAX_HIERARCHY_DEPTH)
+            )
+            
+            if not rows:
+                raise NotFoundError(f"Task not found: {task_id}")
+            
+            root_distance = rows[0]['distance']
+            ancestors = []
+            for row in rows:
+                distance = row.pop('distance')
+                if distance == 0 and not include_self:
+                    continue
+                row['depth'] = root_distance - distance
+                ancestors.append(row)
+            
+            logger.info(f"Retrieved {len(ancestors)} ancestors of {task_id}")
+            return ancestors
+        except Exception as e:
+            logger.error(f"Failed to retrieve ancestors of {task_id}: {e}")
+            raise
+    
+    def search_tasks(
+        self,
+        query: str,
+        project_id: Optional[str] = None,
+        completed: Optional[bool] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        タスク名・メモの全文検索（tasks_fts、bm25順、名前の一致を10倍に重み付け）
+        空白区切りの語をすべて含むタスクを返す。各語は部分一致（前方一致を含む）
+        3文字未満の語は索引で検索できないため LIKE で絞り込み、全語が短い場合は更新日時順で返す
+        """
+        try:
+            terms = query.split()
+            if not terms:
+                raise ValidationError("Search query must not be empty")
+            indexed = [term for term in terms if len(term) >= SEARCH_MIN_INDEXED_LENGTH]
+            conditions, params = self._build_task_conditions(project_id, {'completed': completed})
+            for term in terms:
+                if len(term) < SEARCH_MIN_INDEXED_LENGTH:
+                    pattern = '%' + re.sub(r'([\\%_])', r'\\\1', term) + '%'
+                    conditions.append("(t.name LIKE ? ESCAPE '\\' OR t.notes LIKE ? ESCAPE '\\')")
+                    params.extend([pattern, pattern])
+            
+            if indexed:
+                # 各語をフレーズとして引用し、FTS5の演算子として解釈させない
+                match = ' '.join('"' + term.replace('"', '""') + '"' for term in indexed)
+                where = " AND ".join(["tasks_fts MATCH ?"] + conditions)
+                # 上位 limit 件を確定してから、その行だけ強調・スニペットを生成する
                 tasks = self.db_manager.execute_query(
-                    """SELECT * FROM tasks 
-                       WHERE project_id = ? 
-                       ORDER BY due_date ASC, created_at ASC, id ASC""",
-                    (project_id,)
+                    f"""WITH ranked AS MATERIALIZED (
+                           SELECT tasks_fts.rowid AS search_rowid, t.id AS task_id,
+                                  bm25(tasks_fts, 10.0, 1.0) AS score
+                           FROM tasks_fts
+                           JOIN task_rowids s ON s.rowid = tasks_fts.rowid
+                           JOIN tasks t ON t.id = s.task_id
+                           WHERE {where}
+                           ORDER BY score LIMIT ?
+                       )
+                       SELECT t.*, r.score, {TASK_ROLLUP_COLUMNS.format(table='t')},
+                              highlight(tasks_fts, 0, ?, ?) AS name_highlight,
+                              snippet(tasks_fts, 1, ?, ?, '…', ?) AS notes_snippet
+                       FROM ranked r
+                       JOIN tasks_fts ON tasks_fts.rowid = r.search_rowid
+                       JOIN tasks t ON t.id = r.task_id
+                       WHERE tasks_fts MATCH ?
+                       ORDER BY r.score""",
+                    (match, *params, limit,
+                     SEARCH_SENTINEL_OPEN, SEARCH_SENTINEL_CLOSE,
+                     SEARCH_SENTINEL_OPEN, SEARCH_SENTINEL_CLOSE, SEARCH_SNIPPET_TOKENS, match)
                 )
+                for task in tasks:
+                    task['name_highlight'] = self._escape_marked(task['name_highlight'])
+                    task['notes_snippet'] = self._escape_marked(task['notes_snippet'])
             else:
                 tasks = self.db_manager.execute_query(
-                    """SELECT * FROM tasks 
-                       ORDER BY project_id, due_date ASC, created_at ASC, id ASC"""
+                    f"SELECT t.*, {TASK_ROLLUP_COLUMNS.format(table='t')} FROM tasks t WHERE {' AND '.join(conditions)} "
+                    "ORDER BY t.updated_epoch DESC LIMIT ?",
+                    (*params, limit)
                 )
+                for task in tasks:
+                    task['score'] = None
+                    task['name_highlight'] = self._mark_terms(task['name'], terms)
+                    task['notes_snippet'] = self._mark_terms(task['notes'] or '', terms, SEARCH_SNIPPET_TOKENS)
             
-            logger.info(f"Retrieved {len(tasks)} tasks" + (f" for project {project_id}" if project_id else ""))
+            logger.info(f"Search '{query}' matched {len(tasks)} tasks")
             return tasks
         except Exception as e:
-            logger.error(f"Failed to retrieve tasks: {e}")
+            logger.error(f"Failed to search tasks for '{query}': {e}")
             raise
     
+    def get_timeline_tasks(
+        self,
+        window_from: Any,
+        window_to: Any,
+        project_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        表示期間 [window_from, window_to] と期間が重なるタスクの取得（並び順は一覧と同じ）
+        task_intervals（R*Tree）で候補を絞り込み、32ビット浮動小数点の丸め分を tasks の列で厳密に判定する
+        プロジェクト指定時もプロジェクト索引からの全件走査にならないよう、CROSS JOIN で R*Tree を駆動表に固定する
+        """
+        try:
+            from_epoch = to_epoch_ms(window_from, 'from')
+            to_epoch = to_epoch_ms(window_to, 'to')
+            if from_epoch > to_epoch:
+                raise ValidationError("Timeline 'from' must not be after 'to'")
+            
+            conditions = [
+                "i.start_epoch <= ?", "i.due_epoch >= ?",
+                "min(t.start_epoch, t.due_epoch) <= ?", "max(t.start_epoch, t.due_epoch) >= ?",
+            ]
+            params: List[Any] = [to_epoch, from_epoch, to_epoch, from_epoch]
+            if project_id:
+                conditions.append("+t.project_id = ?")
+                params.append(project_id)
+            order = ", ".join(f"t.{column}" for column in self._order_columns(project_id))
+            tasks = self.db_manager.execute_query(
+                f"""SELECT t.*, {TASK_ROLLUP_COLUMNS.format(table='t')} FROM task_intervals i
+                    CROSS JOIN task_rowids r ON r.rowid = i.id
+                    CROSS JOIN tasks t ON t.id = r.task_id
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY {order}""",
+                tuple(params)
+            )
+            
+            logger.info(f"Retrieved {len(tasks)} timeline tasks" + (f" for project {project_id}" if project_id else ""))
+            return tasks
+        except Exception as e:
+            logger.error(f"Failed to retrieve timeline tasks: {e}")
+            raise
+    
+    @staticmethod
+    def _mark_terms(text: str, terms: List[str], window: Optional[int] = None) -> str:
+        """語を強調タグで囲む（window指定時は最初の一致の前後のみを切り出す、本文はHTMLエスケープ）"""
+        pattern = re.compile('|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+        if window is not None and len(text) > window:
+            found = pattern.search(text)
+            start = max(0, found.start() - window // 2) if found else 0
+            end = start + window
+            text = ('…' if start > 0 else '') + text[start:end] + ('…' if end < len(text) else '')
+        return TaskService._escape_marked(
+            pattern.sub(lambda found: SEARCH_SENTINEL_OPEN + found.group(0) + SEARCH_SENTINEL_CLOSE, text)
+        )
+    
+    @staticmethod
+    def _escape_marked(text: Optional[str]) -> Optional[str]:
+        """制御文字で囲んだ強調箇所を残して本文をHTMLエスケープし、強調タグへ置き換える"""
+        if text is None:
+            return None
+        return (html.escape(text)
+                .replace(SEARCH_SENTINEL_OPEN, SEARCH_MARK_OPEN)
+                .replace(SEARCH_SENTINEL_CLOSE, SEARCH_MARK_CLOSE))
+    
     def get_task_by_id(self, task_id: str) -> Dict[str, Any]:
         """タスクID指定取得"""
         try:
             tasks = self.db_manager.execute_query(
-                "SELECT * FROM tasks WHERE id = ?", (task_id,)
+                f"SELECT *, {TASK_ROLLUP_COLUMNS.format(table='tasks')} FROM tasks WHERE id = ?", (task_id,)
             )
             
             if not tasks:
@@ -65,39 +438,42 @@ class TaskService:
             # バリデーション
             validate_task_data(task_data)
             
-            # 日付フィールドの正規化
-            normalized_task_data = self._normalize_task_dates(task_data)
+            # 日付フィールドを保存形式に変換
+            normalized_task_data = self._to_epoch_fields(task_data)
             
             # ID生成
-            task_id = f"t{int(datetime.now().timestamp() * 1000)}"
-            now = datetime.now()
+            task_id = new_id("t")
+            now = now_epoch_ms()
             
-            # データベース挿入
-            self.db_manager.execute_update(
-                """INSERT INTO tasks (
-                    id, name, project_id, parent_id, completed, start_date, due_date,
-                    completion_date, notes, assignee, level, collapsed, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    task_id,
-                    normalized_task_data['name'],
-                    normalized_task_data['project_id'],
-                    normalized_task_data.get('parent_id'),
-                    normalized_task_data.get('completed', False),
-                    normalized_task_data.get('start_date', now.isoformat()),
-                    normalized_task_data.get('due_date', now.isoformat()),
-                    normalized_task_data.get('completion_date'),
-                    normalized_task_data.get('notes', ''),
-                    normalized_task_data.get('assignee', '自分'),
-                    normalized_task_data.get('level', 0),
-                    normalized_task_data.get('collapsed', False),
-                    now.isoformat(),
-                    now.isoformat()
+            # データベース挿入（RETURNINGで作成行を取得、階層インデックスも同一トランザクションで更新）
+            with self.db_manager.transaction() as conn:
+                cursor = conn.execute(
+                    """INSERT INTO tasks (
+                        id, name, project_id, parent_id, completed, start_epoch, due_epoch,
+                        completion_epoch, notes, assignee, level, collapsed, created_epoch, updated_epoch
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING *, 0 AS child_count, 0 AS completed_child_count""",
+                    (
+                        task_id,
+                        normalized_task_data['name'],
+                        normalized_task_data['project_id'],
+                        normalized_task_data.get('parent_id'),
+                        normalized_task_data.get('completed', False),
+                        normalized_task_data.get('start_epoch') or now,
+                        normalized_task_data.get('due_epoch') or now,
+                        normalized_task_data.get('completion_epoch'),
+                        normalized_task_data.get('notes', ''),
+                        normalized_task_data.get('assignee', '自分'),
+                        normalized_task_data.get('level', 0),
+                        normalized_task_data.get('collapsed', False),
+                        now,
+                        now
+                    )
                 )
-            )
+                created_task = self.db_manager.fetch_rows(cursor)[0]
+                self.hierarchy.add_task(conn, task_id, normalized_task_data.get('parent_id'))
             
-            # 作成されたタスクを取得
-            created_task = self.get_task_by_id(task_id)
+            self._validate_task_data(created_task)
             logger.info(f"Created task: {created_task['name']} ({task_id})")
             return created_task
             
@@ -105,22 +481,22 @@ class TaskService:
             logger.error(f"Failed to create task: {e}")
             raise
     
-    def update_task(self, task_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
-        """タスク更新"""
+    def update_task(self, task_id: str, updates: Dict[str, Any], propagate: bool = False) -> Dict[str, Any]:
+        """
+        タスク更新
+        propagate 指定時は完了状態の変更を階層に伝播する（_propagate_completion）
+        """
         try:
-            # 存在確認
-            self.get_task_by_id(task_id)
-            
-            # 日付フィールドの正規化
-            normalized_updates = self._normalize_task_dates(updates)
+            # 日付フィールドを保存形式に変換
+            normalized_updates = self._to_epoch_fields(updates)
             
             # 更新フィールド構築
             update_fields = []
             values = []
             
             allowed_fields = [
-                'name', 'project_id', 'parent_id', 'completed', 'start_date', 'due_date',
-                'completion_date', 'notes', 'assignee', 'level', 'collapsed'
+                'name', 'project_id', 'parent_id', 'completed', 'start_epoch', 'due_epoch',
+                'completion_epoch', 'notes', 'assignee', 'level', 'collapsed'
             ]
             
             for field, value in normalized_updates.items():
@@ -128,16 +504,44 @@ class TaskService:
                     update_fields.append(f"{field} = ?")
                     values.append(value)
             
-            if update_fields:
-                update_fields.append("updated_at = ?")
-                values.append(datetime.now().isoformat())
-                values.append(task_id)
+            # 存在確認・更新・再取得を1トランザクションで実行（UPDATE ... RETURNING）
+            with self.db_manager.transaction() as conn:
+                if 'parent_id' in normalized_updates:
+                    # 親変更時は階層インデックスを付け替え（循環参照はここで拒否）
+                    current = conn.execute("SELECT parent_id FROM tasks WHERE id = ?", (task_id,)).fetchone()
+                    if current is None:
+                        raise NotFoundError(f"Task not found: {task_id}")
+                    if normalized_updates['parent_id'] != current['parent_id']:
+                        self.hierarchy.move_subtree(conn, task_id, normalized_updates['parent_id'])
                 
-                query = f"UPDATE tasks SET {', '.join(update_fields)} WHERE id = ?"
-                self.db_manager.execute_update(query, tuple(values))
+                if update_fields:
+                    update_fields.append("updated_epoch = ?")
+                    values.append(now_epoch_ms())
+                    values.append(task_id)
+                    cursor = conn.execute(
+                        f"UPDATE tasks SET {', '.join(update_fields)} WHERE id = ? "
+                        f"RETURNING *, {TASK_ROLLUP_COLUMNS.format(table='tasks')}",
+                        tuple(values)
+                    )
+                else:
+                    cursor = conn.execute(
+                        f"SELECT *, {TASK_ROLLUP_COLUMNS.format(table='tasks')} FROM tasks WHERE id = ?", (task_id,)
+                    )
+                rows = self.db_manager.fetch_rows(cursor)
+                if not rows:
+                    raise NotFoundError(f"Task not found: {task_id}")
+                
+                if propagate and 'completed' in normalized_updates:
+                    with self.db_manager.temp_id_table(conn, [task_id]) as id_table:
+                        propagated = self._propagate_completion(conn, id_table, bool(normalized_updates['completed']))
+                    if propagated:
+                        # 子タスクの集計列を伝播後の値で返す
+                        rows = self.db_manager.fetch_rows(conn.execute(
+                            f"SELECT *, {TASK_ROLLUP_COLUMNS.format(table='tasks')} FROM tasks WHERE id = ?", (task_id,)
+                        ))
             
-            # 更新されたタスクを取得
-            updated_task = self.get_task_by_id(task_id)
+            updated_task = rows[0]
+            self._validate_task_data(updated_task)
             logger.info(f"Updated task: {updated_task['name']} ({task_id})")
             return updated_task
             
@@ -145,75 +549,265 @@ class TaskService:
             logger.error(f"Failed to update task {task_id}: {e}")
             raise
     
-    def delete_task(self, task_id: str) -> None:
-        """タスク削除"""
+    def move_task(self, task_id: str, target: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        サブツリーの移動（親・プロジェクトの付け替え）
+        target は指定された項目のみを含む（parent_id: None はルートへの移動）。
+        親を指定した場合のプロジェクトは親のプロジェクト、project_id のみ指定で別プロジェクトへ移す場合はそのルートに置く。
+        サブツリー全体の project_id と level（移動先の深さ＋クロージャーの深さ）を1文で書き換え、戻り値の moved_count は書き換えた件数
+        """
+        target = {key: value for key, value in target.items() if key == 'parent_id' or value is not None}
+        if 'parent_id' not in target and 'project_id' not in target:
+            raise ValidationError("parent_id or project_id is required")
         try:
-            # 存在確認
-            task = self.get_task_by_id(task_id)
+            with self.db_manager.transaction() as conn:
+                current = conn.execute(
+                    "SELECT parent_id, project_id FROM tasks WHERE id = ?", (task_id,)
+                ).fetchone()
+                if current is None:
+                    raise NotFoundError(f"Task not found: {task_id}")
+                
+                if 'parent_id' in target:
+                    new_parent_id = target['parent_id']
+                elif target['project_id'] != current['project_id']:
+                    new_parent_id = None
+                else:
+                    new_parent_id = current['parent_id']
+                
+                # 階層インデックスの付け替え（循環参照・親の存在はここで検証）
+                if new_parent_id != current['parent_id']:
+                    self.hierarchy.move_subtree(conn, task_id, new_parent_id)
+                
+                if new_parent_id:
+                    parent = conn.execute(
+                        "SELECT project_id, level FROM tasks WHERE id = ?", (new_parent_id,)
+                    ).fetchone()
+                    if parent is None:
+                        raise ValidationError(f"Parent task not found: {new_parent_id}")
+                    if target.get('project_id') and target['project_id'] != parent['project_id']:
+                        raise ValidationError(
+                            f"Parent task {new_parent_id} belongs to project {parent['project_id']}, "
+                            f"not {target['project_id']}"
+                        )
+                    new_project_id, new_level = parent['project_id'], parent['level'] + 1
+                else:
+                    new_project_id, new_level = target.get('project_id') or current['project_id'], 0
+                
+                if new_project_id != current['project_id'] and not conn.execute(
+                    "SELECT 1 FROM projects WHERE id = ?", (new_project_id,)
+                ).fetchone():
+                    raise ValidationError(f"Project not found: {new_project_id}")
+                
+                subtree_depth = conn.execute(
+                    "SELECT MAX(depth) FROM task_closure WHERE ancestor_id = ?", (task_id,)
+                ).fetchone()[0] or 0
+                if new_level + subtree_depth > MAX_TASK_LEVEL:
+                    raise ValidationError(
+                        f"Moving task {task_id} would exceed the maximum level {MAX_TASK_LEVEL}"
+                    )
+                
+                # サブツリー全体の書き換え（値の変わらない子孫は更新しない）
+                moved_count = conn.execute(
+                    """UPDATE tasks SET
+                           parent_id = CASE WHEN tasks.id = ? THEN ? ELSE tasks.parent_id END,
+                           project_id = ?,
+                           level = ? + c.depth,
+                           updated_epoch = ?
+                       FROM task_closure c
+                       WHERE c.ancestor_id = ? AND c.descendant_id = tasks.id
+                         AND (tasks.id = ? OR tasks.project_id IS NOT ? OR tasks.level IS NOT ? + c.depth)""",
+                    (task_id, new_parent_id, new_project_id, new_level, now_epoch_ms(),
+                     task_id, task_id, new_project_id, new_level)
+                ).rowcount
+                
+                rows = self.db_manager.fetch_rows(conn.execute(
+                    f"SELECT *, {TASK_ROLLUP_COLUMNS.format(table='tasks')} FROM tasks WHERE id = ?", (task_id,)
+                ))
             
-            # 削除実行（CASCADE設定により子タスクも削除される）
-            affected_rows = self.db_manager.execute_update(
-                "DELETE FROM tasks WHERE id = ?", (task_id,)
+            moved_task = rows[0]
+            moved_task['moved_count'] = moved_count
+            self._validate_task_data(moved_task)
+            logger.info(
+                f"Moved task: {moved_task['name']} ({task_id}) under {new_parent_id or 'root'} "
+                f"in {new_project_id}, {moved_count} tasks rewritten"
             )
+            return moved_task
             
-            if affected_rows == 0:
-                raise NotFoundError(f"Task not found: {task_id}")
+        except Exception as e:
+            logger.error(f"Failed to move task {task_id}: {e}")
+            raise
+    
+    def delete_task(self, task_id: str) -> None:
+        """タスク削除"""
+        try:
+            # 削除実行（階層インデックスから子孫を求めてサブツリーごと削除、存在確認はRETURNINGで兼ねる）
+            with self.db_manager.transaction() as conn:
+                with self.db_manager.temp_id_table(conn, [task_id]) as id_table:
+                    self.hierarchy.expand_to_subtrees(conn, id_table)
+                    deleted = {
+                        row['id']: row['name'] for row in conn.execute(
+                            f"DELETE FROM tasks WHERE id IN (SELECT id FROM {id_table}) RETURNING id, name"
+                        ).fetchall()
+                    }
+                    if task_id not in deleted:
+                        raise NotFoundError(f"Task not found: {task_id}")
+                    self.hierarchy.remove_tasks(conn, id_table)
             
-            logger.info(f"Deleted task: {task['name']} ({task_id})")
+            logger.info(f"Deleted task: {deleted[task_id]} ({task_id}) with {len(deleted) - 1} descendants")
             
         except Exception as e:
             logger.error(f"Failed to delete task {task_id}: {e}")
             raise
     
-    def batch_update_tasks(self, operation: str, task_ids: List[str]) -> Dict[str, Any]:
-        """タスク一括操作"""
+    def bulk_create_tasks(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        タスク一括作成（1回の検証パス＋1トランザクションのexecutemany）
+        各行の parent_temp_id は同一ペイロード内の先行行の temp_id を参照する。
+        戻り値の id_map は temp_id → 採番されたタスクID の対応。
+        """
+        try:
+            # 検証パス：一時IDの重複・親参照の解決（親は子より前に並ぶこと）
+            id_map: Dict[str, str] = {}
+            external_parents = set()
+            task_ids = iter(new_ids("t", len(items)))
+            for item in items:
+                validate_task_data(item)
+                temp_id = item['temp_id']
+                if temp_id in id_map:
+                    raise ValidationError(f"Duplicate temp_id: {temp_id}")
+                parent_temp_id = item.get('parent_temp_id')
+                if parent_temp_id is not None:
+                    if item.get('parent_id'):
+                        raise ValidationError(f"Task {temp_id} sets both parent_id and parent_temp_id")
+                    if parent_temp_id not in id_map:
+                        raise ValidationError(f"Unknown or later parent_temp_id for {temp_id}: {parent_temp_id}")
+                elif item.get('parent_id'):
+                    external_parents.add(item['parent_id'])
+                id_map[temp_id] = next(task_ids)
+            
+            now = now_epoch_ms()
+            rows = [
+                (
+                    id_map[item['temp_id']],
+                    item['name'],
+                    item['project_id'],
+                    id_map[item['parent_temp_id']] if item.get('parent_temp_id') is not None else item.get('parent_id'),
+                    item.get('completed', False),
+                    to_epoch_ms(item.get('start_date'), 'start_date') or now,
+                    to_epoch_ms(item.get('due_date'), 'due_date') or now,
+                    to_epoch_ms(item.get('completion_date'), 'completion_date'),
+                    item.get('notes', ''),
+                    item.get('assignee', '自分'),
+                    item.get('level', 0),
+                    item.get('collapsed', False),
+                    now,
+                    now
+                )
+                for item in items
+            ]
+            
+            with self.db_manager.transaction() as conn:
+                # 既存タスクを親に指定した行は、親の存在を1文で確認
+                if external_parents:
+                    with self.db_manager.temp_id_table(conn, external_parents) as id_table:
+                        missing = [
+                            row['id'] for row in conn.execute(
+                                f"SELECT b.id FROM {id_table} b LEFT JOIN tasks t ON t.id = b.id WHERE t.id IS NULL"
+                            )
+                        ]
+                    if missing:
+                        raise ValidationError(f"Parent task not found: {', '.join(sorted(missing)[:10])}")
+                
+                conn.executemany(
+                    """INSERT INTO tasks (
+                        id, name, project_id, parent_id, completed, start_epoch, due_epoch,
+                        completion_epoch, notes, assignee, level, collapsed, created_epoch, updated_epoch
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    rows
+                )
+                with self.db_manager.temp_id_table(conn, id_map.values()) as id_table:
+                    self.hierarchy.index_tasks(conn, f"SELECT id FROM {id_table}")
+            
+            logger.info(f"Bulk created {len(rows)} tasks")
+            return {
+                'success': True,
+                'created_count': len(rows),
+                'id_map': id_map
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk create tasks: {e}")
+            raise
+    
+    def batch_update_tasks(self, operation: str, task_ids: List[str], propagate: bool = False) -> Dict[str, Any]:
+        """
+        タスク一括操作
+        対象IDは一時テーブル経由で結合するため、件数がバインド変数上限を超えても1文で処理できる
+        propagate 指定時は complete / incomplete を階層に伝播し、伝播で変わった件数を propagated_count に返す
+        """
         try:
             if not task_ids:
                 raise ValidationError("Task IDs are required")
+            if operation not in ("complete", "incomplete", "delete", "copy"):
+                raise ValidationError(f"Invalid operation: {operation}")
             
-            placeholders = ",".join(["?" for _ in task_ids])
-            now = datetime.now().isoformat()
+            now = now_epoch_ms()
             affected_rows = 0
+            result: Dict[str, Any] = {}
             
-            logger.info(f"Starting batch operation: {operation}")
-            
-            if operation == "complete":
-                # 一括完了
-                query = f"""UPDATE tasks SET 
-                           completed = ?, 
-                           completion_date = ?, 
-                           updated_at = ? 
-                           WHERE id IN ({placeholders})"""
-                params = [True, now, now] + task_ids
-                affected_rows = self.db_manager.execute_update(query, tuple(params))
-                
-            elif operation == "incomplete":
-                # 一括未完了
-                query = f"""UPDATE tasks SET 
-                           completed = ?, 
-                           completion_date = ?, 
-                           updated_at = ? 
-                           WHERE id IN ({placeholders})"""
-                params = [False, None, now] + task_ids
-                affected_rows = self.db_manager.execute_update(query, tuple(params))
-                
-            elif operation == "delete":
-                # 一括削除
-                query = f"DELETE FROM tasks WHERE id IN ({placeholders})"
-                params = task_ids
-                affected_rows = self.db_manager.execute_update(query, tuple(params))
-                
-            else:
-                raise ValidationError(f"Invalid operation: {operation}")
+            logger.info(f"Starting batch operation: {operation} ({len(task_ids)} ids)")
+            
+            with self.db_manager.transaction() as conn:
+                with self.db_manager.temp_id_table(conn, task_ids) as id_table:
+                    if operation == "complete":
+                        # 一括完了
+                        affected_rows = conn.execute(
+                            f"""UPDATE tasks SET 
+                               completed = ?, 
+                               completion_epoch = ?, 
+                               updated_epoch = ? 
+                               WHERE id IN (SELECT id FROM {id_table})""",
+                            (True, now, now)
+                        ).rowcount
+                        if propagate:
+                            result['propagated_count'] = self._propagate_completion(conn, id_table, True, now)
+                        
+                    elif operation == "incomplete":
+                        # 一括未完了
+                        affected_rows = conn.execute(
+                            f"""UPDATE tasks SET 
+                               completed = ?, 
+                               completion_epoch = ?, 
+                               updated_epoch = ? 
+                               WHERE id IN (SELECT id FROM {id_table})""",
+                            (False, None, now)
+                        ).rowcount
+                        if propagate:
+                            result['propagated_count'] = self._propagate_completion(conn, id_table, False, now)
+                        
+                    elif operation == "delete":
+                        # 一括削除（子孫を含む）
+                        self.hierarchy.expand_to_subtrees(conn, id_table)
+                        affected_rows = conn.execute(
+                            f"DELETE FROM tasks WHERE id IN (SELECT id FROM {id_table})"
+                        ).rowcount
+                        self.hierarchy.remove_tasks(conn, id_table)
+                        
+                    elif operation == "copy":
+                        # 一括複製
+                        id_map = self._copy_tasks(conn, id_table, now)
+                        affected_rows = len(id_map)
+                        result['id_map'] = id_map
             
             logger.info(f"Batch operation completed: {operation}, {affected_rows} tasks affected")
             
-            return {
+            result.update({
                 'success': True,
                 'operation': operation,
                 'affected_count': affected_rows,
                 'task_ids': task_ids
-            }
+            })
+            return result
             
         except Exception as e:
             logger.error(f"Failed to execute batch operation '{operation}': {e}")
@@ -224,42 +818,106 @@ class TaskService:
                 'error': str(e)
             }
     
-    def _normalize_task_dates(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
-        """タスク日付フィールド正規化"""
-        normalized_data = task_data.copy()
-        date_fields = ['start_date', 'due_date', 'completion_date']
+    def _propagate_completion(self, conn, id_table: str, completed: bool, now: Optional[int] = None) -> int:
+        """
+        完了状態の階層伝播（一時テーブル上のタスクの完了状態を変更した直後に、同じトランザクション内で呼ぶ）
+        完了時はサブツリー全体をクロージャーテーブル経由の1文で完了にする。
+        祖先は深い順に1段1文で再計算し、直下の子がすべて完了していれば完了、そうでなければ未完了にする
+        （子の件数は task_rollups から読むため、子タスクを数え直さない）。
+        対象タスク自身は再計算しない。戻り値は伝播で状態が変わったタスク数
+        """
+        now = now or now_epoch_ms()
+        changed = 0
+        if completed:
+            changed += conn.execute(
+                f"""UPDATE tasks SET completed = 1, completion_epoch = ?, updated_epoch = ?
+                    WHERE completed = 0 AND id IN (
+                        SELECT c.descendant_id FROM task_closure c
+                        WHERE c.ancestor_id IN (SELECT id FROM {id_table}) AND c.depth > 0
+                    )""",
+                (now, now)
+            ).rowcount
         
-        for field in date_fields:
-            if field in normalized_data and normalized_data[field] is not None:
-                try:
-                    value = normalized_data[field]
-                    
-                    # 既にISO文字列形式の場合
-                    if isinstance(value, str):
-                        # 妥当性検証
-                        datetime.fromisoformat(value.replace('Z', '+00:00'))
-                        continue
-                    
-                    # datetime型の場合
-                    if isinstance(value, datetime):
-                        normalized_data[field] = value.isoformat()
-                        continue
-                    
-                    # その他の型は現在時刻で置換
-                    logger.warn(f"Invalid date type for {field}: {type(value)}")
-                    normalized_data[field] = datetime.now().isoformat()
-                    
-                except Exception as e:
-                    # 変換失敗時のエラーハンドリング
-                    date_error = handle_date_conversion_error(
-                        field, 
-                        normalized_data[field], 
-                        e
-                    )
-                    logger.warn(f"Date conversion failed for {field}, using current time")
-                    normalized_data[field] = datetime.now().isoformat()
-        
-        return normalized_data
+        # 再計算対象の祖先とルートからの深さ
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS completion_ancestors (id TEXT PRIMARY KEY, root_depth INTEGER NOT NULL)"
+        )
+        conn.execute("DELETE FROM temp.completion_ancestors")
+        try:
+            conn.execute(
+                f"""INSERT OR IGNORE INTO temp.completion_ancestors (id, root_depth)
+                    SELECT c.ancestor_id,
+                           (SELECT MAX(r.depth) FROM task_closure r WHERE r.descendant_id = c.ancestor_id)
+                    FROM task_closure c
+                    WHERE c.descendant_id IN (SELECT id FROM {id_table}) AND c.depth > 0
+                      AND c.ancestor_id NOT IN (SELECT id FROM {id_table})"""
+            )
+            depths = [
+                row[0] for row in conn.execute(
+                    "SELECT DISTINCT root_depth FROM temp.completion_ancestors ORDER BY root_depth DESC"
+                )
+            ]
+            for depth in depths:
+                changed += conn.execute(
+                    """UPDATE tasks SET completed = NOT completed,
+                           completion_epoch = CASE WHEN completed THEN NULL ELSE ? END,
+                           updated_epoch = ?
+                       WHERE id IN (SELECT id FROM temp.completion_ancestors WHERE root_depth = ?)
+                         AND completed IS NOT (
+                             SELECT child_count > 0 AND child_count = completed_child_count
+                             FROM task_rollups WHERE task_id = tasks.id
+                         )""",
+                    (now, now, depth)
+                ).rowcount
+        finally:
+            conn.execute("DELETE FROM temp.completion_ancestors")
+        return changed
+    
+    def _copy_tasks(self, conn, id_table: str, now: int) -> Dict[str, str]:
+        """
+        一時テーブル上のタスクを複製（旧ID→新IDの対応を返す）
+        複製対象同士の親子関係は複製後も維持し、それ以外は元の親にぶら下げる
+        """
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS batch_copy_map (old_id TEXT PRIMARY KEY, new_id TEXT NOT NULL)")
+        conn.execute("DELETE FROM temp.batch_copy_map")
+        try:
+            old_ids = [
+                row[0] for row in conn.execute(
+                    f"SELECT b.id FROM {id_table} b JOIN tasks t ON t.id = b.id ORDER BY b.rowid"
+                )
+            ]
+            conn.executemany(
+                "INSERT INTO temp.batch_copy_map (old_id, new_id) VALUES (?, ?)",
+                zip(old_ids, new_ids("t", len(old_ids)))
+            )
+            conn.execute(
+                """INSERT INTO tasks (
+                    id, name, project_id, parent_id, completed, start_epoch, due_epoch,
+                    completion_epoch, notes, assignee, level, collapsed, created_epoch, updated_epoch
+                )
+                SELECT m.new_id, t.name, t.project_id, COALESCE(pm.new_id, t.parent_id),
+                       t.completed, t.start_epoch, t.due_epoch, t.completion_epoch,
+                       t.notes, t.assignee, t.level, t.collapsed, ?, ?
+                FROM temp.batch_copy_map m
+                JOIN tasks t ON t.id = m.old_id
+                LEFT JOIN temp.batch_copy_map pm ON pm.old_id = t.parent_id""",
+                (now, now)
+            )
+            self.hierarchy.index_tasks(conn, "SELECT new_id FROM temp.batch_copy_map")
+            return {
+                row['old_id']: row['new_id']
+                for row in conn.execute("SELECT old_id, new_id FROM temp.batch_copy_map")
+            }
+        finally:
+            conn.execute("DELETE FROM temp.batch_copy_map")
+    
+    def _to_epoch_fields(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """日付フィールドを保存形式（UTCエポックミリ秒の *_epoch 列）に変換"""
+        converted = task_data.copy()
+        for field, column in DATE_COLUMNS.items():
+            if field in converted:
+                converted[column] = to_epoch_ms(converted.pop(field), field)
+        return converted
     
     def _validate_task_data(self, task: Dict[str, Any]) -> None:
         """タスクデータの検証"""
@@ -267,20 +925,12 @@ class TaskService:
         for field in required_fields:
             if not task.get(field):
                 raise ValidationError(f"Required field '{field}' is missing or empty")
-        
-        # 日付フィールドの検証
-        date_fields = ['start_date', 'due_date']
-        for field in date_fields:
-            if field in task and task[field]:
-                try:
-                    if isinstance(task[field], str):
-                        datetime.fromisoformat(task[field].replace('Z', '+00:00'))
-                except ValueError as e:
-                    logger.warn(f"Invalid date format in {field}: {task[field]}")
-                    raise ValidationError(f"Invalid date format in {field}: {task[field]}")
     
     def batch_shift_dates(self, task_ids: List[str], shift_type: str, direction: str, days: int) -> Dict[str, Any]:
-        """タスクの日付を一括でずらす"""
+        """
+        タスクの日付を一括でずらす
+        1トランザクション内で集合的に更新し、失敗はタスクID単位で報告する
+        """
         try:
             if not task_ids:
                 return {"success": False, "error": "No task IDs provided"}
@@ -291,50 +941,68 @@ class TaskService:
             # 更新するフィールドを決定
             update_fields = []
             if shift_type == 'start_only':
-                update_fields = ['start_date']
+                update_fields = ['start_epoch']
             elif shift_type == 'due_only':
-                update_fields = ['due_date']
+                update_fields = ['due_epoch']
             elif shift_type == 'both':
-                update_fields = ['start_date', 'due_date']
+                update_fields = ['start_epoch', 'due_epoch']
             else:
                 raise ValidationError(f"Invalid shift_type: {shift_type}")
             
-            # 各タスクの日付を更新
-            affected_count = 0
-            for task_id in task_ids:
-                try:
-                    # 現在のタスクデータを取得
-                    current_task = self.get_task_by_id(task_id)
-                    
-                    # 日付を更新
-                    updated_data = {}
-                    for field in update_fields:
-                        if field in current_task and current_task[field]:
-                            try:
-                                current_date = datetime.fromisoformat(current_task[field].replace('Z', '+00:00'))
-                                new_date = current_date + timedelta(days=days_delta)
-                                updated_data[field] = new_date.isoformat()
-                            except (ValueError, TypeError) as e:
-                                logger.warn(f"Failed to shift date for task {task_id}, field {field}: {e}")
-                                continue
-                    
-                    # タスクを更新
-                    if updated_data:
-                        self.update_task(task_id, updated_data)
-                        affected_count += 1
-                        logger.info(f"Task {task_id} dates shifted by {days_delta} days")
+            # エポックミリ秒への整数加算（時刻部分はそのまま保持される）
+            set_clauses = [f"{field} = {field} + ?" for field in update_fields]
+            offset_ms = days_delta * DAY_MS
+            now = now_epoch_ms()
+            
+            failed: List[Dict[str, str]] = []
+            
+            with self.db_manager.transaction() as conn:
+                with self.db_manager.temp_id_table(conn, task_ids) as id_table:
+                    cursor = conn.execute(
+                        f"""UPDATE tasks SET {', '.join(set_clauses)}, updated_epoch = ?
+                            WHERE id IN (SELECT id FROM {id_table})
+                            RETURNING id, start_date, due_date""",
+                        tuple([offset_ms] * len(update_fields) + [now])
+                    )
+                    updated = self.db_manager.fetch_rows(cursor)
                     
-                except Exception as e:
-                    logger.error(f"Failed to shift dates for task {task_id}: {e}")
-                    continue
+                    # 更新されなかったID（存在しないタスク）を報告
+                    shifted_ids = {row['id'] for row in updated}
+                    for row in conn.execute(f"SELECT id FROM {id_table} ORDER BY rowid"):
+                        if row['id'] not in shifted_ids:
+                            failed.append({"id": row['id'], "error": "Task not found"})
             
-            logger.info(f"Batch date shift completed: {affected_count}/{len(task_ids)} tasks updated")
+            if failed:
+                logger.warning(f"Failed to shift dates for {len(failed)} tasks (first: {failed[0]['id']}: {failed[0]['error']})")
+            
+            affected_count = len(updated)
+            logger.info(f"Batch date shift completed: {affected_count}/{len(task_ids)} tasks updated by {days_delta} days")
             return {
                 "success": True,
                 "affected_count": affected_count,
-                "message": f"Successfully shifted dates for {affected_count} tasks"
+                "message": f"Successfully shifted dates for {affected_count} tasks",
+                "updated": updated,
+                "failed": failed
             }
             
         except Exception as e:
             logger.error(f"Batch date shift failed: {e}")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+            return {"success": False, "error": str(e)}
+    
+    # 非同期版（ルートハンドラー用：DB専用エグゼキューターで実行）
+    get_tasks_async = async_variant(get_tasks)
+    get_tasks_page_async = async_variant(get_tasks_page)
+    get_task_by_id_async = async_variant(get_task_by_id)
+    get_list_version_async = async_variant(get_list_version)
+    get_task_version_async = async_variant(get_task_version)
+    get_subtree_async = async_variant(get_subtree)
+    get_ancestors_async = async_variant(get_ancestors)
+    search_tasks_async = async_variant(search_tasks)
+    get_timeline_tasks_async = async_variant(get_timeline_tasks)
+    create_task_async = async_variant(create_task)
+    update_task_async = async_variant(update_task)
+    move_task_async = async_variant(move_task)
+    delete_task_async = async_variant(delete_task)
+    bulk_create_tasks_async = async_variant(bulk_create_tasks)
+    batch_update_tasks_async = async_variant(batch_update_tasks)
+    batch_shift_dates_async = async_variant(batch_shift_dates)
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""
+Workspace feature module.
+システムプロンプト準拠：ワークスペース一括エクスポート／インポートの統一エクスポート
+"""
+
+from .routes import router as workspace_router
+
+__all__ = ['workspace_router']
@@ -0,0 +1,69 @@
+"""
+ワークスペース エクスポート／インポートAPIルート
+システムプロンプト準拠：KISS原則、NDJSONによるワークスペース全体の一括移行
+"""
+import tempfile
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from core.database import DatabaseManager
+from core.exceptions import ValidationError
+from core.logger import get_logger
+from api.streaming import streaming_json_response
+from .service import WorkspaceService, CONFLICT_POLICIES
+
+router = APIRouter(tags=["workspace"])
+logger = get_logger(__name__)
+
+# アップロード本文をメモリに保持する上限（超過分は一時ファイルへ退避）
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+def get_workspace_service() -> WorkspaceService:
+    """ワークスペースサービスの依存性注入"""
+    return WorkspaceService(DatabaseManager())
+
+@router.get("/export")
+async def export_workspace(
+    service: WorkspaceService = Depends(get_workspace_service)
+) -> StreamingResponse:
+    """
+    ワークスペース全体のNDJSONエクスポート
+    1つの読み取りスナップショットから、プロジェクト → タスク（親が子より前）の順に逐次出力する
+    """
+    try:
+        response = await streaming_json_response(
+            service.db_manager.iterate_async(service.iter_export()), 'ndjson'
+        )
+        filename = f"workspace-{datetime.now().strftime('%Y%m%d-%H%M%S')}.ndjson"
+        response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+    except Exception as e:
+        logger.error(f"Failed to export workspace: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/import")
+async def import_workspace(
+    request: Request,
+    policy: str = Query('skip', pattern=f"^({'|'.join(CONFLICT_POLICIES)})$", description="ID衝突時の方針"),
+    service: WorkspaceService = Depends(get_workspace_service)
+):
+    """
+    NDJSONのインポート（1トランザクション、不正な行があれば何も反映しない）
+    本文は受信しながら一時領域へ退避し、書き込みロックは受信完了後の反映処理の間だけ保持する
+    """
+    try:
+        with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as spool:
+            async for chunk in request.stream():
+                spool.write(chunk)
+            spool.seek(0)
+            result = await service.import_ndjson_async(spool, policy)
+        logger.info(f"Workspace imported successfully ({policy})")
+        return result
+    except ValidationError as e:
+        logger.error(f"Invalid workspace import: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to import workspace: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
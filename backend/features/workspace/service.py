@@ -0,0 +1,370 @@
+"""
+ワークスペースのエクスポート／インポート
+システムプロンプト準拠：DRY原則、ワークスペース全体の一括移行を集合演算で処理
+
+NDJSON形式（1行1レコード）:
+    {"type": "meta", "format": "todo-workspace", "version": 1, ...}
+    {"type": "project", "id": ..., "name": ..., ...}
+    {"type": "task", "id": ..., "project_id": ..., "parent_id": ..., ...}
+
+エクスポートは1つの読み取りトランザクション（WALのスナップショット）で、
+プロジェクト → タスク（親が子より前）の順に出力する。
+インポートは全行を一時テーブルへ executemany で投入した後、1トランザクション内の
+集合的なINSERTで本テーブルへ反映する。ID衝突時の方針は skip / overwrite / remap。
+"""
+import json
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Generator, Iterator, List, Optional
+
+from core.database import DatabaseManager, async_variant
+from core.exceptions import ValidationError
+from core.id_generator import new_ids
+from core.logger import get_logger
+from core.utils.dates import to_epoch_ms, now_epoch_ms
+from core.utils.validators import validate_project_data, validate_task_data
+from features.tasklist.services.task_hierarchy import TaskHierarchyIndex
+
+logger = get_logger(__name__)
+
+EXPORT_FORMAT = "todo-workspace"
+EXPORT_VERSION = 1
+
+# ID衝突時の方針
+CONFLICT_POLICIES = ('skip', 'overwrite', 'remap')
+
+# 一時テーブルへの投入単位
+IMPORT_BATCH_SIZE = 1000
+
+# レコード種別ごとの日付項目（エクスポートと同じISO 8601文字列、またはnull）
+DATE_FIELDS = {
+    'project': ('created_at', 'updated_at'),
+    'task': ('start_date', 'due_date', 'completion_date', 'created_at', 'updated_at'),
+}
+
+PROJECT_COLUMNS = ['name', 'color', 'collapsed', 'created_epoch', 'updated_epoch']
+TASK_COLUMNS = [
+    'name', 'project_id', 'parent_id', 'completed', 'start_epoch', 'due_epoch', 'completion_epoch',
+    'notes', 'assignee', 'level', 'collapsed', 'created_epoch', 'updated_epoch'
+]
+
+# 親が子より前に並ぶよう、祖先数（クロージャーの最大深さ）順に出力する
+_EXPORT_TASKS_QUERY = """
+SELECT t.id, t.name, t.project_id, t.parent_id, t.completed, t.start_date, t.due_date,
+       t.completion_date, t.notes, t.assignee, t.level, t.collapsed, t.created_at, t.updated_at
+FROM tasks t
+LEFT JOIN (
+    SELECT descendant_id, MAX(depth) AS depth FROM task_closure GROUP BY descendant_id
+) d ON d.descendant_id = t.id
+ORDER BY COALESCE(d.depth, 0), t.project_id, t.due_epoch, t.created_epoch, t.id
+"""
+
+class WorkspaceService:
+    """ワークスペース一括移行サービス"""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self.hierarchy = TaskHierarchyIndex()
+
+    def iter_export(self, batch_size: Optional[int] = None) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        エクスポート行をバッチ単位で返すジェネレーター
+        全クエリを1つの読み取りトランザクションで実行するため、出力途中の更新は反映されない
+        """
+        batch_size = batch_size or IMPORT_BATCH_SIZE
+        with self.db_manager.get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+                yield [{
+                    'type': 'meta',
+                    'format': EXPORT_FORMAT,
+                    'version': EXPORT_VERSION,
+                    'schema_version': schema_version,
+                    'exported_at': datetime.now().isoformat()
+                }]
+
+                project_count = 0
+                cursor = conn.execute(
+                    "SELECT id, name, color, collapsed, created_at, updated_at FROM projects ORDER BY created_epoch, id"
+                )
+                while rows := cursor.fetchmany(batch_size):
+                    project_count += len(rows)
+                    yield [{'type': 'project', **dict(row), 'collapsed': bool(row['collapsed'])} for row in rows]
+
+                task_count = 0
+                cursor = conn.execute(_EXPORT_TASKS_QUERY)
+                while rows := cursor.fetchmany(batch_size):
+                    task_count += len(rows)
+                    yield [
+                        {'type': 'task', **dict(row), 'completed': bool(row['completed']), 'collapsed': bool(row['collapsed'])}
+                        for row in rows
+                    ]
+                logger.info(f"Exported workspace: {project_count} projects, {task_count} tasks")
+            finally:
+                conn.rollback()
+
+    def import_ndjson(self, stream: BinaryIO, policy: str = 'skip') -> Dict[str, Any]:
+        """
+        NDJSONストリームのインポート（1トランザクション）
+        いずれかの行が不正な場合は何も反映しない
+        """
+        if policy not in CONFLICT_POLICIES:
+            raise ValidationError(f"Invalid conflict policy: {policy} (expected one of {', '.join(CONFLICT_POLICIES)})")
+
+        try:
+            with self.db_manager.transaction() as conn:
+                self._create_staging_tables(conn)
+                try:
+                    staged = self._stage_records(conn, self._parse_lines(stream))
+                    project_counts = self._resolve_conflicts(conn, 'import_projects', 'projects', 'p', policy)
+                    task_counts = self._resolve_conflicts(conn, 'import_tasks', 'tasks', 't', policy)
+                    self._write_projects(conn)
+                    parents_changed = self._write_tasks(conn)
+                    self._check_references(conn)
+                    if parents_changed:
+                        # 既存タスクの親が変わった場合は子孫の祖先も変わるため全再構築
+                        self.hierarchy.rebuild(conn)
+                    else:
+                        self.hierarchy.index_tasks(
+                            conn, "SELECT final_id FROM temp.import_tasks WHERE action = 'insert'"
+                        )
+                    id_map = self._remapped_ids(conn) if policy == 'remap' else None
+                finally:
+                    self._clear_staging_tables(conn)
+
+            logger.info(
+                f"Imported workspace ({policy}): {staged['projects']} projects {project_counts}, "
+                f"{staged['tasks']} tasks {task_counts}"
+            )
+            result = {
+                'success': True,
+                'policy': policy,
+                'projects': project_counts,
+                'tasks': task_counts
+            }
+            if id_map is not None:
+                result['id_map'] = id_map
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to import workspace: {e}")
+            raise
+
+    def _parse_lines(self, stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """NDJSONの各行を検証し、保存形式（エポックミリ秒）のレコードに変換"""
+        now = now_epoch_ms()
+        seen = {'project': set(), 'task': set()}
+        for line_no, raw in enumerate(stream, start=1):
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValidationError("Record must be a JSON object")
+                kind = record.get('type')
+                if kind == 'meta':
+                    if record.get('format') != EXPORT_FORMAT or record.get('version') != EXPORT_VERSION:
+                        raise ValidationError(
+                            f"Unsupported export format: {record.get('format')} v{record.get('version')}"
+                        )
+                    continue
+                if kind not in seen:
+                    raise ValidationError(f"Unknown record type: {kind}")
+                if not record.get('id'):
+                    raise ValidationError("Missing required fields: id")
+                if record['id'] in seen[kind]:
+                    raise ValidationError(f"Duplicate {kind} id: {record.get('id')}")
+                for field in DATE_FIELDS[kind]:
+                    if record.get(field) is not None and not isinstance(record[field], str):
+                        raise ValidationError(
+                            f"Invalid date format in {field}: {record[field]!r} (expected an ISO 8601 string)"
+                        )
+                if kind == 'project':
+                    validate_project_data(record)
+                    converted = self._project_row(record, now)
+                else:
+                    validate_task_data(record)
+                    converted = self._task_row(record, now)
+                seen[kind].add(record['id'])
+            except ValueError as e:
+                raise ValidationError(f"Line {line_no}: invalid JSON: {e}")
+            except ValidationError as e:
+                raise ValidationError(f"Line {line_no}: {e.message}")
+            yield {'type': kind, 'row': converted}
+
+    @staticmethod
+    def _project_row(record: Dict[str, Any], now: int) -> tuple:
+        created = to_epoch_ms(record.get('created_at'), 'created_at') or now
+        return (
+            record['id'],
+            record['name'],
+            record['color'],
+            bool(record.get('collapsed', False)),
+            created,
+            to_epoch_ms(record.get('updated_at'), 'updated_at') or created
+        )
+
+    @staticmethod
+    def _task_row(record: Dict[str, Any], now: int) -> tuple:
+        start = to_epoch_ms(record.get('start_date'), 'start_date') or now
+        created = to_epoch_ms(record.get('created_at'), 'created_at') or now
+        return (
+            record['id'],
+            record['name'],
+            record['project_id'],
+            record.get('parent_id'),
+            bool(record.get('completed', False)),
+            start,
+            to_epoch_ms(record.get('due_date'), 'due_date') or start,
+            to_epoch_ms(record.get('completion_date'), 'completion_date'),
+            record.get('notes', ''),
+            record.get('assignee', '自分'),
+            record.get('level', 0),
+            bool(record.get('collapsed', False)),
+            created,
+            to_epoch_ms(record.get('updated_at'), 'updated_at') or created
+        )
+
+    def _create_staging_tables(self, conn) -> None:
+        """接続ローカルの一時テーブル（投入行・最終ID・処理区分）"""
+        conn.execute(
+            f"""CREATE TEMP TABLE IF NOT EXISTS import_projects (
+                seq INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, {', '.join(PROJECT_COLUMNS)},
+                final_id TEXT, action TEXT
+            )"""
+        )
+        conn.execute(
+            f"""CREATE TEMP TABLE IF NOT EXISTS import_tasks (
+                seq INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, {', '.join(TASK_COLUMNS)},
+                final_id TEXT, action TEXT
+            )"""
+        )
+        self._clear_staging_tables(conn)
+
+    @staticmethod
+    def _clear_staging_tables(conn) -> None:
+        conn.execute("DELETE FROM temp.import_projects")
+        conn.execute("DELETE FROM temp.import_tasks")
+
+    def _stage_records(self, conn, records: Iterator[Dict[str, Any]]) -> Dict[str, int]:
+        """検証済みレコードを一時テーブルへバッチ投入"""
+        statements = {
+            'project': f"INSERT INTO temp.import_projects (id, {', '.join(PROJECT_COLUMNS)}) "
+                       f"VALUES ({', '.join('?' for _ in range(len(PROJECT_COLUMNS) + 1))})",
+            'task': f"INSERT INTO temp.import_tasks (id, {', '.join(TASK_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' for _ in range(len(TASK_COLUMNS) + 1))})",
+        }
+        pending: Dict[str, List[tuple]] = {'project': [], 'task': []}
+        counts = {'projects': 0, 'tasks': 0}
+        for record in records:
+            rows = pending[record['type']]
+            rows.append(record['row'])
+            if len(rows) >= IMPORT_BATCH_SIZE:
+                conn.executemany(statements[record['type']], rows)
+                counts[record['type'] + 's'] += len(rows)
+                rows.clear()
+        for kind, rows in pending.items():
+            if rows:
+                conn.executemany(statements[kind], rows)
+                counts[kind + 's'] += len(rows)
+        return counts
+
+    def _resolve_conflicts(self, conn, staging: str, target: str, prefix: str, policy: str) -> Dict[str, int]:
+        """既存IDとの衝突を判定し、方針に従って最終IDと処理区分（insert / update / skip）を決定"""
+        conflict_action = {'skip': 'skip', 'overwrite': 'update', 'remap': 'insert'}[policy]
+        conn.execute(
+            f"""UPDATE temp.{staging} SET final_id = id,
+                   action = CASE WHEN EXISTS (SELECT 1 FROM {target} x WHERE x.id = {staging}.id)
+                                 THEN ? ELSE 'insert' END""",
+            (conflict_action,)
+        )
+        if policy == 'remap':
+            conflicting = [
+                row[0] for row in conn.execute(
+                    f"SELECT t.seq FROM temp.{staging} t JOIN {target} x ON x.id = t.id ORDER BY t.seq"
+                )
+            ]
+            conn.executemany(
+                f"UPDATE temp.{staging} SET final_id = ? WHERE seq = ?",
+                zip(new_ids(prefix, len(conflicting)), conflicting)
+            )
+        counts = {'inserted': 0, 'updated': 0, 'skipped': 0, 'remapped': 0}
+        for row in conn.execute(
+            f"""SELECT action, final_id != id AS remapped, COUNT(*) AS count
+                FROM temp.{staging} GROUP BY action, remapped"""
+        ):
+            counts[{'insert': 'inserted', 'update': 'updated', 'skip': 'skipped'}[row['action']]] += row['count']
+            if row['remapped']:
+                counts['remapped'] += row['count']
+        return counts
+
+    def _write_projects(self, conn) -> None:
+        columns = ', '.join(PROJECT_COLUMNS)
+        conn.execute(
+            f"""INSERT INTO projects (id, {columns})
+                SELECT final_id, {columns} FROM temp.import_projects
+                WHERE action != 'skip' ORDER BY seq
+                ON CONFLICT(id) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in PROJECT_COLUMNS)}"""
+        )
+
+    def _write_tasks(self, conn) -> bool:
+        """
+        タスクを反映（参照先プロジェクト・親タスクは最終IDに置換）
+        上書きにより既存タスクの親が変わったかを返す
+        """
+        resolved = """SELECT s.seq, s.final_id,
+                             COALESCE((SELECT p.final_id FROM temp.import_projects p WHERE p.id = s.project_id), s.project_id) AS project_id,
+                             CASE WHEN s.parent_id IS NULL THEN NULL
+                                  ELSE COALESCE((SELECT t.final_id FROM temp.import_tasks t WHERE t.id = s.parent_id), s.parent_id)
+                             END AS parent_id,
+                             s.action
+                      FROM temp.import_tasks s"""
+        parents_changed = conn.execute(
+            f"""SELECT 1 FROM ({resolved}) r JOIN tasks t ON t.id = r.final_id
+                WHERE r.action = 'update' AND t.parent_id IS NOT r.parent_id LIMIT 1"""
+        ).fetchone() is not None
+
+        columns = [c for c in TASK_COLUMNS if c not in ('project_id', 'parent_id')]
+        conn.execute(
+            f"""INSERT INTO tasks (id, project_id, parent_id, {', '.join(columns)})
+                SELECT r.final_id, r.project_id, r.parent_id, {', '.join(f's.{c}' for c in columns)}
+                FROM ({resolved}) r JOIN temp.import_tasks s ON s.seq = r.seq
+                WHERE r.action != 'skip' ORDER BY r.seq
+                ON CONFLICT(id) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in TASK_COLUMNS)}"""
+        )
+        return parents_changed
+
+    @staticmethod
+    def _check_references(conn) -> None:
+        """反映したタスクのプロジェクト・親タスクが存在することを確認"""
+        missing = conn.execute(
+            """SELECT t.id, t.project_id, t.parent_id,
+                      p.id IS NULL AS no_project,
+                      t.parent_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM tasks x WHERE x.id = t.parent_id) AS no_parent
+               FROM temp.import_tasks s JOIN tasks t ON t.id = s.final_id
+               LEFT JOIN projects p ON p.id = t.project_id
+               WHERE s.action != 'skip' AND (no_project OR no_parent)
+               LIMIT 10"""
+        ).fetchall()
+        if missing:
+            details = ', '.join(
+                f"{row['id']} (project {row['project_id']} not found)" if row['no_project']
+                else f"{row['id']} (parent {row['parent_id']} not found)"
+                for row in missing
+            )
+            raise ValidationError(f"Imported tasks reference missing records: {details}")
+
+    @staticmethod
+    def _remapped_ids(conn) -> Dict[str, Dict[str, str]]:
+        """remap で採番し直したIDの対応（元ID → 新ID）"""
+        return {
+            kind: {
+                row['id']: row['final_id']
+                for row in conn.execute(f"SELECT id, final_id FROM temp.{staging} WHERE final_id != id ORDER BY seq")
+            }
+            for kind, staging in (('projects', 'import_projects'), ('tasks', 'import_tasks'))
+        }
+
+    # 非同期版（ルートハンドラー用：DB専用エグゼキューターで実行）
+    import_ndjson_async = async_variant(import_ndjson)
@@ -0,0 +1,6 @@
+"""
+回帰テスト
+システムプロンプト準拠：標準ライブラリ unittest のみで実行
+
+    cd backend && python -m unittest discover -s tests -t .
+"""
@@ -0,0 +1,50 @@
+"""
+テスト用の一時データベース
+システムプロンプト準拠：DRY原則、マイグレーション適用済みのデータベースをテストクラスごとに用意
+"""
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.config import config
+from core.database import DatabaseManager, close_database, init_database
+
+class DatabaseTestCase(unittest.TestCase):
+    """一時ディレクトリのデータベースにマイグレーションを適用して使うテスト基底クラス"""
+
+    # テストクラスごとに変更する設定（終了時に元へ戻す）
+    config_overrides = {}
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmpdir = Path(tempfile.mkdtemp(prefix="todo-test-"))
+        overrides = {
+            'database_path': cls._tmpdir / 'todo.db',
+            'log_file': cls._tmpdir / 'app.log',
+            'slow_query_log_file': cls._tmpdir / 'slow_query.log',
+            **cls.config_overrides
+        }
+        cls._saved_config = {name: getattr(config, name) for name in overrides}
+        for name, value in overrides.items():
+            setattr(config, name, value)
+        init_database()
+        cls.db_manager = DatabaseManager()
+
+    @classmethod
+    def tearDownClass(cls):
+        close_database()
+        for name, value in cls._saved_config.items():
+            setattr(config, name, value)
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
+    def create_task(self, service, name: str, project_id: str = 'p1', **fields):
+        """日付を補ったタスク作成"""
+        data = {
+            'name': name,
+            'project_id': project_id,
+            'start_date': '2024-01-01T00:00:00Z',
+            'due_date': '2024-01-02T00:00:00Z',
+            **fields
+        }
+        return service.create_task(data)
@@ -0,0 +1,64 @@
+"""
+グループコミット（DB_GROUP_COMMIT=true）の回帰テスト
+"""
+import threading
+import unittest
+
+from core.exceptions import NotFoundError
+from features.tasklist.services.project_service import ProjectService
+from features.tasklist.services.task_service import TaskService
+from tests.support import DatabaseTestCase
+
+class GroupCommitTest(DatabaseTestCase):
+    config_overrides = {'db_group_commit': True}
+
+    def setUp(self):
+        self.tasks = TaskService(self.db_manager)
+        self.projects = ProjectService(self.db_manager)
+
+    def batches(self) -> int:
+        return self.db_manager.get_group_commit_stats()['batches']
+
+    def test_service_writes_go_through_writer(self):
+        before = self.batches()
+        project = self.projects.create_project({'name': 'まとめ書き', 'color': '#112233'})
+        task = self.create_task(self.tasks, '書き込み', project['id'])
+        self.tasks.update_task(task['id'], {'completed': True})
+        self.tasks.batch_update_tasks('incomplete', [task['id']])
+        self.tasks.delete_task(task['id'])
+        self.projects.update_project(project['id'], {'name': '更新'})
+
+        self.assertEqual(self.batches() - before, 6)
+        self.assertEqual(self.projects.get_project_by_id(project['id'])['name'], '更新')
+        with self.assertRaises(NotFoundError):
+            self.tasks.get_task_by_id(task['id'])
+
+    def test_failed_transaction_is_isolated(self):
+        kept = self.create_task(self.tasks, '残る')
+        with self.assertRaises(NotFoundError):
+            self.tasks.update_task('missing-task', {'name': 'x'})
+        self.assertEqual(self.tasks.get_task_by_id(kept['id'])['name'], '残る')
+
+    def test_concurrent_transactions_share_commits(self):
+        created = []
+        lock = threading.Lock()
+        failed_before = self.db_manager.get_group_commit_stats()['failed']
+
+        def create(index: int) -> None:
+            task = self.create_task(self.tasks, f'並行{index}')
+            with lock:
+                created.append(task['id'])
+
+        threads = [threading.Thread(target=create, args=(index,)) for index in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(created)), 20)
+        for task_id in created:
+            self.assertEqual(self.tasks.get_task_by_id(task_id)['id'], task_id)
+        self.assertEqual(self.db_manager.get_group_commit_stats()['failed'], failed_before)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+文ごとのレイテンシ統計（/api/diagnostics/query-stats）の回帰テスト
+"""
+import unittest
+
+from core.query_metrics import get_query_metrics
+from features.tasklist.services.task_service import TaskService
+from tests.support import DatabaseTestCase
+
+class QueryStatsTest(DatabaseTestCase):
+
+    def setUp(self):
+        get_query_metrics().reset()
+        self.tasks = TaskService(self.db_manager)
+
+    def shapes(self):
+        return [statement['shape'].upper() for statement in self.db_manager.get_query_stats()['statements']]
+
+    def test_transaction_statements_are_recorded(self):
+        task = self.create_task(self.tasks, '計測対象')
+        self.tasks.update_task(task['id'], {'name': '計測対象（更新）'})
+        self.tasks.batch_update_tasks('complete', [task['id']])
+        self.tasks.delete_task(task['id'])
+
+        shapes = self.shapes()
+        self.assertTrue(any(shape.startswith('INSERT INTO TASKS') for shape in shapes))
+        self.assertTrue(any(shape.startswith('UPDATE TASKS') for shape in shapes))
+        self.assertTrue(any(shape.startswith('DELETE FROM TASKS') for shape in shapes))
+
+    def test_returning_writes_record_affected_rows(self):
+        ids = [self.create_task(self.tasks, f'日付シフト{index}', start_date='2030-01-01T00:00:00Z')['id']
+               for index in range(5)]
+        get_query_metrics().reset()
+
+        self.tasks.batch_shift_dates(ids, 'both', 'forward', 3)
+
+        returning = [statement for statement in self.db_manager.get_query_stats()['statements']
+                     if 'RETURNING' in statement['shape'].upper()]
+        self.assertTrue(returning)
+        self.assertEqual(sum(statement['rows'] for statement in returning), len(ids))
+
+if __name__ == '__main__':
+    unittest.main()
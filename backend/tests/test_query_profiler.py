@@ -0,0 +1,44 @@
+"""
+クエリプロファイラ（EXPLAIN QUERY PLAN 収集とインデックス提案）の回帰テスト
+"""
+import io
+import json
+import unittest
+
+from core.query_profiler import IndexAdvisor, StatementProfile, get_query_profiler
+from features.tasklist.services.task_service import TaskService
+from features.workspace.service import WorkspaceService
+from tests.support import DatabaseTestCase
+
+class QueryPlanReportTest(DatabaseTestCase):
+    config_overrides = {'db_query_profiling': True}
+
+    def setUp(self):
+        get_query_profiler().reset()
+        self.tasks = TaskService(self.db_manager)
+        self.workspace = WorkspaceService(self.db_manager)
+
+    def test_report_survives_profiled_upsert_import(self):
+        self.create_task(self.tasks, 'インポート元')
+        lines = [json.dumps(record) for batch in self.workspace.iter_export() for record in batch]
+        exported = io.BytesIO(("\n".join(lines) + "\n").encode('utf-8'))
+        self.assertTrue(self.workspace.import_ndjson(exported, 'overwrite')['success'])
+
+        report = self.db_manager.get_query_plan_report()
+
+        self.assertTrue(report['enabled'])
+        shapes = [statement['shape'] for statement in report['statements']]
+        self.assertTrue(any('DO UPDATE SET' in shape.upper() for shape in shapes))
+
+    def test_advisor_ignores_upsert_set_clause(self):
+        with self.db_manager.get_connection() as conn:
+            advisor = IndexAdvisor(conn)
+            aliases = advisor._table_aliases(
+                "INSERT INTO tasks (id, name) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET name = excluded.name"
+            )
+            self.assertEqual(set(aliases.values()), {'tasks'})
+            self.assertEqual(advisor._table_columns('no_such"table'), [])
+            self.assertEqual(advisor.suggest(StatementProfile(shape="SELECT * FROM no_such_table x WHERE x.a = ?")), [])
+
+if __name__ == '__main__':
+    unittest.main()
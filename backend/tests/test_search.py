@@ -0,0 +1,30 @@
+"""
+全文検索（強調・スニペット）の回帰テスト
+"""
+import unittest
+
+from features.tasklist.services.task_service import TaskService
+from tests.support import DatabaseTestCase
+
+class TaskSearchTest(DatabaseTestCase):
+
+    def setUp(self):
+        self.tasks = TaskService(self.db_manager)
+
+    def test_highlight_escapes_task_text(self):
+        task = self.create_task(self.tasks, '<img src=x onerror=alert(1)> 脆弱性検証',
+                                notes='脆弱性メモ & <script>alert("x")</script>')
+
+        for query in ('脆弱性検証', '脆弱'):
+            results = self.tasks.search_tasks(query)
+            self.assertEqual([result['id'] for result in results], [task['id']], query)
+            highlight, snippet = results[0]['name_highlight'], results[0]['notes_snippet']
+            self.assertTrue(highlight.startswith('&lt;img src=x onerror=alert(1)&gt; '), highlight)
+            self.assertIn('<mark>', highlight)
+            self.assertNotIn('<script>', snippet)
+            self.assertIn('&lt;script&gt;', snippet)
+            self.assertIn('&amp;', snippet)
+            self.assertEqual(results[0]['name'], task['name'])
+
+if __name__ == '__main__':
+    unittest.main()
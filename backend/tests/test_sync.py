@@ -0,0 +1,51 @@
+"""
+差分同期（GET /api/changes）の回帰テスト
+"""
+import unittest
+
+from features.sync.service import SyncService
+from features.tasklist.services.project_service import ProjectService
+from features.tasklist.services.task_service import TaskService
+from tests.support import DatabaseTestCase
+
+class SyncChangesTest(DatabaseTestCase):
+
+    def setUp(self):
+        self.sync = SyncService(self.db_manager)
+        self.tasks = TaskService(self.db_manager)
+        self.projects = ProjectService(self.db_manager)
+
+    def test_changes_return_updated_and_deleted_rows(self):
+        since = self.sync.get_changes()['latest_seq']
+        project = self.projects.create_project({'name': '同期', 'color': '#112233'})
+        kept = self.create_task(self.tasks, '残す', project['id'])
+        removed = self.create_task(self.tasks, '消す', project['id'])
+        self.tasks.update_task(kept['id'], {'name': '残す（更新）'})
+        self.tasks.delete_task(removed['id'])
+
+        changes = self.sync.get_changes(since)
+
+        self.assertEqual([p['id'] for p in changes['projects']], [project['id']])
+        self.assertEqual([t['id'] for t in changes['tasks']], [kept['id']])
+        self.assertEqual(changes['tasks'][0]['name'], '残す（更新）')
+        self.assertEqual(changes['tasks'][0]['project_id'], project['id'])
+        self.assertIs(changes['tasks'][0]['completed'], False)
+        self.assertEqual(changes['deleted']['tasks'], [removed['id']])
+        self.assertEqual(changes['next_since'], changes['latest_seq'])
+        self.assertFalse(changes['has_more'])
+
+    def test_changes_are_paged_by_limit(self):
+        since = self.sync.get_changes()['latest_seq']
+        for index in range(3):
+            self.create_task(self.tasks, f'ページ{index}')
+
+        first = self.sync.get_changes(since, limit=2)
+        second = self.sync.get_changes(first['next_since'], limit=2)
+
+        self.assertTrue(first['has_more'])
+        self.assertEqual(len(first['tasks']), 2)
+        self.assertEqual(len(second['tasks']), 1)
+        self.assertFalse(second['has_more'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+完了状態の階層伝播（update_task / batch_update_tasks の propagate）の回帰テスト
+"""
+import unittest
+
+from features.tasklist.services.task_service import TaskService
+from tests.support import DatabaseTestCase
+
+class CompletionPropagationTest(DatabaseTestCase):
+
+    def setUp(self):
+        self.tasks = TaskService(self.db_manager)
+        # root ─┬─ a ── a1
+        #       └─ b
+        self.root = self.create_task(self.tasks, '親')
+        self.a = self.create_task(self.tasks, '子A', parent_id=self.root['id'], level=1)
+        self.a1 = self.create_task(self.tasks, '孫A1', parent_id=self.a['id'], level=2)
+        self.b = self.create_task(self.tasks, '子B', parent_id=self.root['id'], level=1)
+
+    def completed(self, *tasks):
+        return [bool(self.tasks.get_task_by_id(task['id'])['completed']) for task in tasks]
+
+    def test_completing_parent_completes_subtree(self):
+        self.tasks.update_task(self.root['id'], {'completed': True}, propagate=True)
+
+        self.assertEqual(self.completed(self.root, self.a, self.a1, self.b), [True, True, True, True])
+        self.assertIsNotNone(self.tasks.get_task_by_id(self.a1['id'])['completion_date'])
+
+    def test_completing_last_open_child_completes_ancestors(self):
+        self.tasks.update_task(self.a1['id'], {'completed': True}, propagate=True)
+        self.assertEqual(self.completed(self.root, self.a, self.a1, self.b), [False, True, True, False])
+
+        result = self.tasks.batch_update_tasks('complete', [self.b['id']], propagate=True)
+
+        self.assertEqual(self.completed(self.root, self.a, self.a1, self.b), [True, True, True, True])
+        self.assertEqual(result['propagated_count'], 1)
+
+    def test_uncompleting_child_reopens_ancestors(self):
+        self.tasks.update_task(self.root['id'], {'completed': True}, propagate=True)
+
+        self.tasks.update_task(self.a1['id'], {'completed': False}, propagate=True)
+
+        self.assertEqual(self.completed(self.root, self.a, self.a1, self.b), [False, False, False, True])
+        self.assertIsNone(self.tasks.get_task_by_id(self.root['id'])['completion_date'])
+
+    def test_without_propagate_hierarchy_is_unchanged(self):
+        self.tasks.update_task(self.a1['id'], {'completed': True})
+        self.tasks.update_task(self.root['id'], {'completed': True})
+
+        self.assertEqual(self.completed(self.root, self.a, self.a1, self.b), [True, False, True, False])
+
+        result = self.tasks.batch_update_tasks('incomplete', [self.a1['id']])
+        self.assertEqual(self.completed(self.root, self.a, self.a1, self.b), [True, False, False, False])
+        self.assertNotIn('propagated_count', result)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+タスク階層（クロージャーテーブル）保守の回帰テスト
+"""
+import unittest
+
+from core.exceptions import ValidationError
+from features.tasklist.services.task_hierarchy import TaskHierarchyIndex
+from features.tasklist.services.task_service import MAX_TASK_LEVEL, TaskService
+from tests.support import DatabaseTestCase
+
+class TaskHierarchyIndexTest(DatabaseTestCase):
+
+    def setUp(self):
+        self.tasks = TaskService(self.db_manager)
+        self.hierarchy = TaskHierarchyIndex()
+
+    def test_rebuild_and_index_report_row_counts(self):
+        parent = self.create_task(self.tasks, '親')
+        child = self.create_task(self.tasks, '子', parent_id=parent['id'], level=1)
+
+        with self.db_manager.transaction() as conn:
+            total = conn.execute("SELECT count(*) FROM task_closure").fetchone()[0]
+            self.assertEqual(self.hierarchy.rebuild(conn), total)
+            conn.execute("DELETE FROM task_closure WHERE descendant_id = ?", (child['id'],))
+            self.assertEqual(self.hierarchy.index_tasks(conn, "SELECT 'missing'"), 0)
+            indexed = self.hierarchy.index_tasks(conn, f"SELECT '{child['id']}'")
+        # 子自身の行と親との行の2行
+        self.assertEqual(indexed, 2)
+        self.assertGreaterEqual(total, 3)
+
+class TaskMoveTest(DatabaseTestCase):
+
+    def setUp(self):
+        self.tasks = TaskService(self.db_manager)
+        # source ── child ── grandchild、target
+        self.source = self.create_task(self.tasks, '移動元')
+        self.child = self.create_task(self.tasks, '移動元の子', parent_id=self.source['id'], level=1)
+        self.grandchild = self.create_task(self.tasks, '移動元の孫', parent_id=self.child['id'], level=2)
+        self.target = self.create_task(self.tasks, '移動先', project_id='p2')
+
+    def closure(self, task_id: str):
+        return self.db_manager.execute_query(
+            "SELECT ancestor_id, depth FROM task_closure WHERE descendant_id = ? ORDER BY depth", (task_id,)
+        )
+
+    def test_move_rewrites_subtree(self):
+        moved = self.tasks.move_task(self.source['id'], {'parent_id': self.target['id']})
+
+        self.assertEqual(moved['moved_count'], 3)
+        self.assertEqual(moved['parent_id'], self.target['id'])
+        for task, level in ((self.source, 1), (self.child, 2), (self.grandchild, 3)):
+            stored = self.tasks.get_task_by_id(task['id'])
+            self.assertEqual((stored['project_id'], stored['level']), ('p2', level), task['name'])
+        self.assertEqual(
+            [(row['ancestor_id'], row['depth']) for row in self.closure(self.grandchild['id'])],
+            [(self.grandchild['id'], 0), (self.child['id'], 1), (self.source['id'], 2), (self.target['id'], 3)]
+        )
+
+        self.tasks.move_task(self.source['id'], {'parent_id': None})
+        self.assertEqual(
+            [row['ancestor_id'] for row in self.closure(self.grandchild['id'])],
+            [self.grandchild['id'], self.child['id'], self.source['id']]
+        )
+        self.assertEqual(self.tasks.get_task_by_id(self.grandchild['id'])['level'], 2)
+
+    def test_move_under_own_descendant_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            self.tasks.move_task(self.source['id'], {'parent_id': self.grandchild['id']})
+
+        self.assertIsNone(self.tasks.get_task_by_id(self.source['id'])['parent_id'])
+        self.assertEqual(len(self.closure(self.grandchild['id'])), 3)
+
+    def test_move_beyond_max_level_is_rejected(self):
+        deepest = self.target
+        for level in range(1, MAX_TASK_LEVEL):
+            deepest = self.create_task(self.tasks, f'深さ{level}', project_id='p2',
+                                       parent_id=deepest['id'], level=level)
+
+        # 深さ MAX_TASK_LEVEL - 1 の下へ深さ2のサブツリーを移すと最大レベルを超える
+        with self.assertRaises(ValidationError):
+            self.tasks.move_task(self.source['id'], {'parent_id': deepest['id']})
+
+        self.assertEqual(self.tasks.get_task_by_id(self.grandchild['id'])['level'], 2)
+        self.tasks.move_task(self.grandchild['id'], {'parent_id': deepest['id']})
+        self.assertEqual(self.tasks.get_task_by_id(self.grandchild['id'])['level'], MAX_TASK_LEVEL)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+"""
+タイムライン（期間指定のタスク取得）の回帰テスト
+"""
+import unittest
+from unittest import mock
+
+from features.tasklist.services.task_service import TaskService
+from tests.support import DatabaseTestCase
+
+class TimelineQueryTest(DatabaseTestCase):
+
+    def setUp(self):
+        self.tasks = TaskService(self.db_manager)
+
+    def test_project_filter_keeps_interval_index_as_driver(self):
+        inside = self.create_task(self.tasks, '期間内', start_date='2030-01-10T00:00:00Z', due_date='2030-01-12T00:00:00Z')
+        self.create_task(self.tasks, '期間外', start_date='2030-03-01T00:00:00Z', due_date='2030-03-02T00:00:00Z')
+        self.create_task(self.tasks, '別プロジェクト', project_id='p2',
+                         start_date='2030-01-10T00:00:00Z', due_date='2030-01-12T00:00:00Z')
+
+        with mock.patch.object(self.db_manager, 'execute_query', wraps=self.db_manager.execute_query) as execute:
+            tasks = self.tasks.get_timeline_tasks('2030-01-11T00:00:00Z', '2030-01-20T00:00:00Z', 'p1')
+        self.assertEqual([task['id'] for task in tasks], [inside['id']])
+
+        query, params = execute.call_args.args
+        with self.db_manager.get_connection() as conn:
+            plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params)]
+        self.assertTrue(plan[0].startswith('SCAN i VIRTUAL TABLE INDEX 2:'), plan)
+
+if __name__ == '__main__':
+    unittest.main()
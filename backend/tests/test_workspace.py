@@ -0,0 +1,66 @@
+"""
+ワークスペースのエクスポート／インポートの回帰テスト
+"""
+import io
+import json
+import unittest
+
+from core.exceptions import NotFoundError, ValidationError
+from features.sync.service import SyncService
+from features.tasklist.services.task_service import TaskService
+from features.workspace.service import WorkspaceService
+from tests.support import DatabaseTestCase
+
+class WorkspaceImportTest(DatabaseTestCase):
+
+    def setUp(self):
+        self.workspace = WorkspaceService(self.db_manager)
+        self.tasks = TaskService(self.db_manager)
+
+    def export_ndjson(self) -> io.BytesIO:
+        lines = [json.dumps(record) for batch in self.workspace.iter_export() for record in batch]
+        return io.BytesIO(("\n".join(lines) + "\n").encode('utf-8'))
+
+    def test_overwrite_import_replaces_existing_rows(self):
+        parent = self.create_task(self.tasks, '上書き元')
+        child = self.create_task(self.tasks, '子', parent_id=parent['id'], level=1)
+        exported = self.export_ndjson()
+        self.tasks.update_task(child['id'], {'name': 'エクスポート後の変更'})
+        since = SyncService(self.db_manager).get_changes()['latest_seq']
+
+        result = self.workspace.import_ndjson(exported, 'overwrite')
+
+        self.assertTrue(result['success'])
+        self.assertEqual(self.tasks.get_task_by_id(child['id'])['name'], '子')
+        # 上書きした行は変更履歴に1行ずつ記録し直される
+        changes = SyncService(self.db_manager).get_changes(since)
+        self.assertIn(child['id'], [task['id'] for task in changes['tasks']])
+        count = self.db_manager.execute_query(
+            "SELECT count(*) AS n FROM change_log WHERE entity = 'task' AND entity_id = ?", (child['id'],)
+        )[0]['n']
+        self.assertEqual(count, 1)
+
+    def test_skip_and_remap_imports(self):
+        self.create_task(self.tasks, '既存')
+        skipped = self.workspace.import_ndjson(self.export_ndjson(), 'skip')
+        remapped = self.workspace.import_ndjson(self.export_ndjson(), 'remap')
+
+        self.assertTrue(skipped['success'])
+        self.assertTrue(remapped['success'])
+        self.assertTrue(remapped['id_map'])
+
+    def test_non_string_dates_are_rejected_per_line(self):
+        meta = {'type': 'meta', 'format': 'todo-workspace', 'version': 1}
+        for field, value in (('start_date', 1700000000000), ('due_date', {'at': '2024-01-01'}),
+                             ('created_at', ['2024-01-01']), ('completion_date', True)):
+            task = {'type': 'task', 'id': 'date-check', 'name': '日付不正', 'project_id': 'p1', field: value}
+            stream = io.BytesIO(("\n".join(json.dumps(record) for record in (meta, task)) + "\n").encode('utf-8'))
+            with self.assertRaises(ValidationError) as raised:
+                self.workspace.import_ndjson(stream, 'skip')
+            self.assertIn('Line 2', raised.exception.message, field)
+            self.assertIn(field, raised.exception.message)
+        with self.assertRaises(NotFoundError):
+            self.tasks.get_task_by_id('date-check')
+
+if __name__ == '__main__':
+    unittest.main()
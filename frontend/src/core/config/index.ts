@@ -11,6 +11,9 @@ export const APP_PATHS = {
     PROJECTS: '/api/projects',
     TASKS: '/api/tasks',
     BATCH: '/api/tasks/batch',
+    TIMELINE: '/api/timeline',
+    CHANGES: '/api/changes',
+    EVENTS: '/api/events',
     HEALTH: '/api/health'
   }
 } as const
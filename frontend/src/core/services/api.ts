@@ -1,11 +1,22 @@
 // システムプロンプト準拠：API通信統合（apiService + 日付変換）
 
-import { Project, Task, BatchOperationResult } from '@core/types'
+import {
+  Project, Task, BatchOperationResult, ChangeSet, ChangeNotice, ChangeEventHandlers, TaskSearchResult
+} from '@core/types'
 import { APP_CONFIG, APP_PATHS, joinPath } from '@core/config'
 import { logger } from '@core/utils/logger'
 import { errorHandler } from '@core/utils/errorHandler'
 import { convertApiResponseDate } from '@core/utils/core'
 
+// サーバー側集計フィールドの名前対応（snake_case → camelCase）
+const ROLLUP_FIELDS: ReadonlyArray<[string, string]> = [
+  ['task_count', 'taskCount'],
+  ['completed_task_count', 'completedTaskCount'],
+  ['overdue_task_count', 'overdueTaskCount'],
+  ['child_count', 'childCount'],
+  ['completed_child_count', 'completedChildCount']
+]
+
 class ApiService {
   private baseUrl = `http://localhost:${APP_CONFIG.PORTS.BACKEND}`
 
@@ -78,6 +89,14 @@ class ApiService {
         delete converted.parent_id
       }
 
+      // 集計フィールド変換
+      for (const [source, target] of ROLLUP_FIELDS) {
+        if (source in converted) {
+          converted[target] = converted[source]
+          delete converted[source]
+        }
+      }
+
       return converted as T
     }
 
@@ -163,6 +182,35 @@ class ApiService {
     return this.request<Task[]>(endpoint)
   }
 
+  // タイムラインの表示期間と重なるタスクのみ取得
+  async getTimelineTasks(from: Date, to: Date, projectId?: string): Promise<Task[]> {
+    const params = new URLSearchParams({ from: from.toISOString(), to: to.toISOString() })
+    if (projectId) params.set('projectId', projectId)
+    return this.request<Task[]>(`${APP_PATHS.API.TIMELINE}?${params.toString()}`)
+  }
+
+  // 全文検索（タスク名・メモ、関連度順）
+  async searchTasks(
+    query: string,
+    options: { projectId?: string; completed?: boolean; limit?: number } = {}
+  ): Promise<TaskSearchResult[]> {
+    const params = new URLSearchParams({ q: query })
+    if (options.projectId) params.set('projectId', options.projectId)
+    if (options.completed !== undefined) params.set('completed', String(options.completed))
+    if (options.limit) params.set('limit', String(options.limit))
+    const results = await this.request<(Task & {
+      score: number | null
+      name_highlight: string
+      notes_snippet: string | null
+    })[]>(`${APP_PATHS.API.TASKS}/search?${params.toString()}`)
+
+    return results.map(({ name_highlight, notes_snippet, ...task }) => ({
+      ...task,
+      nameHighlight: name_highlight,
+      notesSnippet: notes_snippet
+    }))
+  }
+
   async createTask(task: Omit<Task, 'id'>): Promise<Task> {
     const convertedTask = this.convertRequestDates(task)
     
@@ -191,40 +239,56 @@ class ApiService {
     })
   }
 
-  async updateTask(id: string, task: Partial<Task>): Promise<Task> {
+  // propagate: 完了状態の変更を子孫・祖先へサーバー側で伝播する
+  async updateTask(id: string, task: Partial<Task>, options: { propagate?: boolean } = {}): Promise<Task> {
     const convertedTask = this.convertRequestDates(task)
     
     if (convertedTask.name !== undefined && (!convertedTask.name || !convertedTask.name.trim())) {
       throw new Error('タスク名は必須です')
     }
     
-    return this.request<Task>(joinPath(APP_PATHS.API.TASKS, id), {
+    const query = options.propagate ? '?propagate=true' : ''
+    return this.request<Task>(`${joinPath(APP_PATHS.API.TASKS, id)}${query}`, {
       method: 'PUT',
       body: JSON.stringify(convertedTask),
     })
   }
 
+  // サブツリー移動（parentId: null はルートへ移動。子孫の projectId / level はサーバー側で書き換える）
+  async moveTask(id: string, target: { parentId?: string | null; projectId?: string }): Promise<Task> {
+    const body: Record<string, string | null> = {}
+    if (target.parentId !== undefined) body.parent_id = target.parentId
+    if (target.projectId !== undefined) body.project_id = target.projectId
+
+    return this.request<Task>(joinPath(APP_PATHS.API.TASKS, id, 'move'), {
+      method: 'POST',
+      body: JSON.stringify(body),
+    })
+  }
+
   async deleteTask(id: string): Promise<void> {
     return this.request<void>(joinPath(APP_PATHS.API.TASKS, id), {
       method: 'DELETE',
     })
   }
 
-  async batchUpdateTasks(operation: string, taskIds: string[]): Promise<BatchOperationResult> {
+  async batchUpdateTasks(operation: string, taskIds: string[], options: { propagate?: boolean } = {}): Promise<BatchOperationResult> {
     const response = await this.request<{
       message: string
       affected_count: number
       task_ids: string[]
+      propagated_count?: number
     }>(APP_PATHS.API.BATCH, {
       method: 'POST',
-      body: JSON.stringify({ operation, task_ids: taskIds }),
+      body: JSON.stringify({ operation, task_ids: taskIds, propagate: options.propagate ?? false }),
     })
 
     return {
       success: true,
       message: response.message,
       affected_count: response.affected_count,
-      task_ids: response.task_ids
+      task_ids: response.task_ids,
+      propagated_count: response.propagated_count
     }
   }
 
@@ -250,6 +314,57 @@ class ApiService {
       task_ids: response.task_ids
     }
   }
+
+  // 差分同期API（since以降に変更・削除されたレコードのみ取得）
+  async getChanges(since: number = 0, limit?: number): Promise<ChangeSet> {
+    const params = new URLSearchParams({ since: String(since) })
+    if (limit) params.set('limit', String(limit))
+    const response = await this.request<{
+      since: number
+      next_since: number
+      latest_seq: number
+      has_more: boolean
+      reset: boolean
+      projects: Project[]
+      tasks: Task[]
+      deleted: { projects: string[]; tasks: string[] }
+    }>(`${APP_PATHS.API.CHANGES}?${params.toString()}`)
+
+    return {
+      since: response.since,
+      nextSince: response.next_since,
+      latestSeq: response.latest_seq,
+      hasMore: response.has_more,
+      reset: response.reset,
+      projects: this.convertResponseDates(response.projects),
+      tasks: this.convertResponseDates(response.tasks),
+      deleted: response.deleted
+    }
+  }
+
+  // 変更通知の購読（SSE、戻り値で購読解除）。再接続はEventSourceが Last-Event-ID 付きで行う
+  subscribeChanges(handlers: ChangeEventHandlers, projectIds: string[] = []): () => void {
+    const params = new URLSearchParams()
+    projectIds.forEach(id => params.append('projectId', id))
+    const query = params.toString()
+    const source = new EventSource(
+      joinPath(this.baseUrl, query ? `${APP_PATHS.API.EVENTS}?${query}` : APP_PATHS.API.EVENTS)
+    )
+
+    source.addEventListener('changes', event => {
+      const data = JSON.parse((event as MessageEvent).data) as { seq: number; changes: ChangeNotice[] }
+      handlers.onChanges(data.seq, data.changes)
+    })
+    source.addEventListener('resync', event => {
+      const data = JSON.parse((event as MessageEvent).data) as { since: number }
+      handlers.onResync(data.since)
+    })
+    source.onerror = () => {
+      logger.warn('Change event stream interrupted', { readyState: source.readyState }, 'ApiService', 'subscribeChanges')
+    }
+
+    return () => source.close()
+  }
 }
 
 export const apiService = new ApiService()
\ No newline at end of file
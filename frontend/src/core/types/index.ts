@@ -35,6 +35,10 @@ export interface Project {
   collapsed: boolean
   createdAt?: Date
   updatedAt?: Date
+  // サーバー側集計（一覧・詳細取得時のみ）
+  taskCount?: number
+  completedTaskCount?: number
+  overdueTaskCount?: number
 }
 
 export interface Task {
@@ -52,6 +56,9 @@ export interface Task {
   collapsed: boolean
   createdAt?: Date
   updatedAt?: Date
+  // 直下の子タスク集計（サーバー応答のみ）
+  childCount?: number
+  completedChildCount?: number
   _isDraft?: boolean
 }
 
@@ -113,6 +120,46 @@ export interface BatchOperationResult {
   message: string
   affected_count: number
   task_ids: string[]
+  // 完了状態の伝播で変わった件数（propagate 指定時のみ）
+  propagated_count?: number
+}
+
+// 全文検索（GET /api/tasks/search）の1件。本文はサーバー側でHTMLエスケープ済みで、強調箇所は <mark> で囲まれる
+export interface TaskSearchResult extends Task {
+  score: number | null
+  nameHighlight: string
+  notesSnippet: string | null
+}
+
+// 差分同期（GET /api/changes）の結果
+export interface ChangeSet {
+  since: number
+  nextSince: number
+  latestSeq: number
+  hasMore: boolean
+  reset: boolean
+  projects: Project[]
+  tasks: Task[]
+  deleted: {
+    projects: string[]
+    tasks: string[]
+  }
+}
+
+// 変更通知（GET /api/events の changes イベント）の1件
+export interface ChangeNotice {
+  seq: number
+  entity: 'project' | 'task'
+  id: string
+  op: 'upsert' | 'delete'
+  project_id: string | null
+  previous_project_id?: string
+}
+
+export interface ChangeEventHandlers {
+  onChanges: (seq: number, changes: ChangeNotice[]) => void
+  // 取りこぼしがある場合：getChanges(since) で再取得する
+  onResync: (since: number) => void
 }
 
 export interface TaskApiActions {